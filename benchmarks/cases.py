@@ -0,0 +1,190 @@
+"""The validation hot paths measured by the benchmark runner.
+
+Every case is a function which prepares its payload and rules and returns the
+call to time, so setup is never part of the measurement.
+"""
+
+import os
+import struct
+import tempfile
+import zlib
+
+from src.masonite.validation import (
+    MessageBag,
+    Validator,
+    each,
+    email,
+    file,
+    image,
+    is_in,
+    isnt,
+    numeric,
+    postal_code,
+    required,
+    string,
+    strong,
+)
+
+CASES = []
+
+# files written by the file rule cases, removed by cleanup()
+_files = []
+
+
+def case(function):
+    CASES.append((function.__name__, function))
+    return function
+
+
+def user(index=0):
+    return {
+        "name": "Joe {}".format(index),
+        "email": "joe{}@masonite.com".format(index),
+        "age": str(20 + index % 50),
+        "role": "member",
+    }
+
+
+@case
+def validate_small_payload():
+    payload = user()
+    rules = (
+        required(["name", "email", "age"]),
+        email(["email"]),
+        numeric(["age"]),
+    )
+    return lambda: Validator().validate(payload, *rules)
+
+
+@case
+def validate_medium_payload():
+    address = {"street": "Main", "city": "Paris", "zip": "75001"}
+    payload = {
+        "user": dict(user(), address=address),
+        "fields": {"field_{}".format(index): "value" for index in range(20)},
+    }
+    rules = (
+        required(["user.name", "user.email", "user.address.city"]),
+        email(["user.email"]),
+        numeric(["user.age"]),
+        string(["fields.field_{}".format(index) for index in range(20)]),
+        isnt(is_in(["user.role"], ["admin", "owner"])),
+    )
+    return lambda: Validator().validate(payload, *rules)
+
+
+@case
+def validate_large_payload():
+    payload = {"field_{}".format(index): str(index) for index in range(200)}
+    keys = list(payload)
+    rules = (required(keys), numeric(keys), string(keys))
+    return lambda: Validator().validate(payload, *rules)
+
+
+@case
+def syntax_object_rules():
+    payload = user()
+    rules = (required(["name", "email", "age"]), numeric(["age"]))
+    return lambda: Validator().validate(payload, *rules)
+
+
+@case
+def syntax_string_rules():
+    payload = user()
+    return lambda: Validator().validate(
+        payload, "required:name,email,age", "numeric:age"
+    )
+
+
+@case
+def syntax_dict_rules():
+    payload = user()
+    rules = {"name": "required", "email": "required", "age": "required|numeric"}
+    return lambda: Validator().validate(payload, rules)
+
+
+@case
+def wildcard_whole_list():
+    payload = {"users": [user(index) for index in range(500)]}
+    rules = (required(["users.*.email"]), string(["users.*.name"]))
+    return lambda: Validator().validate(payload, *rules)
+
+
+@case
+def wildcard_each_element():
+    payload = {"users": [user(index) for index in range(500)]}
+    rules = (each(required(["users.*.email"]), string(["users.*.name"])),)
+    return lambda: Validator().validate(payload, *rules)
+
+
+@case
+def postal_code_many_locales():
+    payload = {"zip": "not a postal code"}
+    rules = (postal_code(["zip"], "US,GB,FR,DE,ES,IT,NL,BE,SE,PL,CA,AU,JP,BR"),)
+    return lambda: Validator().validate(payload, *rules)
+
+
+@case
+def strong_password():
+    payload = {"password": "Secret!!Pass12"}
+    rules = (strong(["password"]),)
+    return lambda: Validator().validate(payload, *rules)
+
+
+@case
+def file_size_and_mimes():
+    payload = {"document": _file(".pdf", b"%PDF-1.7\n" + b"x" * 1024 * 1024)}
+    rules = (file(["document"], size="2MB", mimes=["pdf", "txt"], sniff=True),)
+    return lambda: Validator().validate(payload, *rules)
+
+
+@case
+def file_digest():
+    payload = {"document": _file(".bin", os.urandom(1024 * 1024))}
+    rules = (file(["document"], digest="0" * 64, forbidden=[b"<script"]),)
+    return lambda: Validator().validate(payload, *rules)
+
+
+@case
+def image_dimensions():
+    payload = {"photo": _file(".png", _png(640, 480))}
+    rules = (image(["photo"], min_width=100, max_width=1000, ratio=4 / 3),)
+    return lambda: Validator().validate(payload, *rules)
+
+
+@case
+def messagebag_serialization():
+    errors = {
+        "field_{}".format(index): ["The field_{} must be a numeric.".format(index)]
+        for index in range(200)
+    }
+    return lambda: (MessageBag(errors).json(), MessageBag(errors).messages())
+
+
+def _file(suffix, content):
+    handle, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(handle, "wb") as f:
+        f.write(content)
+    _files.append(path)
+    return path
+
+
+def _png(width, height):
+    def chunk(kind, data):
+        checksum = zlib.crc32(kind + data) & 0xFFFFFFFF
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", checksum)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    # every row starts with its filter type
+    pixels = zlib.compress((b"\x00" + b"\x00" * width * 3) * height)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", pixels)
+        + chunk(b"IEND", b"")
+    )
+
+
+def cleanup():
+    while _files:
+        os.remove(_files.pop())
@@ -0,0 +1,201 @@
+"""Times the validation hot paths and compares them with a stored baseline.
+
+    python -m benchmarks.run               print the timings
+    python -m benchmarks.run --save        store them as the new baseline
+    python -m benchmarks.run --compare     exit with 1 when a case regressed
+
+Each case is calibrated so one sample runs for at least --min-time seconds,
+then warmed up and sampled --samples times with the garbage collector off.
+The median time per call is compared with the baseline, which is only
+meaningful on the machine the baseline was saved on, so save one from the
+main branch before measuring a change.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# how much slower than the baseline a case may get before it counts as a regression
+THRESHOLD = 0.2
+
+
+def measure(function, samples=7, min_time=0.05):
+    """Times a function the way pyperf does, calibrating loops then sampling.
+
+    Arguments:
+        function {callable} -- The call to time
+
+    Keyword Arguments:
+        samples {int} -- How many timings to take (default: {7})
+        min_time {float} -- The shortest time a sample may take in seconds (default: {0.05})
+
+    Returns:
+        dict -- The median, min and stdev of the seconds per call and the loops per sample
+    """
+    timer = timeit.Timer(function)
+    loops = 1
+    while timer.timeit(loops) < min_time:
+        loops *= 2
+
+    # the first sample warms caches and is thrown away
+    timer.timeit(loops)
+    times = [timer.timeit(loops) / loops for _ in range(samples)]
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "loops": loops,
+    }
+
+
+def run(cases, samples=7, min_time=0.05, output=sys.stdout):
+    """Measures every case.
+
+    Arguments:
+        cases {list} -- (name, setup function) tuples
+
+    Returns:
+        dict -- The measurements by case name
+    """
+    results = {}
+    for name, setup in cases:
+        results[name] = measure(setup(), samples=samples, min_time=min_time)
+        output.write(
+            "{:<28} {:>12} +- {}\n".format(
+                name,
+                format_time(results[name]["median"]),
+                format_time(results[name]["stdev"]),
+            )
+        )
+
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """Compares measurements with a baseline.
+
+    Arguments:
+        results {dict} -- Measurements by case name
+        baseline {dict} -- Baseline measurements by case name
+
+    Keyword Arguments:
+        threshold {float} -- The allowed slow down, 0.2 allows cases to be 20% slower (default: {0.2})
+
+    Returns:
+        list -- (name, baseline median, median, ratio, regressed) tuples, None for cases without a baseline
+    """
+    rows = []
+    for name in sorted(results):
+        median = results[name]["median"]
+        if name not in baseline:
+            rows.append((name, None, median, None, False))
+            continue
+
+        before = baseline[name]["median"]
+        ratio = median / before
+        rows.append((name, before, median, ratio, ratio > 1 + threshold))
+
+    return rows
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return "{:.2f} {}".format(seconds / scale, unit)
+
+    return "{:.0f} ns".format(seconds / 1e-9)
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(path, results):
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "platform": platform.platform(),
+                "cases": results,
+            },
+            f,
+            indent=4,
+            sort_keys=True,
+        )
+        f.write("\n")
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Validation benchmarks")
+    parser.add_argument("--save", action="store_true", help="store a new baseline")
+    parser.add_argument(
+        "--compare", action="store_true", help="fail on regressions against a baseline"
+    )
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--samples", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("-k", dest="filter", help="only run cases containing this text")
+    options = parser.parse_args(arguments)
+
+    from . import cases
+
+    selected = [
+        (name, setup)
+        for name, setup in cases.CASES
+        if not options.filter or options.filter in name
+    ]
+    try:
+        results = run(selected, samples=options.samples, min_time=options.min_time)
+    finally:
+        cases.cleanup()
+
+    if options.save:
+        save(options.baseline, results)
+        print("Saved the baseline to {}".format(options.baseline))
+
+    if not options.compare:
+        return 0
+
+    baseline = load(options.baseline)
+    regressions = 0
+    print("")
+    for name, before, median, ratio, regressed in compare(
+        results, baseline["cases"], options.threshold
+    ):
+        if before is None:
+            print("{:<28} {:>12} (no baseline)".format(name, format_time(median)))
+            continue
+
+        regressions += regressed
+        print(
+            "{:<28} {:>12} -> {:>12} {:>+7.1%}{}".format(
+                name,
+                format_time(before),
+                format_time(median),
+                ratio - 1,
+                "  REGRESSION" if regressed else "",
+            )
+        )
+
+    if regressions:
+        print(
+            "\n{} case(s) are more than {:.0%} slower than the baseline.".format(
+                regressions, options.threshold
+            )
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
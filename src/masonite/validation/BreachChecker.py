@@ -0,0 +1,147 @@
+"""The Breach Checker Module"""
+
+import time
+
+from .TTLCache import TTLCache
+
+RANGE_API_URL = "https://api.pwnedpasswords.com/range/"
+
+
+def sha1(password):
+    import hashlib
+
+    return hashlib.sha1(password.encode("utf-8")).hexdigest().upper()
+
+
+def fetch_range(prefix, timeout=10):
+    """Fetches the hash suffixes sharing a 5 character SHA-1 prefix from the Pwned Passwords API"""
+    import requests
+
+    response = requests.get(RANGE_API_URL + prefix, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+class RangeBreachChecker:
+    """Checks passwords against the Pwned Passwords range API and caches the ranges.
+
+    Only the first 5 characters of the SHA-1 hash leave the process. Every
+    password sharing a cached prefix is then checked without a network call.
+    """
+
+    io_bound = True
+
+    def __init__(
+        self, fetch=fetch_range, ttl=86400, maxsize=4096, timer=time.monotonic
+    ):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.cache = TTLCache(maxsize=maxsize, timer=timer)
+
+    def __call__(self, password):
+        """Checks if a password has been breached.
+
+        Arguments:
+            password {string} -- The plain text password
+
+        Returns:
+            bool
+        """
+        digest = sha1(password)
+        return self.range(digest[:5]).get(digest[5:], 0) > 0
+
+    def range(self, prefix):
+        """Gets the breach count of every hash suffix under a prefix.
+
+        Arguments:
+            prefix {string} -- The first 5 characters of an uppercase SHA-1 hash
+
+        Returns:
+            dict -- Dictionary of hash suffix to the number of times it was breached
+        """
+        suffixes = self.cache.get(prefix)
+        if suffixes is None:
+            suffixes = {}
+            for line in self.fetch(prefix).splitlines():
+                suffix, _, count = line.strip().partition(":")
+                if suffix:
+                    suffixes[suffix.upper()] = int(count or 1)
+
+            self.cache.set(prefix, suffixes, self.ttl)
+
+        return suffixes
+
+    def cache_info(self):
+        """Gets the hits, misses and size of the range cache"""
+        return self.cache.cache_info()
+
+
+class HashFileBreachChecker:
+    """Checks passwords offline against a sorted file of SHA-1 hashes.
+
+    The file has one uppercase hash per line, optionally followed by :count
+    like the downloadable Pwned Passwords list ordered by hash. It is memory
+    mapped and binary searched so lookups do not read the whole file.
+    """
+
+    io_bound = False
+
+    def __init__(self, path):
+        self.path = path
+        self._map = None
+
+    def __call__(self, password):
+        """Checks if a password has been breached.
+
+        Arguments:
+            password {string} -- The plain text password
+
+        Returns:
+            bool
+        """
+        return self.contains(sha1(password))
+
+    def contains(self, digest):
+        """Checks if a SHA-1 hex digest is in the file"""
+        data = self._open()
+        target = digest.upper().encode("ascii")
+        low, high = 0, len(data)
+        while low < high:
+            # look at the whole line around the middle byte
+            middle = (low + high) // 2
+            start = data.rfind(b"\n", 0, middle) + 1
+            end = data.find(b"\n", middle)
+            if end == -1:
+                end = len(data)
+
+            found = data[start:end].split(b":", 1)[0].strip()
+            if found == target:
+                return True
+            if found < target:
+                low = end + 1
+            else:
+                high = start
+
+        return False
+
+    def close(self):
+        if self._map:
+            self._map.close()
+        self._map = None
+
+    def _open(self):
+        if self._map is None:
+            import mmap
+
+            with open(self.path, "rb") as f:
+                try:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # empty files can not be mapped
+                    self._map = b""
+
+        return self._map
+
+    def __getstate__(self):
+        # maps can not be pickled, each process opens the file itself
+        return {"path": self.path, "_map": None}
@@ -0,0 +1,309 @@
+"""The Columnar Engine Module"""
+
+import operator
+
+from .KeyPath import handle_rule
+from .RuleResult import RuleResult
+from .Validator import (
+    equals,
+    greater_than,
+    in_range,
+    is_in,
+    length,
+    less_than,
+    numeric,
+    truthy,
+)
+
+# floats and integers past this can not be compared exactly once numpy mixes them
+EXACT = 2 ** 53
+
+
+class ColumnarEngine:
+    """Validates a batch of records column by column with NumPy.
+
+    The numeric, in_range, greater_than, less_than, length, equals, is_in and
+    truthy rules run as array operations over each column. Values an array
+    operation can not decide exactly like mixed types or numbers Python would
+    format differently fall back to the rule's own passes() so the report is
+    the same as CompiledSchema.validate_many(). Every other rule runs row by row.
+    """
+
+    def __init__(self, schema):
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "Columnar validation requires the 'numpy' library. Please install it with 'pip install numpy'"
+            )
+
+        self.numpy = numpy
+        self.schema = schema
+
+    def masks(self, records):
+        """Gets the failure mask of every column an array operation can validate.
+
+        Arguments:
+            records {list} -- The dictionaries to validate
+
+        Returns:
+            list -- List of (rule, key, mask) tuples where mask[row] is True when the row fails
+        """
+        records = records if isinstance(records, list) else list(records)
+        columns = {}
+        masks = []
+        with self.numpy.errstate(invalid="ignore"):
+            for rule in self.schema.rules:
+                kernel = KERNELS.get(type(rule))
+                if kernel is None:
+                    continue
+
+                for key in rule.validations:
+                    masks.append(
+                        (rule, key, self._mask(rule, kernel, key, records, columns))
+                    )
+
+        return masks
+
+    def validate_many(self, records, failures_only=False):
+        """Validates a list of dictionaries, see CompiledSchema.validate_many()"""
+        records = records if isinstance(records, list) else list(records)
+        schema = self.schema
+        if (
+            schema.bail
+            or schema.stop_on_first_failure
+            or any(rule.raises for rule in schema.rules)
+        ):
+            # raising and fail fast rules depend on the rules before them in a row
+            return self.schema.validate_many(records, failures_only=failures_only)
+
+        errors = {}
+        columns = {}
+        try:
+            with self.numpy.errstate(invalid="ignore"):
+                for rule in self.schema.rules:
+                    kernel = KERNELS.get(type(rule))
+                    if kernel is None:
+                        for row, record in enumerate(records):
+                            rule_errors = handle_rule(rule, record, None).errors
+                            if rule_errors:
+                                self._merge(errors, row, rule_errors)
+                        continue
+
+                    for key in rule.validations:
+                        mask = self._mask(rule, kernel, key, records, columns)
+                        rows = self.numpy.flatnonzero(mask).tolist()
+                        if not rows:
+                            continue
+
+                        rule_errors = self._errors(rule, key)
+                        for row in rows:
+                            self._merge(errors, row, rule_errors)
+        except Exception:
+            # reproduce the exception, row and partial errors of the row by row path
+            return self.schema.validate_many(records, failures_only=failures_only)
+
+        if failures_only:
+            return {row: errors[row] for row in sorted(errors)}
+
+        return {row: errors.get(row, {}) for row in range(len(records))}
+
+    def _mask(self, rule, kernel, key, records, columns):
+        if key not in columns:
+            if key and "." not in key:
+                values = [record.get(key, False) for record in records]
+            else:
+                values = [rule.find(key, record) for record in records]
+            columns[key] = (values, self._array(values))
+
+        values, column = columns[key]
+        decided = kernel(self.numpy, rule, column) if column is not None else None
+        if decided is None:
+            passed = self.numpy.zeros(len(values), dtype=bool)
+            undecided = self.numpy.ones(len(values), dtype=bool)
+        else:
+            passed, undecided = decided
+            passed = self.numpy.array(passed, dtype=bool)
+
+        if undecided is not None:
+            for row in self.numpy.flatnonzero(undecided).tolist():
+                passed[row] = bool(rule.passes(values[row], key, records[row]))
+
+        return passed if rule.negated else ~passed
+
+    def _array(self, values):
+        numpy = self.numpy
+        kinds = set(map(type, values))
+        try:
+            if kinds == {int}:
+                return numpy.fromiter(values, dtype=numpy.int64, count=len(values))
+            if kinds == {float}:
+                return numpy.fromiter(values, dtype=numpy.float64, count=len(values))
+        except OverflowError:
+            return None
+
+        # numpy strips trailing null characters from strings
+        if kinds == {str} and not any(value.endswith("\x00") for value in values):
+            return numpy.array(values, dtype=str)
+
+        return None
+
+    def _errors(self, rule, key):
+        result = RuleResult()
+        if rule.negated:
+            rule.error(result, key, rule.negated_message_for(key, True))
+        else:
+            rule.error(result, key, rule.message_for(key, False))
+
+        return result.errors
+
+    def _merge(self, errors, row, rule_errors):
+        row_errors = errors.setdefault(row, {})
+        for error, message in rule_errors.items():
+            if error not in row_errors:
+                row_errors.update({error: list(message)})
+            else:
+                row_errors[error] += message
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and abs(value) <= EXACT
+
+
+def fixed_notation(numpy, column):
+    """Whether Python would format floats without an exponent, like 0.5 and not 5e-05"""
+    magnitude = numpy.abs(column)
+    return numpy.isfinite(column) & (
+        (column == 0) | ((magnitude >= 1e-4) & (magnitude < 1e16))
+    )
+
+
+def inexact(numpy, column):
+    if column.dtype.kind == "i":
+        return numpy.abs(column) > EXACT
+
+    return None
+
+
+def numeric_kernel(numpy, rule, column):
+    kind = column.dtype.kind
+    if kind == "i":
+        return column >= 0, None
+    if kind == "f":
+        return ~numpy.signbit(column) & fixed_notation(numpy, column), None
+    if kind == "U":
+        return numpy.char.isdigit(numpy.char.replace(column, ".", "", 1)), None
+
+    return None
+
+
+def in_range_kernel(numpy, rule, column):
+    if not is_number(rule.min) or not is_number(rule.max):
+        return None
+
+    kind = column.dtype.kind
+    if kind == "i":
+        decided = (column >= 0) & (column <= EXACT)
+    elif kind == "f":
+        decided = fixed_notation(numpy, column)
+    else:
+        return None
+
+    return (column >= rule.min) & (column <= rule.max), ~decided
+
+
+def compare_kernel(compare):
+    def kernel(numpy, rule, column):
+        kind = column.dtype.kind
+        if kind in "if" and is_number(rule.value):
+            return compare(column, rule.value), inexact(numpy, column)
+        if kind == "U" and isinstance(rule.value, str):
+            return compare(column, rule.value), None
+
+        return None
+
+    return kernel
+
+
+def equals_kernel(numpy, rule, column):
+    kind = column.dtype.kind
+    if kind in "if" and isinstance(rule.value, str):
+        return numpy.zeros(len(column), dtype=bool), None
+    if kind == "U" and is_number(rule.value):
+        return numpy.zeros(len(column), dtype=bool), None
+
+    return compare_kernel(operator.eq)(numpy, rule, column)
+
+
+def is_in_kernel(numpy, rule, column):
+    kind = column.dtype.kind
+    if isinstance(rule.value, str):
+        if kind == "U":
+            # the value is searched for inside the rule's string
+            return numpy.char.find(rule.value, column) >= 0, None
+        return None
+
+    if not isinstance(rule.value, (list, tuple, set, frozenset)):
+        return None
+
+    if kind in "if":
+        options = [option for option in rule.value if is_number(option)]
+        others = [option for option in rule.value if not is_number(option)]
+        if any(not isinstance(option, str) for option in others):
+            return None
+        if not options:
+            return numpy.zeros(len(column), dtype=bool), None
+        return numpy.isin(column, numpy.array(options)), inexact(numpy, column)
+
+    if kind == "U":
+        options = [option for option in rule.value if isinstance(option, str)]
+        others = [option for option in rule.value if not isinstance(option, str)]
+        if any(not is_number(option) for option in others) or any(
+            option.endswith("\x00") for option in options
+        ):
+            return None
+        if not options:
+            return numpy.zeros(len(column), dtype=bool), None
+        return numpy.isin(column, numpy.array(options, dtype=str)), None
+
+    return None
+
+
+def length_kernel(numpy, rule, column):
+    if not isinstance(rule.min, int) or (rule.max and not isinstance(rule.max, int)):
+        return None
+
+    kind = column.dtype.kind
+    if kind == "U":
+        lengths = numpy.char.str_len(column)
+    elif kind == "i":
+        lengths = numpy.char.str_len(column.astype(str))
+    else:
+        return None
+
+    if rule.max:
+        return (lengths >= rule.min) & (lengths <= rule.max), None
+
+    return lengths >= rule.min, None
+
+
+def truthy_kernel(numpy, rule, column):
+    kind = column.dtype.kind
+    if kind in "if":
+        return column != 0, None
+    if kind == "U":
+        return numpy.char.str_len(column) > 0, None
+
+    return None
+
+
+KERNELS = {
+    equals: equals_kernel,
+    greater_than: compare_kernel(operator.gt),
+    in_range: in_range_kernel,
+    is_in: is_in_kernel,
+    length: length_kernel,
+    less_than: compare_kernel(operator.lt),
+    numeric: numeric_kernel,
+    truthy: truthy_kernel,
+}
@@ -0,0 +1,507 @@
+"""The Compiled Schema Module"""
+
+from .DependencyGraph import DependencyGraph, overlaps
+from .KeyPath import PathLookup, handle_rule
+from .MessageBag import MessageBag
+from .RuleResult import RuleResult
+
+
+class CompiledSchema:
+    """A set of rules planned once by Validator.compile() which can be reused to
+    validate any number of dictionaries.
+
+    String, dictionary and rule enclosure definitions are already resolved to
+    rule objects so validating only does the per dictionary work.
+
+    With bail, a field which failed a rule is not checked by the rules after
+    it, either for every field or only the given ones. With
+    stop_on_first_failure validation ends at the first failure.
+
+    With reorder, failing fast also runs the rules of each field cheapest first
+    by their cost hint, so expensive ones like date parsing or domain lookups
+    only check values which already passed the cheap ones. Only rules checking
+    the same single field trade places, and with stop_on_first_failure only
+    when they are given one after the other, so fields still fail in the order
+    they were given. Messages keep the order of the rules but a field may
+    report the failure of a cheaper rule than without reorder.
+
+    The fields every rule checks and reads form a dependency graph which tells
+    the fields to validate again after some change, and lets a part of a form
+    be validated by running only the rules for its fields.
+    """
+
+    # how many partial plans are kept before they are planned again
+    partial_cache_size = 64
+
+    def __init__(
+        self,
+        rules,
+        instrumentation=None,
+        bail=False,
+        stop_on_first_failure=False,
+        reorder=False,
+        skip=(),
+    ):
+        self._rules = tuple(rules)
+        self.instrumentation = instrumentation
+        if isinstance(bail, str):
+            bail = [bail]
+        self.bail = bail if isinstance(bail, bool) else frozenset(bail)
+        self.stop_on_first_failure = stop_on_first_failure
+        self.reorder = reorder
+        # keys left unchecked, used by the plans of partial validations
+        self._skip = frozenset(skip)
+        self._graph = None
+        self._partials = {}
+        self._order = None
+        if reorder and (self.bail or stop_on_first_failure):
+            order = self._cheapest_first()
+            if order != list(range(len(self._rules))):
+                self._order = tuple(order)
+
+    @property
+    def rules(self):
+        """Gets the resolved rules in the order they were given"""
+        return self._rules
+
+    @property
+    def order(self):
+        """Gets the rules in the order they run"""
+        if self._order is None:
+            return self._rules
+
+        return tuple(self._rules[index] for index in self._order)
+
+    @property
+    def graph(self):
+        """Gets the DependencyGraph of the fields the rules check and read"""
+        if self._graph is None:
+            self._graph = DependencyGraph(self._rules)
+
+        return self._graph
+
+    def dependencies(self, field=None):
+        """Gets the fields the rules depend on.
+
+        Keyword Arguments:
+            field {string} -- Only get the other fields deciding this field's messages (default: {None})
+
+        Returns:
+            list -- The fields in the order the rules first use them
+        """
+        if field is None:
+            return self.graph.fields()
+
+        return self.graph.dependencies(field)
+
+    def affected(self, changed):
+        """Gets the fields to validate again after some fields changed.
+
+        With stop_on_first_failure any change can move the first failure, so
+        every checked field is affected.
+
+        Arguments:
+            changed {string|list} -- The fields which changed
+
+        Returns:
+            list -- The fields, ready to be given to validate() as fields
+        """
+        if self.stop_on_first_failure:
+            return list(self.graph.edges)
+
+        return self.graph.affected(changed)
+
+    def validate(self, dictionary, fields=None):
+        """Validates a dictionary against the compiled rules.
+
+        Arguments:
+            dictionary {dict} -- The dictionary to validate
+
+        Keyword Arguments:
+            fields {list} -- Only validate these fields, with the rules they depend on reading the rest (default: {None})
+
+        Returns:
+            MessageBag -- The errors found in the dictionary
+        """
+        return MessageBag(self.errors(dictionary, fields=fields))
+
+    def errors(self, dictionary, fields=None):
+        """Gets the errors found in a dictionary as a plain dictionary.
+
+        Arguments:
+            dictionary {dict} -- The dictionary to validate
+
+        Keyword Arguments:
+            fields {list} -- Only validate these fields (default: {None})
+
+        Returns:
+            dict -- Returns a dictionary of errors and messages
+        """
+        if fields is not None:
+            schema, fields = self._partial(fields)
+            try:
+                return _only(schema.errors(dictionary), fields)
+            except Exception as e:
+                e.errors = _only(e.errors, fields)
+                raise e
+
+        # every key is resolved once however many rules check it
+        lookup = PathLookup(
+            dictionary, stop=self.stop_on_first_failure, skip=self._skip
+        )
+        handle = self._handler()
+        if self._order is not None:
+            return self._reordered_errors(dictionary, lookup, handle)
+
+        rule_errors = {}
+        try:
+            for rule in self._rules:
+                outcome = handle(rule, dictionary, lookup)
+                self._merge(rule_errors, outcome.errors, lookup.skip)
+                if rule_errors and self.stop_on_first_failure:
+                    break
+        except Exception as e:
+            e.errors = rule_errors
+            raise e
+
+        return rule_errors
+
+    def _reordered_errors(self, dictionary, lookup, handle):
+        # rules run by cost but their messages are collected in the given order
+        outcomes = {}
+        try:
+            for index in self._order:
+                outcome = handle(self._rules[index], dictionary, lookup)
+                outcomes[index] = self._merge({}, outcome.errors, lookup.skip)
+                if outcomes[index] and self.stop_on_first_failure:
+                    break
+        except Exception as e:
+            e.errors = self._collect(outcomes)
+            raise e
+
+        return self._collect(outcomes)
+
+    async def avalidate(self, dictionary, timeout=None, fields=None):
+        """Validates a dictionary, running the I/O bound rules concurrently.
+
+        Rules with io_bound set are started together on the event loop's
+        executor while the other rules run synchronously, so several network
+        lookups only cost the slowest one. Rules checking their keys one by
+        one with BaseValidation.handle() start a job for each key. Messages
+        keep the order of the rules.
+
+        When failing fast the I/O bound rules only start once the other rules
+        are done, so fields which already failed are not looked up and with
+        stop_on_first_failure they do not run at all after a failure.
+
+        Arguments:
+            dictionary {dict} -- The dictionary to validate
+
+        Keyword Arguments:
+            timeout {float} -- Seconds each I/O bound rule or key may take (default: {None})
+            fields {list} -- Only validate these fields (default: {None})
+
+        Raises:
+            asyncio.TimeoutError: When an I/O bound rule takes longer than the timeout
+
+        Returns:
+            MessageBag -- The errors found in the dictionary
+        """
+        if fields is not None:
+            schema, fields = self._partial(fields)
+            try:
+                errors = await schema.avalidate(dictionary, timeout=timeout)
+            except Exception as e:
+                e.errors = _only(getattr(e, "errors", {}), fields)
+                raise e
+
+            return MessageBag(_only(errors.all(), fields))
+
+        import asyncio
+        import copy
+
+        from .Validator import BaseValidation
+
+        loop = asyncio.get_event_loop()
+        handle = self._handler()
+        lookup = PathLookup(
+            dictionary, stop=self.stop_on_first_failure, skip=self._skip
+        )
+        eager = not (self.bail or self.stop_on_first_failure)
+        pending = {}
+
+        def start(rules, lookup=None):
+            for index, rule in rules:
+                job = lookup
+                if job is None:
+                    # rules started before the others finish resolve keys in
+                    # their own thread but still leave out the skipped ones
+                    job = PathLookup(dictionary, skip=self._skip)
+                parts = [rule]
+                if type(rule).handle is BaseValidation.handle:
+                    # each key is looked up in its own thread
+                    parts = []
+                    for key in job.pending(rule.validations):
+                        part = copy.copy(rule)
+                        part.validations = [key]
+                        parts.append(part)
+                # jobs are submitted right away so they run while the
+                # synchronous rules do
+                keys = [
+                    asyncio.ensure_future(
+                        asyncio.wait_for(
+                            loop.run_in_executor(None, handle, part, dictionary, job),
+                            timeout,
+                        )
+                    )
+                    for part in parts
+                ]
+                pending[index] = asyncio.ensure_future(self._gather(keys, job.stop))
+
+        io_bound = [(i, rule) for i, rule in enumerate(self._rules) if rule.io_bound]
+        if eager:
+            start(io_bound)
+
+        # when failing fast, messages for fields which already failed are left
+        # out as the rules run, in order of cost
+        outcomes = {}
+        failed = False
+        for index in self._order or range(len(self._rules)):
+            rule = self._rules[index]
+            if rule.io_bound:
+                continue
+
+            try:
+                outcome = handle(rule, dictionary, lookup)
+            except Exception as e:
+                # later rules could never be reported so stop like errors() does
+                outcomes[index] = e
+                break
+
+            outcomes[index] = outcome.errors
+            if not eager:
+                outcomes[index] = self._merge({}, outcome.errors, lookup.skip)
+                failed = failed or bool(outcomes[index])
+                if failed and self.stop_on_first_failure:
+                    break
+
+        if not eager and not (failed and self.stop_on_first_failure):
+            start(io_bound, lookup)
+
+        rule_errors = {}
+        try:
+            for index in range(len(self._rules)):
+                if index in pending:
+                    errors = (await pending.pop(index)).errors
+                    if not eager:
+                        errors = self._merge({}, errors, lookup.skip)
+                elif index in outcomes:
+                    errors = outcomes[index]
+                    if isinstance(errors, Exception):
+                        raise errors
+                else:
+                    continue
+
+                self._extend(rule_errors, errors)
+                if rule_errors and self.stop_on_first_failure:
+                    break
+        except Exception as e:
+            self._cancel(pending)
+            e.errors = rule_errors
+            raise e
+
+        self._cancel(pending)
+        return MessageBag(rule_errors)
+
+    def validate_many(
+        self,
+        records,
+        failures_only=False,
+        columnar=False,
+        parallel=False,
+        workers=None,
+        chunk_size=1000,
+    ):
+        """Validates a list of dictionaries in one call.
+
+        Arguments:
+            records {iterable} -- The dictionaries to validate
+
+        Keyword Arguments:
+            failures_only {bool} -- Only report the rows which have errors (default: {False})
+            columnar {bool} -- Validate supported rules column by column with NumPy (default: {False})
+            parallel {bool} -- Shard the records across worker processes (default: {False})
+            workers {int} -- The number of worker processes, defaults to the CPU count (default: {None})
+            chunk_size {int} -- The number of records sent to a worker at a time (default: {1000})
+
+        Returns:
+            dict -- Returns a dictionary of row number to that row's errors
+        """
+        if parallel:
+            from .ParallelEngine import ParallelEngine
+
+            return ParallelEngine(
+                self, workers=workers, chunk_size=chunk_size
+            ).validate_many(records, failures_only=failures_only, columnar=columnar)
+
+        if columnar:
+            from .ColumnarEngine import ColumnarEngine
+
+            return ColumnarEngine(self).validate_many(
+                records, failures_only=failures_only
+            )
+
+        report = {}
+        for row, row_errors in self._rows(records):
+            if row_errors or not failures_only:
+                report[row] = row_errors
+
+        return report
+
+    def iter_validate(self, records):
+        """Lazily validates an iterable of dictionaries one row at a time.
+
+        Only the current row is held in memory so records can come straight
+        from a file reader or any other generator.
+
+        Arguments:
+            records {iterable} -- The dictionaries to validate
+
+        Returns:
+            generator -- Yields (row, MessageBag) tuples for the rows which have errors
+        """
+        for row, row_errors in self._rows(records):
+            if row_errors:
+                yield row, MessageBag(row_errors)
+
+    def _rows(self, records):
+        errors = self.errors
+        for row, record in enumerate(records):
+            try:
+                row_errors = errors(record)
+            except Exception as e:
+                e.row = row
+                raise e
+
+            yield row, row_errors
+
+    def _merge(self, rule_errors, errors, bailed):
+        # with bail, messages for fields which already failed are left out
+        for error, message in errors.items():
+            if error in bailed:
+                continue
+
+            if error not in rule_errors:
+                rule_errors.update({error: list(message)})
+            else:
+                rule_errors[error] += message
+
+        if self.bail:
+            bailed.update(
+                error for error in errors if self.bail is True or error in self.bail
+            )
+
+        return rule_errors
+
+    def _collect(self, outcomes):
+        rule_errors = {}
+        for index in sorted(outcomes):
+            self._extend(rule_errors, outcomes[index])
+
+        return rule_errors
+
+    def _extend(self, rule_errors, errors):
+        for error, messages in errors.items():
+            rule_errors.setdefault(error, []).extend(messages)
+
+    def _cheapest_first(self):
+        # rules of a field sharing no other field are gathered into runs which
+        # are sorted by cost into the positions the run took, other rules of
+        # the field end the run, and any other rule does too when stopping
+        order = list(range(len(self._rules)))
+        runs = {}
+
+        def close(field):
+            run = runs.pop(field)
+            # a stable sort so rules of the same cost keep their order
+            for position, index in zip(run, sorted(run, key=self._cost)):
+                order[position] = index
+
+        stop = self.stop_on_first_failure
+        for index, rule in enumerate(self._rules):
+            fields = set(rule.checked_fields())
+            for field in list(runs):
+                if fields != {field} and (stop or field in fields):
+                    close(field)
+
+            if len(fields) == 1:
+                runs.setdefault(fields.pop(), []).append(index)
+
+        for field in list(runs):
+            close(field)
+
+        return order
+
+    def _cost(self, index):
+        return self._rules[index].cost
+
+    def _partial(self, fields):
+        fields = (fields,) if isinstance(fields, str) else tuple(fields)
+        schema = self._partials.get(fields)
+        if schema is None:
+            # only the rules reporting the fields run, their other keys are skipped
+            rules = [self._rules[index] for index in self.graph.rules_for(fields)]
+            schema = CompiledSchema(
+                rules,
+                instrumentation=self.instrumentation,
+                bail=self.bail,
+                stop_on_first_failure=self.stop_on_first_failure,
+                reorder=self.reorder,
+                skip=[
+                    key
+                    for rule in rules
+                    for key in rule.checked_fields()
+                    if not any(overlaps(key, field) for field in fields)
+                ],
+            )
+            if len(self._partials) >= self.partial_cache_size:
+                self._partials.clear()
+            self._partials[fields] = schema
+
+        return schema, fields
+
+    async def _gather(self, keys, stop):
+        # the results of a rule's keys in the order the rule checks them
+        result = RuleResult()
+        try:
+            for key in keys:
+                self._extend(result.errors, (await key).errors)
+                if stop and result.errors:
+                    break
+        finally:
+            self._cancel(dict(enumerate(keys)))
+
+        return result
+
+    def _cancel(self, pending):
+        for future in pending.values():
+            # retrieve failures that already finished so asyncio does not log them
+            if not future.cancel() and not future.cancelled():
+                future.exception()
+
+    def _handler(self):
+        if self.instrumentation is None:
+            return handle_rule
+
+        return self.instrumentation.handle
+
+    def __len__(self):
+        return len(self._rules)
+
+
+def _only(errors, fields):
+    return {
+        key: messages
+        for key, messages in errors.items()
+        if any(overlaps(key, field) for field in fields)
+    }
@@ -0,0 +1,122 @@
+"""The Dependency Graph Module"""
+
+from collections import OrderedDict
+
+from .KeyPath import compile_path
+
+
+class DependencyGraph:
+    """The fields a set of rules checks and the other fields each of them reads.
+
+    Cross-field rules like matches, required_if or the conditions of when()
+    link the fields they report errors for to the fields they read, so the
+    graph tells which fields decide a field's messages and which fields need
+    validating again after others change. It can have cycles, a password may
+    match its confirmation and the other way around.
+
+    Arguments:
+        rules {list} -- The rules of a schema
+    """
+
+    def __init__(self, rules):
+        # the fields each rule reports errors for, by rule index
+        self.checks = []
+        # the other fields read to decide each checked field
+        self.edges = OrderedDict()
+        for rule in rules:
+            checked = _unique(rule.checked_fields())
+            read = _unique(rule.dependencies())
+            self.checks.append(checked)
+            for field in checked:
+                others = self.edges.setdefault(field, OrderedDict())
+                others.update((other, True) for other in read if other != field)
+
+    def fields(self):
+        """Gets every field the rules check or read.
+
+        Returns:
+            list -- The fields in the order the rules first use them
+        """
+        fields = OrderedDict()
+        for field, others in self.edges.items():
+            fields[field] = True
+            fields.update(others)
+
+        return list(fields)
+
+    def dependencies(self, field):
+        """Gets the other fields whose values decide the messages of a field.
+
+        Arguments:
+            field {string} -- The field, which can use * notation
+
+        Returns:
+            list
+        """
+        found = OrderedDict()
+        for checked, others in self.edges.items():
+            if overlaps(checked, field):
+                found.update((other, True) for other in others if other != field)
+
+        return list(found)
+
+    def affected(self, changed):
+        """Gets the checked fields whose messages may change when some fields change.
+
+        Arguments:
+            changed {string|list} -- The fields which changed
+
+        Returns:
+            list -- The fields to validate again, in the order the rules check them
+        """
+        changed = _as_list(changed)
+        return [
+            field
+            for field, others in self.edges.items()
+            if any(overlaps(name, key) for name in [field, *others] for key in changed)
+        ]
+
+    def rules_for(self, fields):
+        """Gets the rules reporting errors for any of the fields.
+
+        Arguments:
+            fields {string|list} -- The fields, which can use * notation
+
+        Returns:
+            list -- The indexes of the rules
+        """
+        fields = _as_list(fields)
+        return [
+            index
+            for index, checked in enumerate(self.checks)
+            if any(overlaps(name, key) for name in checked for key in fields)
+        ]
+
+
+def overlaps(first, second):
+    """Tells whether two keys can point to the same value.
+
+    A * matches any segment and a key covers everything below it, so users
+    overlaps users.0.email and users.*.email overlaps users.3.
+
+    Arguments:
+        first {string} -- A key, which can use * notation
+        second {string} -- Another key, which can use * notation
+
+    Returns:
+        bool
+    """
+    if first == second:
+        return True
+
+    first = compile_path(first).segments or (first,)
+    second = compile_path(second).segments or (second,)
+    return all(a == b or "*" in (a, b) for a, b in zip(first, second))
+
+
+def _unique(fields):
+    return tuple(OrderedDict.fromkeys(fields))
+
+
+def _as_list(fields):
+    return [fields] if isinstance(fields, str) else list(fields)
@@ -0,0 +1,61 @@
+"""The Domain Resolver Module"""
+
+import time
+
+from .TTLCache import TTLCache
+
+
+def gethostbyname(domain):
+    import socket
+
+    try:
+        return socket.gethostbyname(domain)
+    except socket.gaierror:
+        return False
+
+
+class DomainResolver:
+    """Resolves domain names and caches the answers.
+
+    Domains which resolve are kept for ttl seconds and domains which do not
+    are kept for negative_ttl seconds so a burst of signups for the same few
+    providers only reaches the resolver once.
+    """
+
+    def __init__(
+        self,
+        resolve=gethostbyname,
+        ttl=300,
+        negative_ttl=60,
+        maxsize=1024,
+        timer=time.monotonic,
+    ):
+        self.resolve = resolve
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.cache = TTLCache(maxsize=maxsize, timer=timer)
+
+    def __call__(self, domain):
+        """Resolves a domain name.
+
+        Arguments:
+            domain {string} -- The domain name to resolve
+
+        Returns:
+            string|bool -- The address of the domain or False when it does not resolve
+        """
+        domain = domain.lower()
+        address = self.cache.get(domain)
+        if address is not None:
+            return address
+
+        address = self.resolve(domain) or False
+        self.cache.set(domain, address, self.ttl if address else self.negative_ttl)
+        return address
+
+    def cache_info(self):
+        """Gets the hits, misses and size of the lookup cache"""
+        return self.cache.cache_info()
+
+    def clear(self):
+        self.cache.clear()
@@ -0,0 +1,277 @@
+"""The Instrumentation Module"""
+
+import re
+import threading
+import time
+
+from .KeyPath import handle_rule
+
+# the order of the counters kept for every rule and field
+COUNTERS = ("calls", "passes", "failures", "exceptions", "seconds")
+
+# help text of the Prometheus metric families
+DESCRIPTIONS = {
+    "calls": "Number of times a rule checked a field.",
+    "passes": "Number of checks which passed.",
+    "failures": "Number of checks which failed.",
+    "exceptions": "Number of checks which raised an exception.",
+    "seconds": "Wall time spent checking, in seconds.",
+}
+
+
+class Instrumentation:
+    """Records how long rules take and how often they pass, fail or raise.
+
+    Give it to Validator.instrument() and every compiled schema records into
+    it. Rules checking several fields are timed per field, rules made of other
+    rules like when() or isnt() are timed as a whole. Nothing is recorded
+    unless a validator is instrumented so other validations pay nothing.
+
+    Arguments:
+        sink {string|callable} -- A file to write to or a function receiving the formatted text (default: {None})
+        format {string|callable} -- statsd, prometheus or a function formatting a snapshot (default: {"prometheus"})
+        prefix {string} -- Prepended to every metric name (default: {"masonite_validation"})
+        timer {callable} -- The clock used to time rules (default: {time.perf_counter})
+    """
+
+    def __init__(
+        self,
+        sink=None,
+        format="prometheus",
+        prefix="masonite_validation",
+        timer=time.perf_counter,
+    ):
+        if isinstance(format, str) and format not in FORMATTERS:
+            raise ValueError(
+                "Unknown metrics format '{}', use one of {}.".format(
+                    format, ", ".join(sorted(FORMATTERS))
+                )
+            )
+
+        self.sink = sink
+        self.format = format
+        self.prefix = prefix
+        self.timer = timer
+        self._fields = {}
+        self._lock = threading.Lock()
+
+    def handle(self, rule, dictionary, lookup):
+        """Runs a rule like handle_rule() while recording it.
+
+        Arguments:
+            rule {BaseValidation} -- The rule to run
+            dictionary {dict} -- The dictionary to validate
+            lookup {PathLookup} -- The lookup for that dictionary, None to resolve keys on its own
+
+        Returns:
+            RuleResult
+        """
+        from .Validator import BaseValidation
+
+        name = type(rule).__name__
+        if type(rule).handle is not BaseValidation.handle:
+            start = self.timer()
+            try:
+                outcome = handle_rule(rule, dictionary, lookup)
+            except Exception:
+                self.record(name, None, self.timer() - start, exception=True)
+                raise
+
+            self.record(name, None, self.timer() - start, passed=bool(outcome))
+            return outcome
+
+        def check(result, key, attribute, dictionary):
+            start = self.timer()
+            try:
+                failed = rule.check(result, key, attribute, dictionary)
+            except Exception:
+                self.record(name, key, self.timer() - start, exception=True)
+                raise
+
+            passed = key not in result.errors
+            self.record(name, key, self.timer() - start, passed=passed)
+            return failed
+
+        # a clock around the check of each field
+        return rule.handle(dictionary, lookup, check=check)
+
+    def record(self, rule, field, seconds, passed=False, exception=False):
+        """Adds one check to the counters.
+
+        Arguments:
+            rule {string} -- The name of the rule class
+            field {string|None} -- The key checked, None for rules made of other rules
+            seconds {float} -- How long the check took
+
+        Keyword Arguments:
+            passed {bool} -- Whether the check passed (default: {False})
+            exception {bool} -- Whether the check raised (default: {False})
+        """
+        with self._lock:
+            counters = self._fields.get((rule, field))
+            if counters is None:
+                counters = self._fields[(rule, field)] = [0, 0, 0, 0, 0.0]
+
+            counters[0] += 1
+            if exception:
+                counters[3] += 1
+            elif passed:
+                counters[1] += 1
+            else:
+                counters[2] += 1
+            counters[4] += seconds
+
+    def snapshot(self, reset=False):
+        """Gets the counters recorded so far.
+
+        Keyword Arguments:
+            reset {bool} -- Start counting from zero again (default: {False})
+
+        Returns:
+            dict -- Totals per rule class under "rules" and per rule and field under "fields"
+        """
+        with self._lock:
+            fields = self._fields
+            if reset:
+                self._fields = {}
+            else:
+                fields = {key: list(counters) for key, counters in fields.items()}
+
+        snapshot = {"rules": {}, "fields": {}}
+        for (rule, field), counters in sorted(fields.items(), key=_sort_key):
+            totals = snapshot["rules"].setdefault(rule, dict.fromkeys(COUNTERS, 0))
+            for name, count in zip(COUNTERS, counters):
+                totals[name] += count
+
+            if field is not None:
+                snapshot["fields"].setdefault(rule, {})[field] = dict(
+                    zip(COUNTERS, counters)
+                )
+
+        return snapshot
+
+    def reset(self):
+        """Forgets everything recorded so far"""
+        with self._lock:
+            self._fields = {}
+
+    def export(self, reset=False):
+        """Formats the recorded counters as text.
+
+        Keyword Arguments:
+            reset {bool} -- Start counting from zero again (default: {False})
+
+        Returns:
+            string
+        """
+        formatter = FORMATTERS.get(self.format, self.format)
+        return formatter(self.snapshot(reset=reset), self.prefix)
+
+    def flush(self):
+        """Writes the formatted counters to the sink.
+
+        Prometheus files are replaced since its counters only grow. StatsD
+        counters are deltas so they are appended and reset after each flush.
+
+        Returns:
+            string -- The text written
+        """
+        if self.sink is None:
+            raise ValueError("Instrumentation needs a sink to flush to.")
+
+        deltas = self.format == "statsd"
+        text = self.export(reset=deltas)
+        if callable(self.sink):
+            self.sink(text)
+        else:
+            with open(self.sink, "a" if deltas else "w") as f:
+                f.write(text)
+
+        return text
+
+    def __getstate__(self):
+        # worker processes get an empty recorder, their counters are not sent back
+        state = dict(self.__dict__)
+        state["_fields"] = {}
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def _sort_key(item):
+    (rule, field), _ = item
+    return rule, field is not None, field or ""
+
+
+def to_statsd(snapshot, prefix):
+    """Formats a snapshot as StatsD counters and timers.
+
+    Arguments:
+        snapshot {dict} -- A snapshot from Instrumentation.snapshot()
+        prefix {string} -- Prepended to every metric name
+
+    Returns:
+        string -- One metric per line, times are the total in milliseconds
+    """
+    lines = []
+    series = [((rule,), counters) for rule, counters in snapshot["rules"].items()]
+    for rule, fields in snapshot["fields"].items():
+        series += [((rule, field), counters) for field, counters in fields.items()]
+
+    for names, counters in series:
+        name = ".".join([prefix] + [_statsd_name(name) for name in names])
+        for counter in COUNTERS[:-1]:
+            lines.append("{}.{}:{}|c".format(name, counter, counters[counter]))
+        lines.append("{}.time:{:.3f}|ms".format(name, counters["seconds"] * 1000))
+
+    return "".join(line + "\n" for line in lines)
+
+
+def to_prometheus(snapshot, prefix):
+    """Formats a snapshot in the Prometheus text exposition format.
+
+    Every metric is labelled with the rule and field, rules made of other
+    rules have an empty field.
+
+    Arguments:
+        snapshot {dict} -- A snapshot from Instrumentation.snapshot()
+        prefix {string} -- Prepended to every metric name
+
+    Returns:
+        string
+    """
+    series = []
+    for rule, fields in snapshot["fields"].items():
+        series += [(rule, field, counters) for field, counters in fields.items()]
+
+    for rule, counters in snapshot["rules"].items():
+        if rule not in snapshot["fields"]:
+            series.append((rule, "", counters))
+
+    lines = []
+    for counter in COUNTERS:
+        name = "{}_rule_{}_total".format(prefix, counter)
+        lines.append("# HELP {} {}".format(name, DESCRIPTIONS[counter]))
+        lines.append("# TYPE {} counter".format(name))
+        for rule, field, counters in series:
+            lines.append(
+                '{}{{rule="{}",field="{}"}} {}'.format(
+                    name, _label(rule), _label(field), counters[counter]
+                )
+            )
+
+    return "".join(line + "\n" for line in lines)
+
+
+def _statsd_name(name):
+    return re.sub(r"[^A-Za-z0-9_\-]", "_", name)
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+FORMATTERS = {"statsd": to_statsd, "prometheus": to_prometheus}
@@ -0,0 +1,314 @@
+"""The Key Path Module"""
+
+import warnings
+from functools import lru_cache
+
+from .RuleResult import RuleResult
+
+# stands in for values which were not found so callers can use their own default
+MISSING = object()
+
+# plucked values of these types can be returned without serializing them
+PLAIN_TYPES = frozenset([str, int, float, bool, type(None), list, tuple, dict])
+
+# whether each rule class with its own handle() accepts a shared lookup
+_shares_lookup = {}
+
+# rule classes already warned about returning a bool from handle()
+_legacy_rules = set()
+
+
+class KeyPath:
+    """A dotted key like user.addresses.*.id split into its segments once.
+
+    Resolving returns the same values as masonite's Dot but walks segments
+    which were prepared up front instead of splitting and searching the key
+    on every call.
+    """
+
+    __slots__ = ("path", "segments", "prefixes")
+
+    def __init__(self, path):
+        self.path = path
+        self.segments = tuple(path.split(".")) if "." in path else None
+        self.prefixes = ()
+        if self.segments is None:
+            return
+
+        # Dot retries shorter keys when a key leads to a dictionary. Each one
+        # is stored with what it plucks out of a list: the segment after its
+        # first wildcard, None when nothing follows it or MISSING without one.
+        prefixes = []
+        for length in range(len(self.segments), 0, -1):
+            segments = self.segments[:length]
+            pluck = MISSING
+            if "*" in segments:
+                index = segments.index("*") + 1
+                pluck = segments[index] if index < length else None
+            prefixes.append((segments, pluck))
+        self.prefixes = tuple(prefixes)
+
+    def resolve(self, dictionary, default=None):
+        """Gets the value the key points to.
+
+        Arguments:
+            dictionary {dict} -- The dictionary to search
+
+        Keyword Arguments:
+            default {mixed} -- Returned when the key is not found (default: {None})
+
+        Returns:
+            mixed -- The value, or a list of values for keys using * notation
+        """
+        if self.segments is None:
+            if not self.path:
+                return dictionary
+
+            try:
+                return dictionary[self.path]
+            except KeyError:
+                return default
+
+        possible = None
+        for segments, pluck in self.prefixes:
+            value = dictionary
+            for segment in segments:
+                if not value:
+                    return default if pluck is MISSING else []
+
+                if isinstance(value, list):
+                    if pluck is None:
+                        return value
+
+                    if pluck is MISSING:
+                        # Dot raises for lists without a wildcard
+                        return self._dot(dictionary, default)
+
+                    return self._pluck(value, pluck, dictionary, default)
+
+                value = value.get(segment)
+                if isinstance(value, str) and value.isnumeric():
+                    continue
+
+                if (
+                    value
+                    and not isinstance(value, int)
+                    and len(value) == 1
+                    and not isinstance(value[next(iter(value))], dict)
+                ):
+                    possible = value
+
+            if not isinstance(value, dict):
+                return value
+
+        return possible
+
+    def expand(self, dictionary):
+        """Yields every element a key with * notation points to under its own key.
+
+        users.*.email gives users.0.email, users.1.email and so on, wildcards
+        run over list indexes and dictionary keys. Empty lists have no
+        elements, but where there is no list at all the key is yielded with
+        its wildcards left in so rules like required still fail.
+
+        Arguments:
+            dictionary {dict} -- The dictionary to search
+
+        Returns:
+            generator -- Yields (key, value) tuples, missing values are MISSING
+        """
+        segments = self.segments or (self.path,)
+        if "*" not in segments:
+            yield self.path, self.resolve(dictionary, MISSING)
+            return
+
+        yield from _expand(segments, 0, (), dictionary)
+
+    def _pluck(self, items, key, dictionary, default):
+        values = []
+        for item in items:
+            if type(item) is not dict:
+                return self._dot(dictionary, default)
+
+            try:
+                value = item[key]
+            except KeyError:
+                return []
+
+            if type(value) not in PLAIN_TYPES and (
+                hasattr(value, "serialize") or hasattr(value, "to_dict")
+            ):
+                return self._dot(dictionary, default)
+
+            values.append(value)
+
+        return values
+
+    def _dot(self, dictionary, default):
+        # rare shapes are left to Dot itself so they behave exactly the same
+        from masonite.dot import Dot
+
+        return Dot().dot(self.path, dictionary, default)
+
+    def __repr__(self):
+        return "KeyPath({!r})".format(self.path)
+
+
+def _expand(segments, depth, keys, value):
+    while depth < len(segments) and segments[depth] != "*":
+        value = _child(value, segments[depth])
+        keys += (segments[depth],)
+        depth += 1
+
+    if depth == len(segments):
+        yield ".".join(keys), value
+    elif isinstance(value, (list, dict)):
+        # elements are produced one at a time so callers can stop early
+        children = value.items() if isinstance(value, dict) else enumerate(value)
+        for name, item in children:
+            yield from _expand(segments, depth + 1, keys + (str(name),), item)
+    else:
+        yield ".".join(keys + segments[depth:]), MISSING
+
+
+def _child(value, segment):
+    if isinstance(value, dict):
+        return value.get(segment, MISSING)
+
+    if isinstance(value, list) and segment.isdigit() and int(segment) < len(value):
+        return value[int(segment)]
+
+    return MISSING
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path):
+    """Parses a dotted key once for every rule using it.
+
+    Arguments:
+        path {string} -- The key, which can use * notation
+
+    Returns:
+        KeyPath
+    """
+    return KeyPath(path)
+
+
+class PathLookup:
+    """Resolves keys against a single dictionary, each of them at most once.
+
+    One lookup is shared by every rule validating the same dictionary so a
+    key referenced by several rules is only walked the first time. It also
+    carries what fail fast validation needs: the keys which already failed
+    and whether rules should stop at their first failure.
+    """
+
+    __slots__ = ("dictionary", "values", "skip", "stop")
+
+    def __init__(self, dictionary, stop=False, skip=()):
+        self.dictionary = dictionary
+        self.values = {}
+        self.skip = set(skip)
+        self.stop = stop
+
+    def find(self, key, default=False):
+        """Gets the value a key points to in the dictionary.
+
+        Arguments:
+            key {string} -- The key, which can use * notation
+
+        Keyword Arguments:
+            default {mixed} -- Returned when the key is not found (default: {False})
+
+        Returns:
+            mixed
+        """
+        try:
+            value = self.values[key]
+        except KeyError:
+            value = compile_path(key).resolve(self.dictionary, MISSING)
+            self.values[key] = value
+
+        return default if value is MISSING else value
+
+    def pending(self, keys):
+        """Leaves out the keys which already failed when validating with bail.
+
+        Arguments:
+            keys {list} -- The keys a rule checks
+
+        Returns:
+            list
+        """
+        if not self.skip:
+            return keys
+
+        return [key for key in keys if key not in self.skip]
+
+    def unfiltered(self):
+        """Gets a lookup sharing the resolved values which checks every key.
+
+        Conditions like the rules given to when() must see every key, even
+        ones which already failed, or skipping them would change the outcome.
+
+        Returns:
+            PathLookup
+        """
+        lookup = PathLookup(self.dictionary)
+        lookup.values = self.values
+        return lookup
+
+
+def handle_rule(rule, dictionary, lookup):
+    """Runs a rule with a shared lookup when its handle() accepts one.
+
+    Rules written before lookups existed may override handle() with only the
+    dictionary, those still run but resolve their own keys. Rules written
+    before RuleResult existed fill their errors attribute and return a bool,
+    their errors are moved into a RuleResult and cleared for the next run.
+
+    Arguments:
+        rule {BaseValidation} -- The rule to run
+        dictionary {dict} -- The dictionary to validate
+        lookup {PathLookup} -- The lookup for that dictionary
+
+    Returns:
+        RuleResult
+    """
+    kind = type(rule)
+    shares = _shares_lookup.get(kind)
+    if shares is None:
+        code = getattr(getattr(kind, "handle", None), "__code__", None)
+        shares = code is not None and "lookup" in code.co_varnames[:code.co_argcount]
+        _shares_lookup[kind] = shares
+
+    if shares:
+        outcome = rule.handle(dictionary, lookup)
+    else:
+        outcome = rule.handle(dictionary)
+
+    if isinstance(outcome, RuleResult):
+        return outcome
+
+    return _legacy_result(rule, outcome)
+
+
+def _legacy_result(rule, outcome):
+    kind = type(rule)
+    if kind not in _legacy_rules:
+        _legacy_rules.add(kind)
+        warnings.warn(
+            "{} returns a bool from handle(), return a RuleResult instead.".format(
+                kind.__name__
+            ),
+            DeprecationWarning,
+        )
+
+    errors = getattr(rule, "errors", None) or {}
+    result = RuleResult(
+        {key: list(messages) for key, messages in errors.items()},
+        passed=bool(outcome),
+    )
+    if errors:
+        rule.errors = {}
+    return result
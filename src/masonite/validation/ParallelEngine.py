@@ -0,0 +1,121 @@
+"""The Parallel Engine Module"""
+
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+
+# the schema installed in each worker process by install_schema()
+_worker_schema = None
+
+
+class ParallelEngine:
+    """Validates a batch of records across a pool of worker processes.
+
+    Records are sent to the workers in chunks and the report is merged back
+    in input order, so it is the same as CompiledSchema.validate_many(). The
+    compiled schema is pickled once per worker rather than once per chunk
+    where the Python version allows it.
+    """
+
+    def __init__(self, schema, workers=None, chunk_size=1000):
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1.")
+
+        self.schema = schema
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def validate_many(self, records, failures_only=False, columnar=False):
+        """Validates a list of dictionaries, see CompiledSchema.validate_many()"""
+        chunks = self.chunks(records)
+        first = next(chunks, [])
+        second = next(chunks, None)
+        if second is None:
+            # a single chunk is not worth starting a pool for
+            return self.schema.validate_many(
+                first, failures_only=failures_only, columnar=columnar
+            )
+
+        chunks = chain([first, second], chunks)
+        report = {}
+        with self._executor() as executor:
+            # only keep a couple of chunks per worker in flight to bound memory
+            pending = deque()
+            start = 0
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(
+                        validate_chunk,
+                        self._payload(),
+                        start,
+                        chunk,
+                        failures_only,
+                        columnar,
+                    )
+                )
+                start += len(chunk)
+                if len(pending) >= self.workers * 2:
+                    self._collect(pending, report)
+
+            while pending:
+                self._collect(pending, report)
+
+        return report
+
+    def chunks(self, records):
+        """Splits records into lists of at most chunk_size records.
+
+        Arguments:
+            records {iterable} -- The dictionaries to validate
+
+        Returns:
+            generator -- Yields lists of records
+        """
+        records = iter(records)
+        while True:
+            chunk = list(islice(records, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _executor(self):
+        if sys.version_info >= (3, 7):
+            return ProcessPoolExecutor(
+                self.workers, initializer=install_schema, initargs=(self.schema,)
+            )
+
+        return ProcessPoolExecutor(self.workers)
+
+    def _payload(self):
+        # workers without an initializer need the schema with every chunk
+        return None if sys.version_info >= (3, 7) else self.schema
+
+    def _collect(self, pending, report):
+        try:
+            report.update(pending.popleft().result())
+        except Exception:
+            for future in pending:
+                future.cancel()
+            raise
+
+
+def install_schema(schema):
+    global _worker_schema
+    _worker_schema = schema
+
+
+def validate_chunk(schema, start, records, failures_only, columnar):
+    if schema is None:
+        schema = _worker_schema
+
+    try:
+        report = schema.validate_many(
+            records, failures_only=failures_only, columnar=columnar
+        )
+    except Exception as e:
+        e.row = start + getattr(e, "row", 0)
+        raise e
+
+    return [(start + row, errors) for row, errors in report.items()]
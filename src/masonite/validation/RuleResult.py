@@ -0,0 +1,32 @@
+"""The Rule Result Module"""
+
+
+class RuleResult:
+    """The outcome of running a rule against a dictionary.
+
+    Rules return a new result from handle() instead of keeping errors on
+    themselves, so a single rule object can be shared between threads.
+    """
+
+    def __init__(self, errors=None, passed=None):
+        self.errors = errors if errors is not None else {}
+        self.passed = passed
+
+    def add(self, key, message):
+        """Adds a failure message for a key
+
+        Arguments:
+            key {string} -- The key that failed
+            message {string|list} -- The message or list of messages to add
+        """
+        messages = message if isinstance(message, list) else [message]
+        if key in self.errors:
+            self.errors[key] += messages
+        else:
+            self.errors.update({key: list(messages)})
+
+    def __bool__(self):
+        if self.passed is not None:
+            return self.passed
+
+        return not self.errors
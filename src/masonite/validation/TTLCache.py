@@ -0,0 +1,92 @@
+"""The TTL Cache Module"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class TTLCache:
+    """A thread safe least recently used cache whose entries also expire.
+
+    Every entry is stored with its own time to live so callers can keep
+    different kinds of results for different lengths of time.
+    """
+
+    def __init__(self, maxsize=1024, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Gets a value which has not expired yet.
+
+        Arguments:
+            key {mixed} -- The key the value was stored under
+
+        Keyword Arguments:
+            default {mixed} -- Returned when the key is missing or expired (default: {None})
+
+        Returns:
+            mixed
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires > self.timer():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+                del self._entries[key]
+
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl):
+        """Stores a value for a number of seconds.
+
+        The least recently used entry is evicted once the cache is full.
+
+        Arguments:
+            key {mixed} -- The key to store the value under
+            value {mixed} -- The value to store
+            ttl {float} -- How many seconds the value stays valid
+        """
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, self.timer() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def cache_info(self):
+        """Gets the hits, misses and size of the cache"""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        """Removes every entry and resets the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # locks can not be pickled, for example when shipping rules to worker processes
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
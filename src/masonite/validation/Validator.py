@@ -1,17 +1,30 @@
 from .RuleEnclosure import RuleEnclosure
 from .MessageBag import MessageBag
-from masonite.dot import Dot as DictDot
-import inspect
+from .CompiledSchema import CompiledSchema
+from .RuleResult import RuleResult
+from .BreachChecker import RangeBreachChecker
+from .DomainResolver import DomainResolver
+from .KeyPath import MISSING, PathLookup, compile_path, handle_rule
+import copy
+from functools import lru_cache
 import re
-import hashlib
-import requests
 import os
-import mimetypes
-import cgi
+import sys
 
 
 class BaseValidation:
+
+    # rules which wait on the network are run concurrently by avalidate()
+    io_bound = False
+
+    # roughly how expensive a check is, compiled schemas failing fast with
+    # reorder run cheaper rules of a field first: 1 for lookups and
+    # comparisons, 10 for patterns and parsing, 50 for dates, 100 for reading
+    # files and 1000 for the network
+    cost = 1
+
     def __init__(self, validations, messages={}, raises={}):
+        # only filled by rules still calling error(key, message), see reset()
         self.errors = {}
         self.messages = messages
         if isinstance(validations, str):
@@ -24,62 +37,146 @@ class BaseValidation:
     def passes(self, attribute, key, dictionary):
         return True
 
-    def error(self, key, message):
-        if key in self.messages:
-            if key in self.errors:
-                self.errors[key].append(self.messages[key])
+    def error(self, result, key, message=None, pattern=None):
+        if not isinstance(result, RuleResult):
+            # rules written before RuleResult call error(key, message)
+            result, key, message = RuleResult(self.errors), result, key
+
+        for name in (key, pattern):
+            if name in self.messages:
+                result.add(key, self.messages[name])
                 return
-            self.errors.update({key: [self.messages[key]]})
-            return
 
-        if not isinstance(message, list):
-            self.errors.update({key: [message]})
-        else:
-            self.errors.update({key: message})
+        result.add(key, message)
 
     def find(self, key, dictionary, default=False):
-        return DictDot().dot(key, dictionary, default)
+        return compile_path(key).resolve(dictionary, default)
+
+    def checked_fields(self):
+        """Gets the keys this rule reports errors for"""
+        return list(self.validations)
+
+    def dependencies(self):
+        """Gets the other keys this rule reads to decide whether a key passes.
+
+        Rules comparing a key with other fields override this so compiled
+        schemas know which fields they depend on.
+        """
+        return []
 
     def message(self, key):
         return ""
 
+    def message_for(self, key, outcome):
+        """Gets the failure message for a key from the outcome of passes().
+
+        Rules which return Checks from passes() override this to describe which
+        criteria failed.
+        """
+        return self.message(key)
+
+    def negated_message_for(self, key, outcome):
+        if hasattr(self, "negated_message"):
+            return self.negated_message(key)
+
+        return self.message(key)
+
     def negate(self):
         self.negated = True
         return self
 
-    def raise_exception(self, key):
+    def reset(self):
+        """Clears the errors of a rule still calling error(key, message).
+
+        Deprecated, rules return a RuleResult from handle() and keep no errors
+        of their own.
+        """
+        self.errors = {}
+
+    def raise_exception(self, key, result):
         if self.raises is not True and key in self.raises:
             error = self.raises.get(key)
-            raise error(self.errors[next(iter(self.errors))][0])
+            raise error(result.errors[key][0])
 
-        raise ValueError(self.errors[next(iter(self.errors))][0])
+        raise ValueError(result.errors[key][0])
 
-    def handle(self, dictionary):
-        boolean = True
+    def handle(self, dictionary, lookup=None, check=None):
+        """Runs the rule against a dictionary.
 
-        for key in self.validations:
-            if self.negated:
+        Nothing is stored on the rule so the same instance can be shared between
+        validations and threads.
 
-                if self.passes(self.find(key, dictionary), key, dictionary):
-                    boolean = False
-                    if hasattr(self, "negated_message"):
-                        self.error(key, self.negated_message(key))
-                    else:
-                        self.error(key, self.message(key))
+        Arguments:
+            dictionary {dict} -- The dictionary to validate
 
-                continue
-            attribute = self.find(key, dictionary)
-            if not self.passes(attribute, key, dictionary):
-                boolean = False
-                self.error(key, self.message(key))
+        Keyword Arguments:
+            lookup {PathLookup} -- Keys already resolved by other rules for this dictionary (default: {None})
+            check {callable} -- Called instead of check() for every key, like the timed checks of Instrumentation (default: {None})
 
-            if self.errors and self.raises:
-                return self.raise_exception(key)
+        Returns:
+            RuleResult -- The errors found, truthy when the rule passed
+        """
+        result = RuleResult()
+        if lookup is None:
+            lookup = PathLookup(dictionary)
+        if check is None:
+            check = self.check
 
-        return boolean
+        for key in lookup.pending(self.validations):
+            if check(result, key, lookup.find(key), dictionary) and self.raises:
+                return self.raise_exception(key, result)
 
-    def reset(self):
-        self.errors = {}
+            if lookup.stop and result.errors:
+                break
+
+        return result
+
+    def check(self, result, key, attribute, dictionary, pattern=None):
+        """Validates a single value and adds its message when it fails.
+
+        Arguments:
+            result {RuleResult} -- The result the message is added to
+            key {string} -- The key the value was found under
+            attribute {mixed} -- The value to validate
+            dictionary {dict} -- The dictionary being validated
+
+        Keyword Arguments:
+            pattern {string} -- The wildcard key the value was expanded from, used for custom messages (default: {None})
+
+        Returns:
+            bool -- Whether the value failed a rule which is not negated
+        """
+        outcome = self.passes(attribute, key, dictionary)
+        if self.negated:
+            if outcome:
+                self.error(
+                    result, key, self.negated_message_for(key, outcome), pattern
+                )
+
+            return False
+
+        if not outcome:
+            self.error(result, key, self.message_for(key, outcome), pattern)
+            return True
+
+        return False
+
+
+class Checks:
+    """The outcome of a rule which tests several criteria at once.
+
+    It is only truthy when none of the criteria failed and remembers the failed
+    ones so the messages can be built without keeping state on the rule.
+    """
+
+    def __init__(self, failed=()):
+        self.failed = tuple(failed)
+
+    def __contains__(self, name):
+        return name in self.failed
+
+    def __bool__(self):
+        return not self.failed
 
 
 class required(BaseValidation):
@@ -97,7 +194,7 @@ class required(BaseValidation):
         Returns:
             bool
         """
-        return self.find(key, dictionary) and attribute
+        return attribute
 
     def message(self, key):
         """A message to show when this rule fails
@@ -125,11 +222,72 @@ class required(BaseValidation):
         return "The {} field is not required.".format(key)
 
 
+@lru_cache(maxsize=None)
+def timezone_index(source="pytz", case_sensitive=True):
+    """Builds the set of valid timezone names once so lookups do not scan a list.
+
+    Both databases include link names like US/Eastern.
+
+    Keyword Arguments:
+        source {string} -- Either "pytz" or the standard library "zoneinfo" (default: {"pytz"})
+        case_sensitive {bool} -- When False names are stored lowercased (default: {True})
+
+    Raises:
+        ValueError: When the source is not supported
+
+    Returns:
+        frozenset
+    """
+    if source == "pytz":
+        import pytz
+
+        names = pytz.all_timezones
+    elif source == "zoneinfo":
+        try:
+            import zoneinfo
+        except ImportError:
+            try:
+                from backports import zoneinfo
+            except ImportError:
+                raise ImportError(
+                    "The zoneinfo timezone source requires Python 3.9 or the 'backports.zoneinfo' library. Please install it with 'pip install backports.zoneinfo'"
+                )
+
+        names = zoneinfo.available_timezones()
+    else:
+        raise ValueError(
+            "Unsupported timezone source {}. Use pytz or zoneinfo.".format(source)
+        )
+
+    if not case_sensitive:
+        names = (name.lower() for name in names)
+
+    return frozenset(names)
+
+
 class timezone(BaseValidation):
+
+    cost = 50
+
+    # the database used by every timezone rule not given a source
+    source = "pytz"
+
+    def __init__(
+        self, validations, case_sensitive=True, source=None, messages={}, raises={}
+    ):
+        super().__init__(validations, messages=messages, raises=raises)
+        self.case_sensitive = case_sensitive
+        if source is not None:
+            self.source = source
+
     def passes(self, attribute, key, dictionary):
-        import pytz
+        if not isinstance(attribute, str):
+            return False
+
+        if not self.case_sensitive:
+            attribute = attribute.lower()
 
-        return attribute in pytz.all_timezones
+        return attribute in timezone_index(self.source, self.case_sensitive)
 
     def message(self, attribute):
         return "The {} must be a valid timezone.".format(attribute)
@@ -146,6 +304,9 @@ class one_of(BaseValidation):
 
         return False
 
+    def dependencies(self):
+        return list(self.validations)
+
     def message(self, attribute):
         if len(self.validations) > 2:
             text = ", ".join(self.validations)
@@ -181,6 +342,9 @@ class accepted(BaseValidation):
 
 
 class ip(BaseValidation):
+
+    cost = 10
+
     def passes(self, attribute, key, dictionary):
         import socket
 
@@ -198,6 +362,9 @@ class ip(BaseValidation):
 
 
 class date(BaseValidation):
+
+    cost = 50
+
     def passes(self, attribute, key, dictionary):
         import pendulum
 
@@ -215,6 +382,9 @@ class date(BaseValidation):
 
 
 class before_today(BaseValidation):
+
+    cost = 50
+
     def __init__(self, validations, tz="Universal", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.tz = tz
@@ -235,6 +405,9 @@ class before_today(BaseValidation):
 
 
 class after_today(BaseValidation):
+
+    cost = 50
+
     def __init__(self, validations, tz="Universal", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.tz = tz
@@ -255,6 +428,9 @@ class after_today(BaseValidation):
 
 
 class is_past(BaseValidation):
+
+    cost = 50
+
     def __init__(self, validations, tz="Universal", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.tz = tz
@@ -275,6 +451,9 @@ class is_past(BaseValidation):
 
 
 class is_future(BaseValidation):
+
+    cost = 50
+
     def __init__(self, validations, tz="Universal", messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.tz = tz
@@ -295,10 +474,15 @@ class is_future(BaseValidation):
 
 
 class email(BaseValidation):
+
+    cost = 10
+
+    pattern = re.compile(
+        r"^[^.][^@]*@([?)[a-zA-Z0-9-.])+.([a-zA-Z]{2,3}|[0-9]{1,3})(]?)$"
+    )
+
     def passes(self, attribute, key, dictionary):
-        return re.compile(
-            r"^[^.][^@]*@([?)[a-zA-Z0-9-.])+.([a-zA-Z]{2,3}|[0-9]{1,3})(]?)$"
-        ).match(attribute)
+        return self.pattern.match(attribute)
 
     def message(self, attribute):
         return "The {} must be a valid email address.".format(attribute)
@@ -315,6 +499,9 @@ class matches(BaseValidation):
     def passes(self, attribute, key, dictionary):
         return attribute == dictionary[self.match]
 
+    def dependencies(self):
+        return [self.match]
+
     def message(self, attribute):
         return "The {} must match {}.".format(attribute, self.match)
 
@@ -334,21 +521,28 @@ class exists(BaseValidation):
 
 
 class active_domain(BaseValidation):
-    def passes(self, attribute, key, dictionary):
-        import socket
 
-        try:
-            if "@" in attribute:
-                # validation is for an email address
-                return socket.gethostbyname(attribute.split("@")[1])
-
-            return socket.gethostbyname(
-                attribute.replace("https://", "")
-                .replace("http://", "")
-                .replace("www.", "")
-            )
-        except socket.gaierror:
-            return False
+    io_bound = True
+    cost = 1000
+
+    # shared by every instance unless one is given a resolver of its own
+    resolver = DomainResolver()
+
+    def __init__(self, validations, resolver=None, messages={}, raises={}):
+        super().__init__(validations, messages=messages, raises=raises)
+        if resolver is not None:
+            self.resolver = resolver
+
+    def passes(self, attribute, key, dictionary):
+        if "@" in attribute:
+            # validation is for an email address
+            return self.resolver(attribute.split("@")[1])
+
+        return self.resolver(
+            attribute.replace("https://", "")
+            .replace("http://", "")
+            .replace("www.", "")
+        )
 
     def message(self, attribute):
         return "The {} must be an active domain name.".format(attribute)
@@ -559,6 +753,10 @@ class less_than(BaseValidation):
 
 
 class strong(BaseValidation):
+
+    # used when breach=True, pass a checker as breach to use another one
+    breach_checker = RangeBreachChecker()
+
     def __init__(
         self,
         validations,
@@ -576,18 +774,24 @@ class strong(BaseValidation):
         self.numbers = numbers
         self.special = special
         self.breach = breach
-        self.length_check = True
-        self.uppercase_check = True
-        self.numbers_check = True
-        self.special_check = True
-        self.breach_check = True
+
+    @property
+    def io_bound(self):
+        return bool(self.breach) and getattr(self.checker(), "io_bound", True)
+
+    @property
+    def cost(self):
+        return 1000 if self.io_bound else 10
+
+    def checker(self):
+        """Gets the callable which tells if a password has been breached"""
+        return self.breach if callable(self.breach) else self.breach_checker
 
     def passes(self, attribute, key, dictionary):
-        all_clear = True
+        failed = []
 
         if len(attribute) < self.length:
-            all_clear = False
-            self.length_check = False
+            failed.append("length")
 
         if self.uppercase != 0:
             uppercase = 0
@@ -596,8 +800,7 @@ class strong(BaseValidation):
                     uppercase += 1
 
             if uppercase < self.uppercase:
-                self.uppercase_check = False
-                all_clear = False
+                failed.append("uppercase")
 
         if self.numbers != 0:
             numbers = 0
@@ -606,58 +809,49 @@ class strong(BaseValidation):
                     numbers += 1
 
             if numbers < self.numbers:
-                self.numbers_check = False
-                all_clear = False
+                failed.append("numbers")
 
-        if self.breach:
-            try:
-                from pwnedapi import Password
-            except ImportError:
-                raise ImportError(
-                    "Checking for breaches requires the 'pwnedapi' library. Please install it with 'pip install pwnedapi'"
-                )
-
-            password = Password(attribute)
-            if password.is_pwned():
-                self.breach_check = False
-                all_clear = False
+        if self.breach and self.checker()(attribute):
+            failed.append("breach")
 
         if self.special != 0:
             if len(re.findall("[^A-Za-z0-9]", attribute)) < self.special:
-                self.special_check = False
-                all_clear = False
+                failed.append("special")
 
-        return all_clear
+        return Checks(failed)
 
-    def message(self, attribute):
+    def message_for(self, key, outcome):
+        return self.message(key, outcome)
+
+    def message(self, attribute, checks=Checks()):
         message = []
-        if not self.length_check:
+        if "length" in checks:
             message.append(
                 "The {} field must be {} characters in length".format(
                     attribute, self.length
                 )
             )
 
-        if not self.uppercase_check:
+        if "uppercase" in checks:
             message.append(
                 "The {} field must have {} uppercase letters".format(
                     attribute, self.uppercase
                 )
             )
 
-        if not self.special_check:
+        if "special" in checks:
             message.append(
                 "The {} field must have {} special characters".format(
                     attribute, self.special
                 )
             )
 
-        if not self.numbers_check:
+        if "numbers" in checks:
             message.append(
                 "The {} field must have {} numbers".format(attribute, self.numbers)
             )
 
-        if not self.breach_check:
+        if "breach" in checks:
             message.append(
                 "The {} field has been breached in the past. Try another {}".format(
                     attribute, attribute
@@ -670,32 +864,85 @@ class strong(BaseValidation):
         return "The {} must not be less than {}.".format(attribute, self.value)
 
 
+def _fields_of(rules):
+    return [field for rule in rules for field in rule.checked_fields()]
+
+
+def _dependencies_of(rules):
+    return [field for rule in rules for field in rule.dependencies()]
+
+
 class isnt(BaseValidation):
     def __init__(self, *rules, messages={}, raises={}):
-        super().__init__(rules)
+        # negate copies so rules shared with other validations keep their meaning
+        super().__init__(tuple(copy.copy(rule).negate() for rule in rules))
 
-    def handle(self, dictionary):
+    @property
+    def io_bound(self):
+        return any(rule.io_bound for rule in self.validations)
+
+    @property
+    def cost(self):
+        return sum(rule.cost for rule in self.validations)
+
+    def checked_fields(self):
+        return _fields_of(self.validations)
+
+    def dependencies(self):
+        return _dependencies_of(self.validations)
+
+    def handle(self, dictionary, lookup=None):
+        result = RuleResult()
+        if lookup is None:
+            lookup = PathLookup(dictionary)
         for rule in self.validations:
-            rule.negate().handle(dictionary)
-            self.errors.update(rule.errors)
+            result.errors.update(handle_rule(rule, dictionary, lookup).errors)
+
+        return result
 
 
 class does_not(BaseValidation):
     def __init__(self, *rules, messages={}, raises={}):
         super().__init__(rules)
         self.should_run_then = True
+        self.then_rules = ()
+
+    @property
+    def io_bound(self):
+        return any(rule.io_bound for rule in self.validations + self.then_rules)
 
-    def handle(self, dictionary):
-        self.dictionary = dictionary
+    @property
+    def cost(self):
+        return sum(rule.cost for rule in self.validations + self.then_rules)
+
+    def checked_fields(self):
+        return _fields_of(self.then_rules)
+
+    def dependencies(self):
+        # the conditions only decide whether the other rules run
+        return _fields_of(self.validations) + _dependencies_of(
+            self.validations + self.then_rules
+        )
+
+    def handle(self, dictionary, lookup=None):
+        result = RuleResult()
         errors = False
+        if lookup is None:
+            lookup = PathLookup(dictionary)
+        conditions = lookup.unfiltered()
         for rule in self.validations:
-            if rule.handle(dictionary):
+            if handle_rule(rule, dictionary, conditions):
                 errors = True
 
         if not errors:
             for rule in self.then_rules:
-                if not rule.handle(dictionary):
-                    self.errors.update(rule.errors)
+                outcome = handle_rule(rule, dictionary, lookup)
+                if not outcome:
+                    result.errors.update(outcome.errors)
+
+        # used as a condition this rule passes when none of its rules passed
+        result.passed = not errors and not result.errors
+        return result
 
     def then(self, *rules):
         self.then_rules = rules
@@ -706,24 +953,118 @@ class when(BaseValidation):
     def __init__(self, *rules, messages={}, raises={}):
         super().__init__(rules)
         self.should_run_then = True
+        self.then_rules = ()
+
+    @property
+    def io_bound(self):
+        return any(rule.io_bound for rule in self.validations + self.then_rules)
 
-    def handle(self, dictionary):
-        self.dictionary = dictionary
+    @property
+    def cost(self):
+        return sum(rule.cost for rule in self.validations + self.then_rules)
+
+    def checked_fields(self):
+        return _fields_of(self.then_rules)
+
+    def dependencies(self):
+        # the conditions only decide whether the other rules run
+        return _fields_of(self.validations) + _dependencies_of(
+            self.validations + self.then_rules
+        )
+
+    def handle(self, dictionary, lookup=None):
+        result = RuleResult()
         errors = False
+        if lookup is None:
+            lookup = PathLookup(dictionary)
+        conditions = lookup.unfiltered()
         for rule in self.validations:
-            if rule.handle(dictionary):
+            if handle_rule(rule, dictionary, conditions):
                 errors = True
 
         if errors:
             for rule in self.then_rules:
-                if not rule.handle(dictionary):
-                    self.errors.update(rule.errors)
+                outcome = handle_rule(rule, dictionary, lookup)
+                if not outcome:
+                    result.errors.update(outcome.errors)
+
+        return result
 
     def then(self, *rules):
         self.then_rules = rules
         return self
 
 
+class each(BaseValidation):
+    """Runs rules once for every element their wildcard keys point to.
+
+    Errors are reported under the element's own key, like discounts_ref.17
+    instead of discounts_ref.*, and collecting them stops after max_errors
+    failing elements so large lists fail fast.
+    """
+
+    def __init__(self, *rules, max_errors=None, messages={}, raises={}):
+        super().__init__(rules)
+        self.max_errors = max_errors
+
+    @property
+    def io_bound(self):
+        return any(rule.io_bound for rule in self.validations)
+
+    @property
+    def cost(self):
+        return sum(rule.cost for rule in self.validations)
+
+    def checked_fields(self):
+        return _fields_of(self.validations)
+
+    def dependencies(self):
+        return _dependencies_of(self.validations)
+
+    def handle(self, dictionary, lookup=None):
+        result = RuleResult()
+        if lookup is None:
+            lookup = PathLookup(dictionary)
+        failed = set()
+        for rule in self._expandable(self.validations):
+            if type(rule).handle is not BaseValidation.handle:
+                # rules made of other rules have no values of their own to expand
+                outcome = handle_rule(rule, dictionary, lookup)
+                for key, messages in outcome.errors.items():
+                    result.add(key, messages)
+                continue
+
+            for pattern in lookup.pending(rule.validations):
+                for key, attribute in compile_path(pattern).expand(dictionary):
+                    if self.max_errors is not None and len(failed) >= self.max_errors:
+                        return result
+
+                    if key in lookup.skip:
+                        continue
+
+                    if attribute is MISSING:
+                        attribute = False
+
+                    if rule.check(result, key, attribute, dictionary, pattern):
+                        if rule.raises:
+                            return rule.raise_exception(key, result)
+
+                    if key in result.errors:
+                        failed.add(key)
+                        if lookup.stop:
+                            return result
+
+        return result
+
+    def _expandable(self, rules):
+        for rule in rules:
+            if isinstance(rule, isnt):
+                # its rules are already negated copies so they expand like any other
+                yield from self._expandable(rule.validations)
+            else:
+                yield rule
+
+
 class truthy(BaseValidation):
     def passes(self, attribute, key, dictionary):
         return attribute
@@ -736,6 +1077,9 @@ class truthy(BaseValidation):
 
 
 class json(BaseValidation):
+
+    cost = 10
+
     def passes(self, attribute, key, dictionary):
         import json as json_module
 
@@ -758,17 +1102,24 @@ class json(BaseValidation):
 
 
 class phone(BaseValidation):
+
+    cost = 10
+
+    formats = {
+        "(123)456-7890": re.compile(r"^\(\w{3}\)\w{3}\-\w{4}$"),
+        "123-456-7890": re.compile(r"^\w{3}\-\w{3}\-\w{4}$"),
+    }
+
     def __init__(self, *rules, pattern="123-456-7890", messages={}, raises={}):
         super().__init__(rules, messages={}, raises={})
         # 123-456-7890
         # (123)456-7890
         self.pattern = pattern
+        self.regex = self.formats.get(pattern)
 
     def passes(self, attribute, key, dictionary):
-        if self.pattern == "(123)456-7890":
-            return re.compile(r"^\(\w{3}\)\w{3}\-\w{4}$").match(attribute)
-        elif self.pattern == "123-456-7890":
-            return re.compile(r"^\w{3}\-\w{3}\-\w{4}$").match(attribute)
+        if self.regex is not None:
+            return self.regex.match(attribute)
 
     def message(self, attribute):
         if self.pattern == "(123)456-7890":
@@ -789,6 +1140,9 @@ class confirmed(BaseValidation):
             return dictionary[key] == dictionary["{}".format(key + "_confirmation")]
         return False
 
+    def dependencies(self):
+        return [key + "_confirmation" for key in self.validations]
+
     def message(self, attribute):
         return "The {} confirmation does not match.".format(attribute)
 
@@ -796,13 +1150,47 @@ class confirmed(BaseValidation):
         return "The {} confirmation matches.".format(attribute)
 
 
+@lru_cache(maxsize=512)
+def compile_pattern(pattern, flags=0, engine=re):
+    """Compiles a regular expression once for every rule using it.
+
+    Unlike the re module's own cache this one is only used by validation rules
+    so patterns are not evicted by unrelated code.
+
+    Arguments:
+        pattern {string} -- The regular expression
+
+    Keyword Arguments:
+        flags {int} -- Flags passed to the engine (default: {0})
+        engine {module} -- Anything with an re compatible compile(), like re2 (default: {re})
+
+    Returns:
+        re.Pattern
+    """
+    return engine.compile(pattern, flags)
+
+
 class regex(BaseValidation):
-    def __init__(self, validations, pattern, messages={}, raises={}):
+
+    cost = 10
+
+    # set to an re compatible module like re2 to change the engine of every regex rule
+    engine = re
+
+    def __init__(
+        self, validations, pattern, flags=0, engine=None, messages={}, raises={}
+    ):
         super().__init__(validations, messages=messages, raises=raises)
-        self.pattern = pattern
+        if isinstance(pattern, str):
+            self.regex = compile_pattern(pattern, flags, engine or self.engine)
+            self.pattern = pattern
+        else:
+            # already compiled by the caller
+            self.regex = pattern
+            self.pattern = pattern.pattern
 
     def passes(self, attribute, key, dictionary):
-        return re.compile(r"{}".format(self.pattern)).match(attribute)
+        return self.regex.match(attribute)
 
     def message(self, attribute):
         return "The {} does not match pattern {} .".format(attribute, self.pattern)
@@ -818,35 +1206,158 @@ def parse_size(size):
     return FileSize(size, case_sensitive=False)
 
 
+def mimetype_table(kind):
+    """Gets the extensions and mimetypes of a kind of file like image or video.
+
+    The table is computed once and computed again when mimetypes is
+    reinitialised or types are added.
+
+    Arguments:
+        kind {string} -- The start of the mimetypes to include
+
+    Returns:
+        tuple -- The extensions in mimetypes order and a frozenset of their mimetypes
+    """
+    import mimetypes
+
+    return _mimetype_table(kind, id(mimetypes.types_map), len(mimetypes.types_map))
+
+
+@lru_cache(maxsize=32)
+def _mimetype_table(kind, types_map_id, types_map_size):
+    import mimetypes
+
+    extensions = tuple(
+        ext for ext, mimetype in mimetypes.types_map.items() if mimetype.startswith(kind)
+    )
+    return extensions, frozenset(mimetypes.types_map[ext] for ext in extensions)
+
+
+def refresh_mimetypes(files=None):
+    """Reinitialises mimetypes and forgets the mimetype tables of the file rules.
+
+    Keyword Arguments:
+        files {list} -- Extra mime.types files to read (default: {None})
+    """
+    import mimetypes
+
+    mimetypes.init(files)
+    _mimetype_table.cache_clear()
+
+
+def is_field_storage(data):
+    # an upload can only be a FieldStorage once something has imported cgi
+    cgi = sys.modules.get("cgi")
+    return cgi is not None and isinstance(data, cgi.FieldStorage)
+
+
 class BaseFileValidation(BaseValidation):
     """This is the abstract base file validation class which is able to handle
     normal file paths and file objects from masonite file upload requests."""
 
-    def __init__(self, validations, messages={}, raises={}):
-        super().__init__(validations, messages=messages, raises=raises)
-        self.file_check = True
-        self.size_check = True
-        self.mimes_check = True
-        self.all_clear = True
+    cost = 100
+
+    # check the type from the file's magic bytes instead of its name
+    sniff = False
+
+    min_width = max_width = min_height = max_height = None
+
+    # content constraints checked in a single pass over the file
+    digest = None
+    algorithm = "sha256"
+    forbidden = ()
 
     def passes(self, attribute, key, dictionary):
         if not self._get_file_if_file(attribute):
-            self.file_check = False
-            return False
+            return Checks(["file"])
+        failed = []
+        scan = None
+        if self.digest or self.forbidden:
+            import hmac
+
+            from .scanning import scan_file
+
+            scan = scan_file(
+                attribute,
+                algorithm=self.algorithm if self.digest else None,
+                forbidden=self.forbidden,
+            )
+            if self.digest and not hmac.compare_digest(
+                scan.digest, self.digest.lower()
+            ):
+                failed.append("digest")
+            if scan.forbidden is not None:
+                failed.append("forbidden")
         if self.size:
-            file_size = self._get_size(attribute)
+            # the content was already read so the size is known without another pass
+            file_size = scan.size if scan else self._get_size(attribute)
             if file_size > self.size:
-                self.size_check = False
-                self.all_clear = False
+                failed.append("size")
         if self.allowed_extensions:
             mimetype, encoding = self._get_mimetype(attribute)
-            if mimetype not in self.allowed_mimetypes:
-                self.mimes_check = False
-                self.all_clear = False
-        return self.all_clear
+            # content or names of an unknown type are never allowed
+            if mimetype is None or mimetype not in self.allowed_mimetypes:
+                failed.append("mimes")
+        if "mimes" not in failed:
+            failed += self._media_checks(attribute)
+        return Checks(failed)
+
+    def _media_checks(self, file):
+        """Checks constraints read from the file's headers like its dimensions"""
+        return []
+
+    def _dimension_checks(self, width, height):
+        failed = []
+        if self.min_width is not None and width < self.min_width:
+            failed.append("min_width")
+        if self.max_width is not None and width > self.max_width:
+            failed.append("max_width")
+        if self.min_height is not None and height < self.min_height:
+            failed.append("min_height")
+        if self.max_height is not None and height > self.max_height:
+            failed.append("max_height")
+        return failed
+
+    def _dimension_messages(self, attribute, checks):
+        messages = []
+        if "min_width" in checks:
+            messages.append(
+                "The {} must be at least {} pixels wide.".format(
+                    attribute, self.min_width
+                )
+            )
+
+        if "max_width" in checks:
+            messages.append(
+                "The {} must be at most {} pixels wide.".format(
+                    attribute, self.max_width
+                )
+            )
+
+        if "min_height" in checks:
+            messages.append(
+                "The {} must be at least {} pixels high.".format(
+                    attribute, self.min_height
+                )
+            )
+
+        if "max_height" in checks:
+            messages.append(
+                "The {} must be at most {} pixels high.".format(
+                    attribute, self.max_height
+                )
+            )
+
+        return messages
+
+    def message_for(self, key, outcome):
+        return self.message(key, outcome)
+
+    def negated_message_for(self, key, outcome):
+        return self.negated_message(key, outcome)
 
     def _get_file_if_file(self, data):
-        if isinstance(data, cgi.FieldStorage):
+        if is_field_storage(data):
             return True
         else:
             return os.path.isfile(data)
@@ -867,30 +1378,65 @@ class BaseFileValidation(BaseValidation):
         raise AttributeError("Unable to determine the file's size.")
 
     def _get_mimetype(self, file):
-        if isinstance(file, cgi.FieldStorage):
+        if self.sniff:
+            from .sniffing import read_header, sniff_mimetype
+
+            return sniff_mimetype(read_header(file)), None
+
+        if is_field_storage(file):
             return file.type, file.encoding
         else:
+            import mimetypes
+
             return mimetypes.guess_type(file)
 
 
 class file(BaseFileValidation):
-    def __init__(self, validations, size=False, mimes=False, messages={}, raises={}):
+    def __init__(
+        self,
+        validations,
+        size=False,
+        mimes=False,
+        sniff=False,
+        digest=None,
+        algorithm="sha256",
+        forbidden=(),
+        messages={},
+        raises={},
+    ):
         super().__init__(validations, messages=messages, raises=raises)
         self.size = parse_size(size)
+        self.sniff = sniff
+        self.digest = digest
+        self.algorithm = algorithm
+        self.forbidden = tuple(
+            item.encode("utf-8") if isinstance(item, str) else item
+            for item in forbidden
+        )
+        if digest:
+            import hashlib
+
+            # fail on unknown algorithms now rather than on the first upload
+            hashlib.new(algorithm)
 
         # parse allowed extensions to a list of mime types
         self.allowed_extensions = mimes
         if mimes:
-            self.allowed_mimetypes = list(
-                map(lambda mt: mimetypes.types_map.get("." + mt, None), mimes)
+            import mimetypes
+
+            # extensions mimetypes does not know have no mimetype to allow
+            self.allowed_mimetypes = frozenset(
+                mimetypes.types_map["." + mt]
+                for mt in mimes
+                if "." + mt in mimetypes.types_map
             )
 
-    def message(self, attribute):
+    def message(self, attribute, checks=Checks()):
         messages = []
-        if not self.file_check:
+        if "file" in checks:
             messages.append("The {} is not a valid file.".format(attribute))
 
-        if not self.size_check:
+        if "size" in checks:
             from hfilesize import FileSize
 
             messages.append(
@@ -898,20 +1444,28 @@ class file(BaseFileValidation):
                     attribute, FileSize(self.size)
                 )
             )
-        if not self.mimes_check:
+        if "mimes" in checks:
             messages.append(
                 "The {} mime type is not valid. Allowed formats are {}.".format(
                     attribute, ",".join(self.allowed_extensions)
                 )
             )
 
+        if "digest" in checks:
+            messages.append(
+                "The {} {} checksum does not match.".format(attribute, self.algorithm)
+            )
+
+        if "forbidden" in checks:
+            messages.append("The {} contains forbidden content.".format(attribute))
+
         return messages
 
-    def negated_message(self, attribute):
+    def negated_message(self, attribute, checks=Checks()):
         messages = []
-        if self.file_check:
+        if "file" not in checks:
             messages.append("The {} is a valid file.".format(attribute))
-        if self.size_check:
+        if "size" not in checks:
             from hfilesize import FileSize
 
             messages.append(
@@ -919,7 +1473,7 @@ class file(BaseFileValidation):
                     attribute, FileSize(self.size)
                 )
             )
-        if self.mimes_check:
+        if "mimes" not in checks:
             messages.append(
                 "The {} mime type is in {}.".format(
                     attribute, ",".join(self.allowed_extensions)
@@ -928,24 +1482,74 @@ class file(BaseFileValidation):
         return messages
 
 
+def parse_ratio(ratio):
+    """Parse an aspect ratio like 1.5, "16/9" or "16:9" into a number"""
+    if isinstance(ratio, str):
+        width, height = re.split("[/:]", ratio)
+        return float(width) / float(height)
+
+    return ratio
+
+
 class image(BaseFileValidation):
-    def __init__(self, validations, size=False, messages={}, raises={}):
+    def __init__(
+        self,
+        validations,
+        size=False,
+        sniff=False,
+        min_width=None,
+        max_width=None,
+        min_height=None,
+        max_height=None,
+        ratio=None,
+        messages={},
+        raises={},
+    ):
         super().__init__(validations, messages=messages, raises=raises)
         self.size = parse_size(size)
-        image_mimetypes = {
-            ext: mimetype
-            for ext, mimetype in mimetypes.types_map.items()
-            if mimetype.startswith("image")
-        }
-        self.allowed_extensions = list(image_mimetypes.keys())
-        self.allowed_mimetypes = list(image_mimetypes.values())
+        self.sniff = sniff
+        self.allowed_extensions, self.allowed_mimetypes = mimetype_table("image")
+        self.min_width = min_width
+        self.max_width = max_width
+        self.min_height = min_height
+        self.max_height = max_height
+        self.ratio = ratio
+        self._ratio = parse_ratio(ratio)
+
+    def _media_checks(self, file):
+        if not any(
+            limit is not None
+            for limit in (
+                self.min_width,
+                self.max_width,
+                self.min_height,
+                self.max_height,
+                self._ratio,
+            )
+        ):
+            return []
 
-    def message(self, attribute):
+        from .media import image_size
+
+        dimensions = image_size(file)
+        if not dimensions:
+            return ["dimensions"]
+
+        width, height = dimensions
+        failed = self._dimension_checks(width, height)
+        if self._ratio is not None and (
+            not height or abs(width / height - self._ratio) > 0.01
+        ):
+            failed.append("ratio")
+
+        return failed
+
+    def message(self, attribute, checks=Checks()):
         messages = []
-        if not self.file_check:
+        if "file" in checks:
             messages.append("The {} is not a valid file.".format(attribute))
 
-        if not self.size_check:
+        if "size" in checks:
             from hfilesize import FileSize
 
             messages.append(
@@ -954,20 +1558,32 @@ class image(BaseFileValidation):
                 )
             )
 
-        if not self.mimes_check:
+        if "mimes" in checks:
             messages.append(
                 "The {} file is not a valid image. Allowed formats are {}.".format(
                     attribute, ",".join(self.allowed_extensions)
                 )
             )
 
+        if "dimensions" in checks:
+            messages.append(
+                "The {} image dimensions could not be read.".format(attribute)
+            )
+
+        messages += self._dimension_messages(attribute, checks)
+
+        if "ratio" in checks:
+            messages.append(
+                "The {} must have an aspect ratio of {}.".format(attribute, self.ratio)
+            )
+
         return messages
 
-    def negated_message(self, attribute):
+    def negated_message(self, attribute, checks=Checks()):
         messages = []
-        if self.file_check:
+        if "file" not in checks:
             messages.append("The {} is a valid file.".format(attribute))
-        if self.size_check:
+        if "size" not in checks:
             from hfilesize import FileSize
 
             messages.append(
@@ -976,32 +1592,67 @@ class image(BaseFileValidation):
                 )
             )
 
-        if self.mimes_check:
+        if "mimes" not in checks:
             messages.append("The {} file is a valid image.".format(attribute))
 
         return messages
 
 
 class video(BaseFileValidation):
-    def __init__(self, validations, size=False, messages={}, raises={}):
+    def __init__(
+        self,
+        validations,
+        size=False,
+        sniff=False,
+        min_duration=None,
+        max_duration=None,
+        min_width=None,
+        max_width=None,
+        min_height=None,
+        max_height=None,
+        messages={},
+        raises={},
+    ):
         super().__init__(validations, messages=messages, raises=raises)
         self.size = parse_size(size)
-
-        video_mimetypes = {
-            ext: mimetype
-            for ext, mimetype in mimetypes.types_map.items()
-            if mimetype.startswith("video")
-        }
-
-        self.allowed_extensions = list(video_mimetypes.keys())
-        self.allowed_mimetypes = list(video_mimetypes.values())
-
-    def message(self, attribute):
+        self.sniff = sniff
+        self.allowed_extensions, self.allowed_mimetypes = mimetype_table("video")
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+        self.min_width = min_width
+        self.max_width = max_width
+        self.min_height = min_height
+        self.max_height = max_height
+
+    def _media_checks(self, file):
+        durations = (self.min_duration, self.max_duration)
+        dimensions = (self.min_width, self.max_width, self.min_height, self.max_height)
+        if not any(limit is not None for limit in durations + dimensions):
+            return []
+
+        from .media import video_metadata
+
+        metadata = video_metadata(file)
+        if metadata is None:
+            return ["metadata"]
+
+        failed = self._dimension_checks(metadata.width, metadata.height)
+        if any(limit is not None for limit in durations):
+            if metadata.duration is None:
+                return failed + ["metadata"]
+            if self.min_duration is not None and metadata.duration < self.min_duration:
+                failed.append("min_duration")
+            if self.max_duration is not None and metadata.duration > self.max_duration:
+                failed.append("max_duration")
+
+        return failed
+
+    def message(self, attribute, checks=Checks()):
         messages = []
-        if not self.file_check:
+        if "file" in checks:
             messages.append("The {} is not a valid file.".format(attribute))
 
-        if not self.size_check:
+        if "size" in checks:
             from hfilesize import FileSize
 
             messages.append(
@@ -1010,21 +1661,42 @@ class video(BaseFileValidation):
                 )
             )
 
-        if not self.mimes_check:
+        if "mimes" in checks:
             messages.append(
                 "The {} file is not a valid video. Allowed formats are {}.".format(
                     attribute, ",".join(self.allowed_extensions)
                 )
             )
 
+        if "metadata" in checks:
+            messages.append(
+                "The {} video metadata could not be read.".format(attribute)
+            )
+
+        messages += self._dimension_messages(attribute, checks)
+
+        if "min_duration" in checks:
+            messages.append(
+                "The {} must be at least {} seconds long.".format(
+                    attribute, self.min_duration
+                )
+            )
+
+        if "max_duration" in checks:
+            messages.append(
+                "The {} must be at most {} seconds long.".format(
+                    attribute, self.max_duration
+                )
+            )
+
         return messages
 
-    def negated_message(self, attribute):
+    def negated_message(self, attribute, checks=Checks()):
         messages = []
-        if self.file_check:
+        if "file" not in checks:
             messages.append("The {} is a valid file.".format(attribute))
 
-        if self.size_check:
+        if "size" not in checks:
             from hfilesize import FileSize
 
             messages.append(
@@ -1033,40 +1705,72 @@ class video(BaseFileValidation):
                 )
             )
 
-        if self.mimes_check:
+        if "mimes" not in checks:
             messages.append("The {} file is a valid video.".format(attribute))
 
         return messages
 
 
+@lru_cache(maxsize=256)
+def postal_code_pattern(locales):
+    """Compiles the postal code patterns of one or more locales into a single regex.
+
+    Each locale's pattern becomes a named group of one alternation so a value
+    is checked against every locale in one scan and the matching group names
+    the country. Compiled patterns are cached per tuple of locales.
+
+    Arguments:
+        locales {tuple} -- ISO 3166-1 country codes
+
+    Raises:
+        NotImplementedError: When a country code has no postal code pattern
+
+    Returns:
+        re.Pattern
+    """
+    from .resources.postal_codes import PATTERNS
+
+    groups = []
+    for locale in dict.fromkeys(locales):
+        pattern_dict = PATTERNS.get(locale, None)
+        if pattern_dict is None or pattern_dict["pattern"] is None:
+            raise NotImplementedError(
+                "Unsupported country code {}. Check that it is a ISO 3166-1 country code or open a PR to require support of this country code.".format(
+                    locale
+                )
+            )
+
+        groups.append("(?P<{}>{})".format(locale, pattern_dict["pattern"]))
+
+    return re.compile("|".join(groups))
+
+
 class postal_code(BaseValidation):
+
+    cost = 10
+
     def __init__(self, validations, locale, messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         from .resources.postal_codes import PATTERNS
 
-        self.locales = []
-        self.patterns = []
-        self.patterns_example = []
-        self.locales = locale.split(",")
-
-        for locale in self.locales:
-            pattern_dict = PATTERNS.get(locale, None)
-            if pattern_dict is None or pattern_dict["pattern"] is None:
-                raise NotImplementedError(
-                    "Unsupported country code {}. Check that it is a ISO 3166-1 country code or open a PR to require support of this country code.".format(
-                        locale
-                    )
-                )
-            else:
-                self.patterns.append(pattern_dict["pattern"])
-                self.patterns_example.append(pattern_dict["example"])
+        self.locales = locale.split(",") if isinstance(locale, str) else list(locale)
+        self.pattern = postal_code_pattern(tuple(self.locales))
+        self.patterns_example = [PATTERNS[locale]["example"] for locale in self.locales]
 
     def passes(self, attribute, key, dictionary):
-        for pattern in self.patterns:
-            # check that at least one pattern match attribute
-            if re.compile(r"{}".format(pattern)).match(attribute):
-                return True
-        return False
+        return self.country(attribute) is not None
+
+    def country(self, attribute):
+        """Gets the country code of the first locale whose postal code format matches.
+
+        Arguments:
+            attribute {string} -- The postal code
+
+        Returns:
+            string|None
+        """
+        match = self.pattern.match(attribute)
+        return match.lastgroup if match else None
 
     def message(self, attribute):
         return "The {} is not a valid {} postal code. Valid {} {}.".format(
@@ -1077,7 +1781,9 @@ class postal_code(BaseValidation):
         )
 
     def negated_message(self, attribute):
-        return "The {} is a valid {} postal code.".format(attribute, self.locale)
+        return "The {} is a valid {} postal code.".format(
+            attribute, ",".join(self.locales)
+        )
 
 
 class different(BaseValidation):
@@ -1091,6 +1797,9 @@ class different(BaseValidation):
         other_value = dictionary.get(self.other_field, None)
         return attribute != other_value
 
+    def dependencies(self):
+        return [self.other_field]
+
     def message(self, attribute):
         return "The {} value must be different than {} value.".format(
             attribute, self.other_field
@@ -1106,6 +1815,8 @@ class uuid(BaseValidation):
     """The field under validation must be a valid UUID. The UUID version standard
     can be precised (1,3,4,5)."""
 
+    cost = 10
+
     def __init__(self, validations, version=4, messages={}, raises={}):
         super().__init__(validations, messages=messages, raises=raises)
         self.version = version
@@ -1144,6 +1855,9 @@ class required_if(BaseValidation):
 
         return True
 
+    def dependencies(self):
+        return [self.other_field]
+
     def message(self, attribute):
         return "The {} is required because {}={}.".format(
             attribute, self.other_field, self.value
@@ -1176,6 +1890,9 @@ class required_with(BaseValidation):
         else:
             return True
 
+    def dependencies(self):
+        return list(self.other_fields)
+
     def message(self, attribute):
         fields = ",".join(self.other_fields)
         return "The {} is required because {} is present.".format(
@@ -1197,6 +1914,8 @@ class distinct(BaseValidation):
     """When working with list, the field under validation must not have any
     duplicate values."""
 
+    cost = 10
+
     def passes(self, attribute, key, dictionary):
         # check if list contains duplicates
         return len(set(attribute)) == len(attribute)
@@ -1221,74 +1940,233 @@ def flatten(iterable):
     return flat_list
 
 
+@lru_cache(maxsize=1024)
+def parse_rules(definition, many):
+    """Parses a rule definition into (rule class, arguments) pairs.
+
+    Definitions look like 'required|length:1..5' or, when many is False, a single
+    'rule:arguments' string. Results are cached on the raw definition so the same
+    definition is only split once.
+
+    Arguments:
+        definition {string} -- The rule definition
+        many {bool} -- Whether the definition can hold several '|' separated rules
+
+    Returns:
+        tuple -- Tuple of (rule class, arguments tuple) pairs
+    """
+    parsed = []
+    for rule in definition.split("|") if many else [definition]:
+        name, args = rule.split(":")[0], tuple(rule.split(":")[1:])
+        if name == "bail":
+            # a flag for the field rather than a rule, see Validator.parse_dict()
+            continue
+
+        parsed.append((ValidationFactory.registry[name], args))
+
+    return tuple(parsed)
+
+
 class Validator:
+
+    # records rule timings when set, see instrument()
+    instrumentation = None
+
     def __init__(self):
         pass
 
-    def validate(self, dictionary, *rules):
-        rule_errors = {}
-        try:
-            for rule in rules:
-                if isinstance(rule, str):
-                    rule = self.parse_string(rule)
-                    # continue
-                elif isinstance(rule, dict):
-                    rule = self.parse_dict(rule, dictionary, rule_errors)
-                    continue
-
-                elif inspect.isclass(rule) and isinstance(rule(), RuleEnclosure):
-                    rule_errors.update(self.run_enclosure(rule(), dictionary))
-                    continue
-
-                rule.handle(dictionary)
-                for error, message in rule.errors.items():
-                    if error not in rule_errors:
-                        rule_errors.update({error: message})
-                    else:
-                        messages = rule_errors[error]
-                        messages += message
-                        rule_errors.update({error: messages})
-                rule.reset()
-            return MessageBag(rule_errors)
-
-        except Exception as e:
-            e.errors = rule_errors
-            raise e
-
-        return MessageBag(rule_errors)
+    def instrument(self, instrumentation):
+        """Records the timings and outcomes of every rule this validator runs.
+
+        Set Validator.instrumentation instead to record every validator.
+
+        Arguments:
+            instrumentation {Instrumentation|None} -- Where to record, None to stop recording
+
+        Returns:
+            self
+        """
+        self.instrumentation = instrumentation
+        return self
+
+    def validate(
+        self, dictionary, *rules, bail=False, stop_on_first_failure=False, fields=None
+    ):
+        """Validates a dictionary.
+
+        Arguments:
+            dictionary {dict} -- The dictionary to validate
+            rules {mixed} -- Rule objects, strings, dictionaries or rule enclosures
+
+        Keyword Arguments:
+            bail {bool|list} -- Stop checking a field after its first failure, for every field or the given ones (default: {False})
+            stop_on_first_failure {bool} -- Stop validating at the first failure (default: {False})
+            fields {list} -- Only validate these fields (default: {None})
+
+        Returns:
+            MessageBag -- The errors found in the dictionary
+        """
+        return self.compile(
+            *rules, bail=bail, stop_on_first_failure=stop_on_first_failure
+        ).validate(dictionary, fields=fields)
+
+    async def avalidate(
+        self,
+        dictionary,
+        *rules,
+        timeout=None,
+        bail=False,
+        stop_on_first_failure=False,
+        fields=None
+    ):
+        """Validates a dictionary, running I/O bound rules like active_domain concurrently.
+
+        Arguments:
+            dictionary {dict} -- The dictionary to validate
+            rules {mixed} -- Rule objects, strings, dictionaries or rule enclosures
+
+        Keyword Arguments:
+            timeout {float} -- Seconds each I/O bound rule may take (default: {None})
+            bail {bool|list} -- Stop checking a field after its first failure, for every field or the given ones (default: {False})
+            stop_on_first_failure {bool} -- Stop validating at the first failure (default: {False})
+            fields {list} -- Only validate these fields (default: {None})
+
+        Returns:
+            MessageBag -- The errors found in the dictionary
+        """
+        return await self.compile(
+            *rules, bail=bail, stop_on_first_failure=stop_on_first_failure
+        ).avalidate(dictionary, timeout=timeout, fields=fields)
+
+    def validate_many(
+        self,
+        records,
+        *rules,
+        failures_only=False,
+        columnar=False,
+        parallel=False,
+        workers=None,
+        chunk_size=1000,
+        bail=False,
+        stop_on_first_failure=False
+    ):
+        """Validates a list of dictionaries against the same rules.
+
+        The rules are only planned once for the whole batch.
+
+        Arguments:
+            records {iterable} -- The dictionaries to validate
+            rules {mixed} -- Rule objects, strings, dictionaries or rule enclosures
+
+        Keyword Arguments:
+            failures_only {bool} -- Only report the rows which have errors (default: {False})
+            columnar {bool} -- Validate supported rules column by column with NumPy (default: {False})
+            parallel {bool} -- Shard the records across worker processes (default: {False})
+            workers {int} -- The number of worker processes, defaults to the CPU count (default: {None})
+            chunk_size {int} -- The number of records sent to a worker at a time (default: {1000})
+            bail {bool|list} -- Stop checking a field after its first failure, for every field or the given ones (default: {False})
+            stop_on_first_failure {bool} -- Stop validating a record at its first failure (default: {False})
+
+        Returns:
+            dict -- Returns a dictionary of row number to that row's errors
+        """
+        return self.compile(
+            *rules, bail=bail, stop_on_first_failure=stop_on_first_failure
+        ).validate_many(
+            records,
+            failures_only=failures_only,
+            columnar=columnar,
+            parallel=parallel,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
+    def iter_validate(self, records, *rules, bail=False, stop_on_first_failure=False):
+        """Lazily validates an iterable of dictionaries against the same rules.
+
+        Arguments:
+            records {iterable} -- The dictionaries to validate, like read_ndjson() or read_csv()
+            rules {mixed} -- Rule objects, strings, dictionaries or rule enclosures
+
+        Keyword Arguments:
+            bail {bool|list} -- Stop checking a field after its first failure, for every field or the given ones (default: {False})
+            stop_on_first_failure {bool} -- Stop validating a record at its first failure (default: {False})
+
+        Returns:
+            generator -- Yields (row, MessageBag) tuples for the rows which have errors
+        """
+        return self.compile(
+            *rules, bail=bail, stop_on_first_failure=stop_on_first_failure
+        ).iter_validate(records)
+
+    def compile(self, *rules, bail=False, stop_on_first_failure=False, reorder=False):
+        """Plans a set of rules once so they can validate many dictionaries.
+
+        String and dictionary rules are parsed and rule enclosures are expanded
+        here instead of on every validation. Fields whose dictionary definition
+        starts with bail, like 'bail|required|email', bail on their own.
+
+        Arguments:
+            rules {mixed} -- Rule objects, strings, dictionaries or rule enclosures
+
+        Keyword Arguments:
+            bail {bool|list} -- Stop checking a field after its first failure, for every field or the given ones (default: {False})
+            stop_on_first_failure {bool} -- Stop validating at the first failure (default: {False})
+            reorder {bool} -- Run the cheaper rules of each field first when failing fast (default: {False})
+
+        Returns:
+            CompiledSchema
+        """
+        plan = []
+        if bail is True:
+            bailing = set()
+        elif isinstance(bail, str):
+            bailing = {bail}
+        else:
+            bailing = set(bail or ())
+        for rule in rules:
+            if isinstance(rule, str):
+                plan.append(self.parse_string(rule))
+            elif isinstance(rule, dict):
+                plan += self.parse_dict(rule)
+                bailing.update(
+                    field
+                    for field, definition in rule.items()
+                    if "bail" in definition.split("|")
+                )
+            elif isinstance(rule, type) and issubclass(rule, RuleEnclosure):
+                plan += rule().rules()
+            else:
+                plan.append(rule)
+
+        return CompiledSchema(
+            plan,
+            instrumentation=self.instrumentation,
+            bail=True if bail is True else frozenset(bailing),
+            stop_on_first_failure=stop_on_first_failure,
+            reorder=reorder,
+        )
 
     def parse_string(self, rule):
-        rule, parameters = rule.split(":")[0], rule.split(":")[1].split(",")
-        return ValidationFactory().registry[rule](parameters)
-
-    def parse_dict(self, rule, dictionary, rule_errors):
-        for value, rules in rule.items():
-            for rule in rules.split("|"):
-                rule, args = rule.split(":")[0], rule.split(":")[1:]
-                rule = ValidationFactory().registry[rule](value, *args)
-
-            rule.handle(dictionary)
-            for error, message in rule.errors.items():
-                if error not in rule_errors:
-                    rule_errors.update({error: message})
-                else:
-                    messages = rule_errors[error]
-                    messages += message
-                    rule_errors.update({error: messages})
+        rule, args = parse_rules(rule, False)[0]
+        return rule(args[0].split(","))
+
+    def parse_dict(self, rule):
+        rules = []
+        for value, definition in rule.items():
+            for rule, args in parse_rules(definition, True):
+                rules.append(rule(value, *args))
+
+        return rules
+
+    def parse_cache_info(self):
+        """Gets the hits, misses and size of the rule definition parse cache"""
+        return parse_rules.cache_info()
 
     def run_enclosure(self, enclosure, dictionary):
-        rule_errors = {}
-        for rule in enclosure.rules():
-            rule.handle(dictionary)
-            for error, message in rule.errors.items():
-                if error not in rule_errors:
-                    rule_errors.update({error: message})
-                else:
-                    messages = rule_errors[error]
-                    messages += message
-                    rule_errors.update({error: messages})
-            rule.reset()
-        return rule_errors
+        return CompiledSchema(
+            enclosure.rules(), instrumentation=self.instrumentation
+        ).errors(dictionary)
 
     def extend(self, key, obj=None):
         if isinstance(key, dict):
@@ -1301,60 +2179,65 @@ class Validator:
     def register(self, *cls):
         for obj in cls:
             self.__dict__.update({obj.__name__: obj})
-            ValidationFactory().register(obj)
+            ValidationFactory.register(obj)
 
 
 class ValidationFactory:
 
     registry = {}
 
-    def __init__(self):
-        self.register(
-            accepted,
-            active_domain,
-            after_today,
-            before_today,
-            confirmed,
-            contains,
-            date,
-            does_not,
-            different,
-            distinct,
-            equals,
-            email,
-            exists,
-            file,
-            greater_than,
-            image,
-            in_range,
-            is_future,
-            is_in,
-            isnt,
-            is_list,
-            is_past,
-            ip,
-            json,
-            length,
-            less_than,
-            matches,
-            none,
-            numeric,
-            one_of,
-            phone,
-            postal_code,
-            regex,
-            required,
-            required_if,
-            required_with,
-            string,
-            strong,
-            timezone,
-            truthy,
-            uuid,
-            video,
-            when,
-        )
-
-    def register(self, *cls):
-        for obj in cls:
-            self.registry.update({obj.__name__: obj})
+    @classmethod
+    def register(cls, *rules):
+        for obj in rules:
+            cls.registry.update({obj.__name__: obj})
+
+        # parsed definitions hold on to rule classes which may have just been replaced
+        parse_rules.cache_clear()
+
+
+ValidationFactory.register(
+    accepted,
+    active_domain,
+    after_today,
+    before_today,
+    confirmed,
+    contains,
+    date,
+    does_not,
+    different,
+    distinct,
+    each,
+    equals,
+    email,
+    exists,
+    file,
+    greater_than,
+    image,
+    in_range,
+    is_future,
+    is_in,
+    isnt,
+    is_list,
+    is_past,
+    ip,
+    json,
+    length,
+    less_than,
+    matches,
+    none,
+    numeric,
+    one_of,
+    phone,
+    postal_code,
+    regex,
+    required,
+    required_if,
+    required_with,
+    string,
+    strong,
+    timezone,
+    truthy,
+    uuid,
+    video,
+    when,
+)
@@ -1,7 +1,17 @@
 from .RuleEnclosure import RuleEnclosure
 from .MessageBag import MessageBag
+from .CompiledSchema import CompiledSchema
+from .RuleResult import RuleResult
+from .BreachChecker import HashFileBreachChecker, RangeBreachChecker
+from .DependencyGraph import DependencyGraph
+from .DomainResolver import DomainResolver
+from .Instrumentation import Instrumentation
+from .KeyPath import KeyPath, PathLookup
+from .TTLCache import TTLCache
+from .readers import read_csv, read_ndjson
 from .Validator import (
     BaseValidation,
+    Checks,
     ValidationFactory,
     Validator,
     accepted,
@@ -14,6 +24,7 @@ from .Validator import (
     different,
     distinct,
     does_not,
+    each,
     email,
     equals,
     exists,
@@ -34,6 +45,7 @@ from .Validator import (
     numeric,
     phone,
     postal_code,
+    refresh_mimetypes,
     regex,
     required,
     required_if,
@@ -0,0 +1,194 @@
+"""Reads image dimensions and video metadata from file headers without decoding them"""
+
+import struct
+from collections import namedtuple
+
+from .sniffing import open_stream
+
+VideoMetadata = namedtuple("VideoMetadata", ["duration", "width", "height"])
+
+# start of frame markers, the others share the range but describe tables
+JPEG_FRAMES = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# boxes which can start an MP4 or QuickTime file
+MP4_BOXES = (b"ftyp", b"moov", b"mdat", b"free", b"skip", b"wide", b"pnot")
+
+
+def image_size(file):
+    """Gets the width and height of a PNG, JPEG, GIF, WebP or BMP image.
+
+    Only the header is read, JPEG images skip from segment to segment until
+    the frame header so the pixel data is never loaded.
+
+    Arguments:
+        file {string|FieldStorage|file} -- A path, an uploaded file or a seekable binary stream
+
+    Returns:
+        tuple|None -- (width, height) or None when the size can not be read
+    """
+    with open_stream(file) as stream:
+        header = stream.read(32)
+        if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+            return struct.unpack(">II", header[16:24])
+
+        if header[:6] in (b"GIF87a", b"GIF89a") and len(header) >= 10:
+            return struct.unpack("<HH", header[6:10])
+
+        if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+            return webp_size(header)
+
+        if header.startswith(b"BM") and len(header) >= 26:
+            if struct.unpack("<I", header[14:18])[0] == 12:
+                return struct.unpack("<HH", header[18:22])
+
+            width, height = struct.unpack("<ii", header[18:26])
+            # bottom up bitmaps store a negative height
+            return width, abs(height)
+
+        if header.startswith(b"\xff\xd8"):
+            stream.seek(2)
+            return jpeg_size(stream)
+
+    return None
+
+
+def webp_size(header):
+    chunk = header[12:16]
+    if chunk == b"VP8X" and len(header) >= 30:
+        return (
+            int.from_bytes(header[24:27], "little") + 1,
+            int.from_bytes(header[27:30], "little") + 1,
+        )
+
+    if chunk == b"VP8 " and header[23:26] == b"\x9d\x01\x2a" and len(header) >= 30:
+        width, height = struct.unpack("<HH", header[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+
+    if chunk == b"VP8L" and header[20:21] == b"\x2f" and len(header) >= 25:
+        bits = int.from_bytes(header[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+
+    return None
+
+
+def jpeg_size(stream):
+    while True:
+        if stream.read(1) != b"\xff":
+            return None
+
+        marker = stream.read(1)
+        while marker == b"\xff":
+            # markers may be padded with fill bytes
+            marker = stream.read(1)
+
+        if not marker:
+            return None
+
+        code = marker[0]
+        if code == 0x01 or 0xD0 <= code <= 0xD8:
+            # markers without a segment
+            continue
+
+        if code in (0xD9, 0xDA):
+            # the image data starts without a frame header
+            return None
+
+        length = stream.read(2)
+        if len(length) < 2:
+            return None
+
+        if code in JPEG_FRAMES:
+            frame = stream.read(5)
+            if len(frame) < 5:
+                return None
+
+            height, width = struct.unpack(">HH", frame[1:5])
+            return width, height
+
+        stream.seek(struct.unpack(">H", length)[0] - 2, 1)
+
+
+def video_metadata(file):
+    """Gets the duration and resolution of an MP4 or QuickTime video.
+
+    Only the boxes leading to the movie header and the track headers are read,
+    the media data is skipped over with seeks.
+
+    Arguments:
+        file {string|FieldStorage|file} -- A path, an uploaded file or a seekable binary stream
+
+    Returns:
+        VideoMetadata|None -- The duration in seconds and the largest track width and height
+    """
+    with open_stream(file) as stream:
+        if stream.read(8)[4:8] not in MP4_BOXES:
+            return None
+
+        stream.seek(0, 2)
+        end = stream.tell()
+        for kind, start, stop in boxes(stream, 0, end):
+            if kind == b"moov":
+                return movie_metadata(stream, start, stop)
+
+    return None
+
+
+def movie_metadata(stream, start, stop):
+    duration, width, height = None, 0, 0
+    for kind, box_start, box_stop in boxes(stream, start, stop):
+        if kind == b"mvhd":
+            stream.seek(box_start)
+            duration = movie_duration(stream.read(32))
+        elif kind == b"trak":
+            for child, child_start, child_stop in boxes(stream, box_start, box_stop):
+                if child == b"tkhd" and child_stop - child_start >= 84:
+                    # the track size is stored as 16.16 fixed point at the end
+                    stream.seek(child_stop - 8)
+                    track_width, track_height = struct.unpack(">II", stream.read(8))
+                    width = max(width, track_width >> 16)
+                    height = max(height, track_height >> 16)
+
+    return VideoMetadata(duration, width, height)
+
+
+def movie_duration(header):
+    if header[:1] == b"\x01" and len(header) >= 32:
+        timescale, duration = struct.unpack(">IQ", header[20:32])
+        unknown = 0xFFFFFFFFFFFFFFFF
+    elif len(header) >= 20:
+        timescale, duration = struct.unpack(">II", header[12:20])
+        unknown = 0xFFFFFFFF
+    else:
+        return None
+
+    if not timescale or duration == unknown:
+        return None
+
+    return duration / timescale
+
+
+def boxes(stream, start, end):
+    """Iterates over the (type, content start, content end) of the boxes between two offsets"""
+    position = start
+    while position + 8 <= end:
+        stream.seek(position)
+        header = stream.read(8)
+        if len(header) < 8:
+            return
+
+        size, kind = struct.unpack(">I4s", header)
+        offset = 8
+        if size == 1:
+            large = stream.read(8)
+            if len(large) < 8:
+                return
+            size, offset = struct.unpack(">Q", large)[0], 16
+        elif size == 0:
+            # the last box runs to the end of the file
+            size = end - position
+
+        if size < offset:
+            return
+
+        yield kind, position + offset, min(position + size, end)
+        position += size
@@ -0,0 +1,66 @@
+"""Readers which stream records from files one row at a time"""
+
+import json
+
+
+def read_ndjson(source, encoding="utf-8"):
+    """Reads a newline delimited JSON file one record at a time.
+
+    Blank lines are skipped and the file is closed once the generator is exhausted.
+
+    Arguments:
+        source {string|file} -- A path or an open text file
+
+    Keyword Arguments:
+        encoding {string} -- The encoding used to open a path (default: {"utf-8"})
+
+    Raises:
+        ValueError: When a line is not valid JSON
+
+    Returns:
+        generator -- Yields a dictionary for each line
+    """
+    lines, close = _open(source, encoding)
+    try:
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                raise ValueError("Line {} is not valid JSON: {}".format(number, e))
+    finally:
+        if close:
+            lines.close()
+
+
+def read_csv(source, encoding="utf-8", **options):
+    """Reads a CSV file with a header row one record at a time.
+
+    Arguments:
+        source {string|file} -- A path or an open text file
+
+    Keyword Arguments:
+        encoding {string} -- The encoding used to open a path (default: {"utf-8"})
+        options {mixed} -- Passed on to csv.DictReader like delimiter or fieldnames
+
+    Returns:
+        generator -- Yields a dictionary of column name to string value for each row
+    """
+    import csv
+
+    lines, close = _open(source, encoding, newline="")
+    try:
+        for record in csv.DictReader(lines, **options):
+            yield dict(record)
+    finally:
+        if close:
+            lines.close()
+
+
+def _open(source, encoding, newline=None):
+    if hasattr(source, "read"):
+        return source, False
+
+    return open(source, encoding=encoding, newline=newline), True
@@ -0,0 +1,48 @@
+# Magic bytes of common upload formats.
+#
+# Every signature is (conditions, extension, mimetype). A condition is an
+# (offset, bytes) pair which must all be found in the header, an offset of None
+# means anywhere in the header. More specific signatures come first. The
+# mimetype is only used when the mimetypes module does not know the extension.
+SIGNATURES = [
+    # images
+    (((0, b"\x89PNG\r\n\x1a\n"),), ".png", "image/png"),
+    (((0, b"\xff\xd8\xff"),), ".jpg", "image/jpeg"),
+    (((0, b"GIF87a"),), ".gif", "image/gif"),
+    (((0, b"GIF89a"),), ".gif", "image/gif"),
+    (((0, b"RIFF"), (8, b"WEBP")), ".webp", "image/webp"),
+    (((0, b"II*\x00"),), ".tiff", "image/tiff"),
+    (((0, b"MM\x00*"),), ".tiff", "image/tiff"),
+    (((0, b"BM"),), ".bmp", "image/bmp"),
+    (((0, b"\x00\x00\x01\x00"),), ".ico", "image/vnd.microsoft.icon"),
+    (((0, b"8BPS"),), ".psd", "image/vnd.adobe.photoshop"),
+    (((4, b"ftypavif"),), ".avif", "image/avif"),
+    (((4, b"ftypheic"),), ".heic", "image/heic"),
+    # videos
+    (((4, b"ftypqt  "),), ".mov", "video/quicktime"),
+    (((4, b"ftyp3g"),), ".3gp", "video/3gpp"),
+    (((4, b"ftypM4V"),), ".m4v", "video/mp4"),
+    (((4, b"ftyp"),), ".mp4", "video/mp4"),
+    (((4, b"moov"),), ".mov", "video/quicktime"),
+    (((0, b"\x1a\x45\xdf\xa3"), (None, b"webm")), ".webm", "video/webm"),
+    (((0, b"\x1a\x45\xdf\xa3"),), ".mkv", "video/x-matroska"),
+    (((0, b"RIFF"), (8, b"AVI ")), ".avi", "video/x-msvideo"),
+    (((0, b"\x00\x00\x01\xba"),), ".mpeg", "video/mpeg"),
+    (((0, b"\x00\x00\x01\xb3"),), ".mpeg", "video/mpeg"),
+    (((0, b"OggS"), (None, b"theora")), ".ogv", "video/ogg"),
+    (((0, b"FLV\x01"),), ".flv", "video/x-flv"),
+    # audio
+    (((0, b"RIFF"), (8, b"WAVE")), ".wav", "audio/x-wav"),
+    (((0, b"ID3"),), ".mp3", "audio/mpeg"),
+    (((0, b"OggS"),), ".ogg", "audio/ogg"),
+    (((0, b"fLaC"),), ".flac", "audio/flac"),
+    # documents and archives
+    (((0, b"%PDF-"),), ".pdf", "application/pdf"),
+    (((0, b"PK\x03\x04"),), ".zip", "application/zip"),
+    (((0, b"\x1f\x8b"),), ".gz", "application/gzip"),
+    (((0, b"7z\xbc\xaf\x27\x1c"),), ".7z", "application/x-7z-compressed"),
+    (((0, b"Rar!\x1a\x07"),), ".rar", "application/vnd.rar"),
+]
+
+# bytes read from the start of a file, enough for every signature above
+HEADER_SIZE = 512
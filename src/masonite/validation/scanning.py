@@ -0,0 +1,78 @@
+"""Reads a file's content once to get its size, digest and forbidden signatures"""
+
+from collections import namedtuple
+
+from .sniffing import open_stream
+
+FileScan = namedtuple("FileScan", ["size", "digest", "forbidden"])
+
+# bytes read at a time from uploads and streams
+CHUNK_SIZE = 64 * 1024
+
+
+def scan_file(file, algorithm=None, forbidden=(), chunk_size=CHUNK_SIZE):
+    """Reads a file in a single pass computing everything content rules need.
+
+    Paths are memory mapped so the digest and searches run over the file
+    without copying it, uploads and streams are read with a fixed size buffer.
+
+    Arguments:
+        file {string|FieldStorage|file} -- A path, an uploaded file or a seekable binary stream
+
+    Keyword Arguments:
+        algorithm {string} -- A hashlib algorithm like md5 or sha256 (default: {None})
+        forbidden {iterable} -- Byte strings the file must not contain (default: {()})
+        chunk_size {int} -- The buffer size used for streams (default: {65536})
+
+    Returns:
+        FileScan -- The size, hex digest and the first forbidden byte string found
+    """
+    hasher = None
+    if algorithm:
+        import hashlib
+
+        hasher = hashlib.new(algorithm)
+
+    forbidden = tuple(forbidden)
+    if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+        size, found = _scan_path(file, hasher, forbidden)
+    else:
+        size, found = _scan_stream(file, hasher, forbidden, chunk_size)
+
+    return FileScan(size, hasher.hexdigest() if hasher else None, found)
+
+
+def _scan_path(path, hasher, forbidden):
+    import mmap
+
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can not be mapped
+            return 0, None
+
+        with data:
+            if hasher:
+                hasher.update(data)
+
+            found = next((item for item in forbidden if data.find(item) != -1), None)
+            return len(data), found
+
+
+def _scan_stream(file, hasher, forbidden, chunk_size):
+    # keep the end of the previous chunk so signatures split across two are found
+    overlap = max((len(item) for item in forbidden), default=1) - 1
+    size, found, tail = 0, None, b""
+    with open_stream(file) as stream:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            size += len(chunk)
+            if hasher:
+                hasher.update(chunk)
+
+            if forbidden and found is None:
+                window = tail + chunk
+                found = next((item for item in forbidden if item in window), None)
+                tail = window[-overlap:] if overlap else b""
+
+    return size, found
@@ -0,0 +1,75 @@
+"""Detects the type of a file from its first bytes instead of its name"""
+
+from contextlib import contextmanager
+
+
+def read_header(file, size=None):
+    """Reads the first bytes of a file without moving its stream position.
+
+    Arguments:
+        file {string|FieldStorage|file} -- A path, an uploaded file or a seekable binary stream
+
+    Keyword Arguments:
+        size {int} -- How many bytes to read, defaults to enough for every known signature (default: {None})
+
+    Returns:
+        bytes
+    """
+    if size is None:
+        from .resources.file_signatures import HEADER_SIZE
+
+        size = HEADER_SIZE
+
+    with open_stream(file) as stream:
+        return stream.read(size)
+
+
+@contextmanager
+def open_stream(file):
+    """Opens a file as a binary stream positioned at its start.
+
+    Paths are closed afterwards and the position of uploads and streams is
+    restored so other code reading them is not affected.
+
+    Arguments:
+        file {string|FieldStorage|file} -- A path, an uploaded file or a seekable binary stream
+    """
+    if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+        with open(file, "rb") as stream:
+            yield stream
+        return
+
+    # uploads keep their content in a file attribute
+    stream = getattr(file, "file", None) or file
+    position = stream.tell()
+    try:
+        stream.seek(0)
+        yield stream
+    finally:
+        stream.seek(position)
+
+
+def sniff_mimetype(header):
+    """Gets the mimetype of the format whose magic bytes the header starts with.
+
+    Arguments:
+        header {bytes} -- The first bytes of a file
+
+    Returns:
+        string|None -- The mimetype or None when the format is not known
+    """
+    import mimetypes
+
+    from .resources.file_signatures import SIGNATURES
+
+    for conditions, extension, mimetype in SIGNATURES:
+        for offset, magic in conditions:
+            if offset is None:
+                if magic not in header:
+                    break
+            elif not header.startswith(magic, offset):
+                break
+        else:
+            return mimetypes.types_map.get(extension, mimetype)
+
+    return None
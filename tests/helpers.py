@@ -0,0 +1,30 @@
+from src.masonite.validation import BaseValidation
+
+
+class Clock:
+    """A timer which only moves when told to, or by step on every call"""
+
+    def __init__(self, step=0):
+        self.now = 0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class counting(BaseValidation):
+    """Records the keys it checks so tests can see which rules ran"""
+
+    def __init__(self, validations, calls, io_bound=False, cost=1):
+        super().__init__(validations)
+        self.calls = calls
+        self.io_bound = io_bound
+        self.cost = cost
+
+    def passes(self, attribute, key, dictionary):
+        self.calls.append(key)
+        return attribute != "bad"
+
+    def message(self, attribute):
+        return "The {} is bad.".format(attribute)
@@ -0,0 +1,53 @@
+import io
+import unittest
+
+from benchmarks import cases
+from benchmarks.run import compare, format_time, measure, run
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_every_case_runs(self):
+        try:
+            for name, setup in cases.CASES:
+                with self.subTest(case=name):
+                    setup()()
+        finally:
+            cases.cleanup()
+
+    def test_measure(self):
+        result = measure(lambda: None, samples=3, min_time=0.001)
+
+        self.assertEqual(sorted(result), ["loops", "median", "min", "stdev"])
+        self.assertGreaterEqual(result["median"], result["min"])
+
+    def test_run_reports_each_case(self):
+        output = io.StringIO()
+        results = run(
+            [("noop", lambda: lambda: None)], samples=2, min_time=0.001, output=output
+        )
+
+        self.assertEqual(list(results), ["noop"])
+        self.assertTrue(output.getvalue().startswith("noop "))
+
+    def test_compare_flags_regressions(self):
+        baseline = {"fast": {"median": 1.0}, "slow": {"median": 1.0}}
+        results = {
+            "fast": {"median": 1.1},
+            "slow": {"median": 1.5},
+            "new": {"median": 2.0},
+        }
+
+        self.assertEqual(
+            compare(results, baseline, threshold=0.2),
+            [
+                ("fast", 1.0, 1.1, 1.1, False),
+                ("new", None, 2.0, None, False),
+                ("slow", 1.0, 1.5, 1.5, True),
+            ],
+        )
+
+    def test_format_time(self):
+        self.assertEqual(format_time(2.5), "2.50 s")
+        self.assertEqual(format_time(0.0125), "12.50 ms")
+        self.assertEqual(format_time(0.0000031), "3.10 us")
+        self.assertEqual(format_time(0.00000004), "40 ns")
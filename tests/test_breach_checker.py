@@ -0,0 +1,111 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import unittest
+
+from src.masonite.validation import (
+    HashFileBreachChecker,
+    RangeBreachChecker,
+    Validator,
+    strong,
+)
+
+
+def sha1(password):
+    return hashlib.sha1(password.encode("utf-8")).hexdigest().upper()
+
+
+class FakeRangeAPI:
+    def __init__(self, *passwords):
+        self.ranges = {}
+        for password in passwords:
+            digest = sha1(password)
+            self.ranges.setdefault(digest[:5], []).append(digest[5:] + ":3")
+        self.requests = []
+
+    def __call__(self, prefix):
+        self.requests.append(prefix)
+        # padded responses contain suffixes with a count of 0
+        return "\r\n".join(self.ranges.get(prefix, []) + ["0" * 35 + ":0"])
+
+
+class TestRangeBreachChecker(unittest.TestCase):
+    def test_breached_passwords(self):
+        api = FakeRangeAPI("secret")
+        checker = RangeBreachChecker(fetch=api)
+
+        self.assertTrue(checker("secret"))
+        self.assertFalse(checker("S3cr3t!!Horse"))
+
+    def test_ranges_are_cached(self):
+        api = FakeRangeAPI("secret")
+        checker = RangeBreachChecker(fetch=api)
+
+        checker("secret")
+        checker("secret")
+
+        self.assertEqual(api.requests, [sha1("secret")[:5]])
+        self.assertEqual(checker.cache_info().hits, 1)
+
+    def test_strong_uses_the_given_checker(self):
+        checker = RangeBreachChecker(fetch=FakeRangeAPI("SeCr3t!!AB12"))
+        rule = strong(["password"], breach=checker)
+
+        errors = Validator().validate({"password": "SeCr3t!!AB12"}, rule)
+
+        self.assertTrue(rule.io_bound)
+        self.assertEqual(
+            errors.get("password"),
+            ["The password field has been breached in the past. Try another password"],
+        )
+
+
+class TestHashFileBreachChecker(unittest.TestCase):
+    def setUp(self):
+        passwords = ["secret", "password", "123456", "letmein", "qwerty"]
+        handle, self.path = tempfile.mkstemp()
+        with os.fdopen(handle, "w") as f:
+            for digest in sorted(sha1(password) for password in passwords):
+                f.write("{}:{}\r\n".format(digest, len(digest)))
+
+        self.checker = HashFileBreachChecker(self.path)
+
+    def tearDown(self):
+        self.checker.close()
+        os.remove(self.path)
+
+    def test_finds_every_hash(self):
+        for password in ["secret", "password", "123456", "letmein", "qwerty"]:
+            self.assertTrue(self.checker(password), password)
+
+        for password in ["", "Secret", "correct horse battery staple"]:
+            self.assertFalse(self.checker(password), password)
+
+    def test_lowercase_digest(self):
+        self.assertTrue(self.checker.contains(sha1("qwerty").lower()))
+
+    def test_empty_file(self):
+        with open(self.path, "w"):
+            pass
+
+        self.assertFalse(HashFileBreachChecker(self.path)("secret"))
+
+    def test_can_be_pickled(self):
+        self.checker("secret")
+
+        checker = pickle.loads(pickle.dumps(self.checker))
+
+        self.assertTrue(checker("secret"))
+        checker.close()
+
+    def test_strong_offline(self):
+        rule = strong(["password"], breach=self.checker)
+
+        errors = Validator().validate({"password": "letmein"}, rule)
+
+        self.assertFalse(rule.io_bound)
+        self.assertIn(
+            "The password field has been breached in the past. Try another password",
+            errors.get("password"),
+        )
@@ -0,0 +1,106 @@
+import random
+import unittest
+
+import pytest
+
+from src.masonite.validation import (
+    Validator,
+    equals,
+    greater_than,
+    in_range,
+    is_in,
+    isnt,
+    length,
+    numeric,
+    required,
+)
+from src.masonite.validation.Validator import less_than, truthy
+
+numpy = pytest.importorskip("numpy")
+
+
+class TestColumnarEngine(unittest.TestCase):
+    def assertSameReport(self, records, *rules, failures_only=False):
+        schema = Validator().compile(*rules)
+        self.assertEqual(
+            schema.validate_many(records, failures_only=failures_only, columnar=True),
+            schema.validate_many(records, failures_only=failures_only),
+        )
+
+    def test_numeric_columns_match_row_validation(self):
+        values = [0, 1, 25, -3, 2 ** 70, 0.0, -0.0, 1.5, 1e-05, 0.0001, 1e16]
+        values += [9999999999999998.0, float("nan"), float("inf"), "12", "1.5"]
+        values += ["1.5.5", "-1", "", "abc"]
+        for column in (values[:5], values[5:13], values[13:], values):
+            records = [{"value": value} for value in column]
+            self.assertSameReport(
+                records,
+                numeric(["value"]),
+                truthy(["value"]),
+                length(["value"], min=2, max=3),
+            )
+
+    def test_comparison_rules_match_row_validation(self):
+        random.seed(4)
+        records = [
+            {"age": random.randint(0, 120), "score": random.random() * 100}
+            for _ in range(500)
+        ]
+
+        self.assertSameReport(
+            records,
+            in_range(["age"], min=18, max=65),
+            in_range(["score"], min=10, max=20.5),
+            greater_than(["age"], 21),
+            less_than(["score"], 50),
+            equals(["age"], 30),
+            is_in(["age"], [1, 2, 3, 40.0]),
+            isnt(in_range(["age"], min=0, max=10)),
+        )
+
+    def test_string_columns_match_row_validation(self):
+        records = [
+            {"name": name, "role": role}
+            for name, role in [("Joe", "admin"), ("", "user"), ("Bobby", "guest")]
+        ]
+
+        self.assertSameReport(
+            records,
+            length(["name"], min=1, max=3),
+            is_in(["role"], ["admin", "user"]),
+            is_in(["name"], "ob"),
+            equals(["role"], "admin", messages={"role": "Only admins"}),
+            greater_than(["name"], "B"),
+            required(["name"]),
+        )
+
+    def test_failures_only(self):
+        records = [{"age": 20}, {"age": "x"}, {"age": 5}]
+
+        report = Validator().validate_many(
+            records, numeric(["age"]), failures_only=True, columnar=True
+        )
+
+        self.assertEqual(report, {1: {"age": ["The age must be a numeric."]}})
+
+    def test_masks(self):
+        from src.masonite.validation.ColumnarEngine import ColumnarEngine
+
+        schema = Validator().compile(required(["age"]), numeric(["age"]))
+
+        masks = ColumnarEngine(schema).masks([{"age": 1}, {"age": "x"}, {}])
+
+        self.assertEqual(len(masks), 1)
+        rule, key, mask = masks[0]
+        self.assertEqual(key, "age")
+        self.assertEqual(mask.tolist(), [False, True, True])
+
+    def test_errors_are_raised_like_row_validation(self):
+        records = [{"age": 30}, {"age": -4}]
+
+        with self.assertRaises(TypeError) as e:
+            Validator().validate_many(
+                records, in_range(["age"], min=1, max=50), columnar=True
+            )
+
+        self.assertEqual(e.exception.row, 1)
@@ -0,0 +1,239 @@
+import asyncio
+import unittest
+
+from src.masonite.validation import (
+    DependencyGraph,
+    Validator,
+    active_domain,
+    confirmed,
+    different,
+    each,
+    email,
+    exists,
+    isnt,
+    is_in,
+    required,
+    required_if,
+    required_with,
+    when,
+)
+from src.masonite.validation.DependencyGraph import overlaps
+from src.masonite.validation.Validator import matches, one_of
+from tests.helpers import counting
+
+
+def signup():
+    return Validator().compile(
+        {"email": "required|email", "password": "required"},
+        confirmed(["password"]),
+        required_if(["vat"], "type", "company"),
+        when(exists(["company"])).then(required(["company_id"])),
+        different(["backup_email"], "email"),
+        each(required(["users.*.email"])),
+    )
+
+
+class TestDependencyGraph(unittest.TestCase):
+    def test_rules_report_the_fields_they_read(self):
+        self.assertEqual(required(["a", "b"]).dependencies(), [])
+        self.assertEqual(matches(["a"], "b").dependencies(), ["b"])
+        self.assertEqual(different(["a"], "b").dependencies(), ["b"])
+        self.assertEqual(required_if(["a"], "b", 1).dependencies(), ["b"])
+        self.assertEqual(required_with(["a"], "b,c").dependencies(), ["b", "c"])
+        self.assertEqual(confirmed(["a"]).dependencies(), ["a_confirmation"])
+        self.assertEqual(one_of(["a", "b"]).dependencies(), ["a", "b"])
+
+    def test_rules_made_of_other_rules(self):
+        rule = when(isnt(is_in(["country"], ["FR"]))).then(
+            matches(["reason"], "other")
+        )
+
+        self.assertEqual(rule.checked_fields(), ["reason"])
+        self.assertEqual(rule.dependencies(), ["country", "other"])
+        self.assertEqual(isnt(matches(["a"], "b")).checked_fields(), ["a"])
+        self.assertEqual(each(matches(["a.*"], "b")).dependencies(), ["b"])
+
+    def test_graph(self):
+        graph = DependencyGraph(
+            [
+                required(["a", "b"]),
+                matches(["a"], "c"),
+                when(exists(["d"])).then(required(["b"])),
+            ]
+        )
+
+        self.assertEqual(graph.fields(), ["a", "c", "b", "d"])
+        self.assertEqual(graph.dependencies("a"), ["c"])
+        self.assertEqual(graph.dependencies("b"), ["d"])
+        self.assertEqual(graph.affected("c"), ["a"])
+        self.assertEqual(graph.affected(["a", "d"]), ["a", "b"])
+        self.assertEqual(graph.rules_for("b"), [0, 2])
+
+    def test_cycles(self):
+        graph = DependencyGraph([matches(["a"], "b"), matches(["b"], "a")])
+
+        self.assertEqual(graph.affected("a"), ["a", "b"])
+        self.assertEqual(graph.dependencies("b"), ["a"])
+
+    def test_overlaps(self):
+        self.assertTrue(overlaps("users", "users.0.email"))
+        self.assertTrue(overlaps("users.*.email", "users.3"))
+        self.assertTrue(overlaps("users.*.email", "users.3.email"))
+        self.assertFalse(overlaps("users.*.email", "users.3.name"))
+        self.assertFalse(overlaps("user", "users"))
+
+
+class TestSchemaDependencies(unittest.TestCase):
+    def test_dependencies(self):
+        schema = signup()
+
+        self.assertEqual(
+            schema.dependencies(),
+            [
+                "email",
+                "password",
+                "password_confirmation",
+                "vat",
+                "type",
+                "company_id",
+                "company",
+                "backup_email",
+                "users.*.email",
+            ],
+        )
+        self.assertEqual(schema.dependencies("company_id"), ["company"])
+
+    def test_affected(self):
+        schema = signup()
+
+        self.assertEqual(schema.affected("email"), ["email", "backup_email"])
+        self.assertEqual(schema.affected("password_confirmation"), ["password"])
+        self.assertEqual(schema.affected("users.3.email"), ["users.*.email"])
+        self.assertEqual(schema.affected("unknown"), [])
+
+    def test_affected_with_stop_on_first_failure(self):
+        schema = Validator().compile(
+            required(["a"]), required(["b"]), stop_on_first_failure=True
+        )
+
+        self.assertEqual(schema.affected("b"), ["a", "b"])
+
+
+class TestPartialValidation(unittest.TestCase):
+    def setUp(self):
+        self.data = {
+            "email": "bad",
+            "type": "company",
+            "password": "secret",
+            "users": [{"email": ""}],
+        }
+
+    def test_only_the_given_fields_are_reported(self):
+        schema = signup()
+
+        self.assertEqual(
+            schema.errors(self.data, fields=["email", "vat"]),
+            {
+                "email": ["The email must be a valid email address."],
+                "vat": ["The vat is required because type=company."],
+            },
+        )
+        self.assertEqual(
+            schema.errors(self.data, fields="users"),
+            {"users.0.email": ["The users.0.email field is required."]},
+        )
+
+    def test_matches_full_validation(self):
+        schema = signup()
+        errors = schema.errors(self.data)
+
+        for field in schema.dependencies():
+            with self.subTest(field=field):
+                self.assertEqual(
+                    schema.errors(self.data, fields=[field]),
+                    {
+                        key: messages
+                        for key, messages in errors.items()
+                        if overlaps(key, field)
+                    },
+                )
+
+    def test_other_rules_and_keys_do_not_run(self):
+        calls = []
+        schema = Validator().compile(
+            counting(["a", "b"], calls), counting(["c"], calls)
+        )
+
+        self.assertEqual(
+            schema.validate({"a": "bad", "b": "bad"}, fields=["b"]).all(),
+            {"b": ["The b is bad."]},
+        )
+        self.assertEqual(calls, ["b"])
+
+    def test_guards_still_read_other_fields(self):
+        schema = signup()
+
+        self.assertEqual(schema.errors({}, fields="company_id"), {})
+        self.assertEqual(
+            schema.errors({"company": "Acme"}, fields="company_id"),
+            {"company_id": ["The company_id field is required."]},
+        )
+        self.assertEqual(len(schema._partials[("company_id",)]), 1)
+
+    def test_partial_plans_are_reused(self):
+        schema = signup()
+        schema.errors(self.data, fields=["email"])
+        plan = schema._partials[("email",)]
+        schema.errors(self.data, fields=["email"])
+
+        self.assertIs(schema._partials[("email",)], plan)
+        self.assertEqual(len(plan), 2)
+
+    def test_raised_errors_only_keep_the_given_fields(self):
+        schema = Validator().compile(
+            when(exists(["a"])).then(required(["b"]), required(["c"])),
+            required(["d"], raises=True),
+        )
+
+        with self.assertRaises(ValueError) as e:
+            schema.errors({"a": 1}, fields=["b", "d"])
+
+        self.assertEqual(e.exception.errors, {"b": ["The b field is required."]})
+
+    def test_validator_and_async(self):
+        self.assertEqual(
+            Validator()
+            .validate({}, required(["a", "b"]), email(["a"]), fields=["b"])
+            .all(),
+            {"b": ["The b field is required."]},
+        )
+        self.assertEqual(
+            asyncio.get_event_loop()
+            .run_until_complete(
+                Validator().avalidate({}, required(["a", "b"]), fields=["a"])
+            )
+            .all(),
+            {"a": ["The a field is required."]},
+        )
+
+    def test_async_lookups_only_run_for_the_given_fields(self):
+        domains = []
+
+        def resolver(domain):
+            domains.append(domain)
+            return False
+
+        schema = Validator().compile(
+            active_domain(["email", "backup"], resolver=resolver)
+        )
+        data = {"email": "joe@x.com", "backup": "joe@y.com"}
+        errors = asyncio.get_event_loop().run_until_complete(
+            schema.avalidate(data, fields=["email"])
+        )
+
+        self.assertEqual(domains, ["x.com"])
+        self.assertEqual(
+            errors.all(), {"email": ["The email must be an active domain name."]}
+        )
+        self.assertEqual(schema.validate(data, fields=["email"]).all(), errors.all())
+        self.assertEqual(domains, ["x.com", "x.com"])
@@ -0,0 +1,72 @@
+import unittest
+
+from src.masonite.validation import DomainResolver, Validator, active_domain
+from tests.helpers import Clock
+
+
+class FakeDNS:
+    def __init__(self, records):
+        self.records = records
+        self.lookups = []
+
+    def __call__(self, domain):
+        self.lookups.append(domain)
+        return self.records.get(domain, False)
+
+
+class TestDomainResolver(unittest.TestCase):
+    def setUp(self):
+        self.dns = FakeDNS({"gmail.com": "142.250.1.1"})
+        self.clock = Clock()
+        self.resolver = DomainResolver(
+            resolve=self.dns, ttl=300, negative_ttl=60, timer=self.clock
+        )
+
+    def test_positive_answers_are_cached(self):
+        self.assertEqual(self.resolver("gmail.com"), "142.250.1.1")
+        self.assertEqual(self.resolver("Gmail.com"), "142.250.1.1")
+        self.assertEqual(self.dns.lookups, ["gmail.com"])
+
+        self.clock.now = 300
+        self.resolver("gmail.com")
+        self.assertEqual(len(self.dns.lookups), 2)
+
+    def test_negative_answers_use_their_own_ttl(self):
+        self.assertFalse(self.resolver("nope.example"))
+        self.clock.now = 59
+        self.assertFalse(self.resolver("nope.example"))
+        self.assertEqual(len(self.dns.lookups), 1)
+
+        self.clock.now = 60
+        self.resolver("nope.example")
+        self.assertEqual(len(self.dns.lookups), 2)
+
+    def test_cache_info(self):
+        self.resolver("gmail.com")
+        self.resolver("gmail.com")
+
+        self.assertEqual(self.resolver.cache_info().hits, 1)
+        self.assertEqual(self.resolver.cache_info().misses, 1)
+
+    def test_active_domain_uses_resolver(self):
+        errors = Validator().validate(
+            {"email": "joe@gmail.com", "website": "https://www.nope.example"},
+            active_domain(["email", "website"], resolver=self.resolver),
+        )
+
+        self.assertEqual(
+            errors.all(), {"website": ["The website must be an active domain name."]}
+        )
+        self.assertEqual(self.dns.lookups, ["gmail.com", "nope.example"])
+
+    def test_active_domain_default_resolver_can_be_replaced(self):
+        default = active_domain.resolver
+        active_domain.resolver = self.resolver
+        try:
+            errors = Validator().validate(
+                {"email": "joe@gmail.com"}, {"email": "active_domain"}
+            )
+        finally:
+            active_domain.resolver = default
+
+        self.assertFalse(errors.any())
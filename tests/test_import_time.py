@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the masonite framework is loaded by the application before this package
+PRELOAD = "import masonite.response"
+
+# modules only some rules need which must not be imported up front
+DEFERRED = [
+    "asyncio",
+    "cgi",
+    "concurrent.futures",
+    "csv",
+    "hashlib",
+    "numpy",
+    "pendulum",
+    "pytz",
+    "requests",
+]
+
+# cold import of the package on top of the framework, in seconds
+BUDGET = 0.05
+
+
+def run(code, *options):
+    env = dict(os.environ)
+    # measure imports with cached bytecode like a deployed application would
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run(
+        [sys.executable] + list(options) + ["-c", code],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+
+class TestImportTime(unittest.TestCase):
+    def test_heavy_modules_are_imported_on_first_use(self):
+        process = run(
+            "import sys\n{}\nbefore = set(sys.modules)\n"
+            "import src.masonite.validation\n"
+            "print('\\n'.join(set(sys.modules) - before))".format(PRELOAD)
+        )
+
+        imported = set(process.stdout.split())
+        self.assertEqual([name for name in DEFERRED if name in imported], [])
+
+    @unittest.skipIf(sys.version_info < (3, 7), "-X importtime requires Python 3.7")
+    def test_import_time_budget(self):
+        code = "{}\nimport src.masonite.validation".format(PRELOAD)
+        run(code)
+
+        timings = []
+        for _ in range(3):
+            timings.append(self.import_time(run(code, "-X", "importtime").stderr))
+            if timings[-1] <= BUDGET:
+                break
+
+        self.assertLessEqual(
+            min(timings),
+            BUDGET,
+            "Importing masonite.validation took {:.3f}s, the budget is {}s".format(
+                min(timings), BUDGET
+            ),
+        )
+
+    def import_time(self, report):
+        for line in report.splitlines():
+            # import time: self [us] | cumulative | imported package
+            columns = line.split("|")
+            if len(columns) == 3 and columns[2].strip() == "src.masonite.validation":
+                return int(columns[1]) / 1000000
+
+        self.fail("src.masonite.validation is missing from the import time report")
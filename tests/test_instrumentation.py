@@ -0,0 +1,182 @@
+import asyncio
+import os
+import pickle
+import tempfile
+import unittest
+
+from src.masonite.validation import (
+    Instrumentation,
+    Validator,
+    active_domain,
+    isnt,
+    is_in,
+    numeric,
+    required,
+)
+from tests.helpers import Clock
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.metrics = Instrumentation(timer=Clock(step=0.5))
+        self.validator = Validator().instrument(self.metrics)
+
+    def test_records_rules_and_fields(self):
+        for age in ("25", "old"):
+            self.validator.validate(
+                {"name": "Joe", "age": age},
+                required(["name", "email"]),
+                numeric(["age"]),
+                isnt(is_in(["name"], ["admin"])),
+            )
+
+        snapshot = self.metrics.snapshot()
+
+        self.assertEqual(
+            snapshot["rules"]["required"],
+            {"calls": 4, "passes": 2, "failures": 2, "exceptions": 0, "seconds": 2.0},
+        )
+        self.assertEqual(
+            snapshot["fields"]["required"]["email"],
+            {"calls": 2, "passes": 0, "failures": 2, "exceptions": 0, "seconds": 1.0},
+        )
+        self.assertEqual(snapshot["fields"]["numeric"]["age"]["failures"], 1)
+        self.assertEqual(snapshot["rules"]["isnt"]["passes"], 2)
+        self.assertNotIn("isnt", snapshot["fields"])
+
+    def test_records_exceptions(self):
+        with self.assertRaises(ValueError):
+            self.validator.validate({"age": "old"}, numeric(["age"], raises=True))
+
+        self.assertEqual(
+            self.metrics.snapshot()["rules"]["numeric"],
+            {"calls": 1, "passes": 0, "failures": 1, "exceptions": 0, "seconds": 0.5},
+        )
+
+        with self.assertRaises(TypeError):
+            self.validator.validate({}, is_in(["age"], 5))
+
+        self.assertEqual(self.metrics.snapshot()["rules"]["is_in"]["exceptions"], 1)
+
+    def test_records_async_validation(self):
+        domains = []
+
+        def resolver(domain):
+            domains.append(domain)
+            return domain == "gmail.com"
+
+        errors = asyncio.get_event_loop().run_until_complete(
+            self.validator.avalidate(
+                {"email": "joe@gmail.com", "backup": "joe@nowhere.test"},
+                active_domain(["email", "backup"], resolver=resolver),
+                required(["name"]),
+            )
+        )
+
+        self.assertEqual(sorted(domains), ["gmail.com", "nowhere.test"])
+        self.assertEqual(
+            errors.all(),
+            {
+                "backup": ["The backup must be an active domain name."],
+                "name": ["The name field is required."],
+            },
+        )
+        fields = self.metrics.snapshot()["fields"]
+        self.assertEqual(fields["active_domain"]["email"]["passes"], 1)
+        self.assertEqual(fields["active_domain"]["backup"]["failures"], 1)
+        self.assertEqual(fields["required"]["name"]["failures"], 1)
+
+    def test_disabled_by_default(self):
+        schema = Validator().compile(required(["name"]))
+
+        self.assertIsNone(schema.instrumentation)
+        schema.validate({})
+        self.assertEqual(self.metrics.snapshot(), {"rules": {}, "fields": {}})
+
+    def test_instrument_every_validator(self):
+        Validator.instrumentation = self.metrics
+        try:
+            Validator().validate({}, required(["name"]))
+        finally:
+            Validator.instrumentation = None
+
+        self.assertEqual(self.metrics.snapshot()["rules"]["required"]["calls"], 1)
+
+    def test_prometheus_format(self):
+        self.validator.validate(
+            {"user": {"age": "25"}},
+            numeric(["user.age"]),
+            isnt(is_in(["user.age"], ["1"])),
+        )
+
+        text = self.metrics.export()
+
+        self.assertIn(
+            "# TYPE masonite_validation_rule_calls_total counter\n"
+            'masonite_validation_rule_calls_total{rule="numeric",field="user.age"} 1\n'
+            'masonite_validation_rule_calls_total{rule="isnt",field=""} 1\n',
+            text,
+        )
+        self.assertIn(
+            'masonite_validation_rule_seconds_total{rule="numeric",field="user.age"} '
+            "0.5\n",
+            text,
+        )
+
+    def test_flush_statsd_to_a_file(self):
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        metrics = Instrumentation(
+            sink=path, format="statsd", prefix="app", timer=Clock(step=0.5)
+        )
+        validator = Validator().instrument(metrics)
+
+        validator.validate({"email": "joe@masonite.com"}, required(["email"]))
+        metrics.flush()
+        validator.validate({}, required(["email"]))
+        metrics.flush()
+
+        with open(path) as f:
+            lines = f.read().splitlines()
+
+        self.assertEqual(
+            lines[:5],
+            [
+                "app.required.calls:1|c",
+                "app.required.passes:1|c",
+                "app.required.failures:0|c",
+                "app.required.exceptions:0|c",
+                "app.required.time:500.000|ms",
+            ],
+        )
+        # counters are deltas so the second flush only has the second validation
+        self.assertEqual(len(lines), 20)
+        self.assertIn("app.required.email.failures:1|c", lines[10:])
+        self.assertIn("app.required.email.passes:0|c", lines[10:])
+
+    def test_flush_to_a_callback(self):
+        sent = []
+        metrics = Instrumentation(
+            sink=sent.append, format=lambda snapshot, prefix: prefix
+        )
+
+        self.assertEqual(metrics.flush(), "masonite_validation")
+        self.assertEqual(sent, ["masonite_validation"])
+
+    def test_flush_without_a_sink(self):
+        with self.assertRaises(ValueError):
+            self.metrics.flush()
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            Instrumentation(format="graphite")
+
+    def test_pickles_without_its_counters(self):
+        self.validator.validate({}, required(["name"]))
+
+        copy = pickle.loads(pickle.dumps(self.metrics))
+
+        self.assertEqual(copy.snapshot(), {"rules": {}, "fields": {}})
+        copy.record("required", "name", 1.0, passed=True)
+        self.assertEqual(copy.snapshot()["rules"]["required"]["passes"], 1)
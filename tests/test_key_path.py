@@ -0,0 +1,188 @@
+import unittest
+from unittest import mock
+
+from masonite.dot import Dot
+
+from src.masonite.validation import (
+    BaseValidation,
+    RuleResult,
+    Validator,
+    isnt,
+    is_in,
+    required,
+    string,
+    when,
+)
+from src.masonite.validation.KeyPath import (
+    MISSING,
+    KeyPath,
+    PathLookup,
+    compile_path,
+)
+
+DICTIONARIES = [
+    {},
+    {"user": None},
+    {"user": {"name": "Joe"}},
+    {"user": {"name": "Joe", "age": "25"}},
+    {"user": {"addresses": [{"id": 1}, {"id": None}]}},
+    {"user": {"addresses": [{"id": 1}, {"street": "Main"}]}},
+    {"user": {"addresses": []}},
+    {"user": {"addresses": [1, 2]}},
+    {"user": {"profile": {"settings": {"theme": "dark"}}}},
+    {"user": {"profile": {"settings": {}}}},
+]
+
+PATHS = [
+    "",
+    "user",
+    "user.name",
+    "user.age",
+    "user.addresses",
+    "user.addresses.*",
+    "user.addresses.*.id",
+    "user.profile.settings",
+    "user.profile.settings.theme",
+    "user.missing.key",
+]
+
+
+class TestKeyPath(unittest.TestCase):
+    def test_resolves_like_dot(self):
+        for dictionary in DICTIONARIES:
+            for path in PATHS:
+                with self.subTest(path=path, dictionary=dictionary):
+                    self.assertEqual(
+                        KeyPath(path).resolve(dictionary, False),
+                        Dot().dot(path, dictionary, False),
+                    )
+
+    def test_paths_are_compiled_once(self):
+        self.assertIs(
+            compile_path("user.addresses.*.id"), compile_path("user.addresses.*.id")
+        )
+        self.assertEqual(
+            compile_path("user.addresses.*.id").segments,
+            ("user", "addresses", "*", "id"),
+        )
+
+    def test_expand_wildcards(self):
+        dictionary = {
+            "users": [
+                {"emails": ["joe@masonite.com", "joe@example.com"]},
+                {"emails": []},
+                {"name": "Nick"},
+            ],
+            "totals": {"a": 1, "b": 2},
+        }
+
+        self.assertEqual(
+            list(compile_path("users.*.emails.*").expand(dictionary)),
+            [
+                ("users.0.emails.0", "joe@masonite.com"),
+                ("users.0.emails.1", "joe@example.com"),
+                ("users.2.emails.*", MISSING),
+            ],
+        )
+        self.assertEqual(
+            list(compile_path("users.0.emails.*").expand(dictionary)),
+            [
+                ("users.0.emails.0", "joe@masonite.com"),
+                ("users.0.emails.1", "joe@example.com"),
+            ],
+        )
+        self.assertEqual(
+            list(compile_path("totals.*").expand(dictionary)),
+            [("totals.a", 1), ("totals.b", 2)],
+        )
+        self.assertEqual(
+            list(compile_path("totals.a").expand(dictionary)), [("totals.a", 1)]
+        )
+
+    def test_lookup_resolves_each_key_once(self):
+        lookup = PathLookup({"user": {"email": "joe@masonite.com"}})
+        with mock.patch.object(
+            KeyPath, "resolve", autospec=True, side_effect=KeyPath.resolve
+        ) as resolve:
+            self.assertEqual(lookup.find("user.email"), "joe@masonite.com")
+            self.assertEqual(lookup.find("user.email"), "joe@masonite.com")
+            self.assertEqual(lookup.find("user.phone"), None)
+            self.assertEqual(lookup.find("missing"), False)
+            self.assertEqual(lookup.find("missing", "default"), "default")
+
+        self.assertEqual(resolve.call_count, 3)
+
+    def test_rules_share_one_lookup_per_dictionary(self):
+        schema = Validator().compile(
+            required(["user.email", "user.name"]),
+            string(["user.email"]),
+            isnt(is_in(["user.email"], ["admin@masonite.com"])),
+            when(required(["user.email"])).then(string(["user.name"])),
+        )
+
+        with mock.patch.object(
+            KeyPath, "resolve", autospec=True, side_effect=KeyPath.resolve
+        ) as resolve:
+            errors = schema.errors({"user": {"email": "joe@masonite.com", "name": 1}})
+
+        self.assertEqual(list(errors), ["user.name"])
+        self.assertEqual(resolve.call_count, 2)
+
+    def test_rules_overriding_handle_without_lookup(self):
+        class legacy(BaseValidation):
+            def handle(self, dictionary):
+                result = RuleResult()
+                if self.find("name", dictionary) != "Joe":
+                    result.add("name", "The name must be Joe.")
+
+                return result
+
+        validate = Validator().validate(
+            {"name": "Bob"}, when(required(["name"])).then(legacy(["name"]))
+        )
+        self.assertEqual(validate.get("name"), ["The name must be Joe."])
+
+        validate = Validator().validate({"name": "Joe"}, legacy(["name"]))
+        self.assertEqual(len(validate), 0)
+
+    def test_rules_filling_their_own_errors(self):
+        class legacy_bool(BaseValidation):
+            # the contract before RuleResult, errors kept on the rule and a bool
+            def handle(self, dictionary):
+                boolean = True
+                for key in self.validations:
+                    if self.find(key, dictionary) != "Joe":
+                        boolean = False
+                        self.error(key, "The {} must be Joe.".format(key))
+
+                return boolean
+
+        rule = legacy_bool(["name"])
+        with self.assertWarns(DeprecationWarning):
+            validate = Validator().validate({"name": "Bob"}, rule)
+
+        self.assertEqual(validate.all(), {"name": ["The name must be Joe."]})
+        self.assertEqual(rule.errors, {})
+
+        # errors do not leak into the next validation
+        self.assertEqual(len(Validator().validate({"name": "Joe"}, rule)), 0)
+        self.assertEqual(
+            Validator()
+            .validate({"name": "Bob"}, when(legacy_bool(["name"])).then(required(["email"])))
+            .all(),
+            {},
+        )
+        self.assertEqual(
+            Validator().validate(
+                {"name": "Joe"}, when(legacy_bool(["name"])).then(required(["email"]))
+            ).all(),
+            {"email": ["The email field is required."]},
+        )
+
+    def test_reset_clears_errors_added_the_old_way(self):
+        rule = required(["name"])
+        rule.error("name", "The name is missing.")
+
+        self.assertEqual(rule.errors, {"name": ["The name is missing."]})
+        rule.reset()
+        self.assertEqual(rule.errors, {})
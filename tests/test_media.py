@@ -0,0 +1,190 @@
+import io
+import os
+import struct
+import tempfile
+import unittest
+
+from src.masonite.validation import Validator, image, video
+from src.masonite.validation.media import image_size, video_metadata
+
+
+def png(width, height):
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + struct.pack(">I4sII", 13, b"IHDR", width, height)
+        + b"\x08\x02\x00\x00\x00"
+        + b"\x00" * 1000
+    )
+
+
+def jpeg(width, height):
+    exif = b"Exif\x00\x00" + b"\x00" * 4000
+    return (
+        b"\xff\xd8"
+        + b"\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+        + b"\xff\xe1"
+        + struct.pack(">H", len(exif) + 2)
+        + exif
+        + b"\xff\xff\xc2\x00\x11\x08"
+        + struct.pack(">HH", height, width)
+        + b"\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01"
+        + b"\xff\xda"
+        + b"\x00" * 1000
+    )
+
+
+def webp(chunk, payload):
+    data = chunk + struct.pack("<I", len(payload)) + payload
+    return b"RIFF" + struct.pack("<I", len(data) + 4) + b"WEBP" + data
+
+
+def box(kind, content):
+    return struct.pack(">I4s", len(content) + 8, kind) + content
+
+
+def mp4(duration, timescale, width, height, mdat=100000):
+    mvhd = struct.pack(">B3xIIII", 0, 0, 0, timescale, duration) + b"\x00" * 80
+    tkhd = b"\x00" * 76 + struct.pack(">II", width << 16, height << 16)
+    audio = b"\x00" * 84
+    moov = box(b"mvhd", mvhd) + box(b"trak", box(b"tkhd", tkhd))
+    moov += box(b"trak", box(b"tkhd", audio))
+    return (
+        box(b"ftyp", b"isom\x00\x00\x02\x00isomiso2mp41")
+        + box(b"mdat", b"\x00" * mdat)
+        + box(b"moov", moov)
+    )
+
+
+class CountingStream(io.BytesIO):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class TestImageSize(unittest.TestCase):
+    def test_formats(self):
+        self.assertEqual(image_size(io.BytesIO(png(640, 480))), (640, 480))
+        self.assertEqual(image_size(io.BytesIO(jpeg(1920, 1080))), (1920, 1080))
+        self.assertEqual(
+            image_size(io.BytesIO(b"GIF89a" + struct.pack("<HH", 32, 16) + b"\x00")),
+            (32, 16),
+        )
+        self.assertEqual(
+            image_size(
+                io.BytesIO(
+                    b"BM" + b"\x00" * 12 + struct.pack("<Iii", 40, 300, -200) + b"\x00" * 8
+                )
+            ),
+            (300, 200),
+        )
+
+    def test_webp(self):
+        vp8x = webp(b"VP8X", b"\x00" * 4 + (799).to_bytes(3, "little") + (599).to_bytes(3, "little"))
+        vp8 = webp(b"VP8 ", b"\x00\x00\x00\x9d\x01\x2a" + struct.pack("<HH", 400, 300))
+        vp8l = webp(b"VP8L", b"\x2f" + (99 | (49 << 14)).to_bytes(4, "little"))
+
+        self.assertEqual(image_size(io.BytesIO(vp8x)), (800, 600))
+        self.assertEqual(image_size(io.BytesIO(vp8)), (400, 300))
+        self.assertEqual(image_size(io.BytesIO(vp8l)), (100, 50))
+
+    def test_unknown_or_truncated(self):
+        self.assertIsNone(image_size(io.BytesIO(b"not an image")))
+        self.assertIsNone(image_size(io.BytesIO(jpeg(10, 10)[:100])))
+
+    def test_only_the_header_is_read(self):
+        stream = CountingStream(jpeg(1920, 1080) + b"\x00" * 1000000)
+        stream.seek(7)
+
+        self.assertEqual(image_size(stream), (1920, 1080))
+        self.assertLess(stream.bytes_read, 100)
+        self.assertEqual(stream.tell(), 7)
+
+
+class TestVideoMetadata(unittest.TestCase):
+    def test_mp4(self):
+        metadata = video_metadata(io.BytesIO(mp4(90000, 1000, 1280, 720)))
+
+        self.assertEqual(metadata.duration, 90)
+        self.assertEqual((metadata.width, metadata.height), (1280, 720))
+
+    def test_media_data_is_skipped(self):
+        stream = CountingStream(mp4(5000, 1000, 640, 360, mdat=5000000))
+
+        self.assertEqual(video_metadata(stream).duration, 5)
+        self.assertLess(stream.bytes_read, 200)
+
+    def test_not_a_video(self):
+        self.assertIsNone(video_metadata(io.BytesIO(png(1, 1))))
+
+
+class TestMediaConstraints(unittest.TestCase):
+    def setUp(self):
+        self.paths = []
+
+    def tearDown(self):
+        for path in self.paths:
+            os.remove(path)
+
+    def write(self, suffix, content):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(handle, "wb") as f:
+            f.write(content)
+        self.paths.append(path)
+        return path
+
+    def test_image_dimensions(self):
+        path = self.write(".png", png(1600, 900))
+
+        validate = Validator().validate(
+            {"avatar": path},
+            image(["avatar"], min_width=200, max_width=1024, max_height=1024, ratio="16/9"),
+        )
+        self.assertEqual(
+            validate.get("avatar"), ["The avatar must be at most 1024 pixels wide."]
+        )
+
+        validate = Validator().validate(
+            {"avatar": path}, image(["avatar"], min_height=1000, ratio=1)
+        )
+        self.assertEqual(
+            validate.get("avatar"),
+            [
+                "The avatar must be at least 1000 pixels high.",
+                "The avatar must have an aspect ratio of 1.",
+            ],
+        )
+
+    def test_unreadable_image_dimensions(self):
+        path = self.write(".png", b"not really a png")
+
+        validate = Validator().validate({"avatar": path}, image(["avatar"], max_width=10))
+
+        self.assertEqual(
+            validate.get("avatar"), ["The avatar image dimensions could not be read."]
+        )
+
+    def test_video_limits(self):
+        path = self.write(".mp4", mp4(125000, 1000, 3840, 2160))
+
+        validate = Validator().validate(
+            {"clip": path},
+            video(["clip"], max_duration=60, max_width=1920, min_height=720),
+        )
+
+        self.assertEqual(
+            validate.get("clip"),
+            [
+                "The clip must be at most 1920 pixels wide.",
+                "The clip must be at most 60 seconds long.",
+            ],
+        )
+
+        validate = Validator().validate(
+            {"clip": path}, video(["clip"], min_duration=60, max_height=2160)
+        )
+        self.assertEqual(len(validate), 0)
@@ -0,0 +1,67 @@
+import unittest
+
+from src.masonite.validation import Validator, is_in, numeric, required
+from src.masonite.validation.ParallelEngine import ParallelEngine
+
+
+class TestParallelEngine(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {"name": "Joe" if row % 4 else "", "age": row if row % 3 else "old"}
+            for row in range(50)
+        ]
+        self.schema = Validator().compile(
+            required(["name"]), numeric(["age"]), {"name": "length:2..5"}
+        )
+
+    def test_report_matches_serial_validation(self):
+        report = self.schema.validate_many(
+            self.records, parallel=True, workers=2, chunk_size=7
+        )
+
+        self.assertEqual(report, self.schema.validate_many(self.records))
+        self.assertEqual(list(report), list(range(50)))
+
+    def test_failures_only_from_generator(self):
+        report = Validator().validate_many(
+            iter(self.records),
+            numeric(["age"]),
+            failures_only=True,
+            parallel=True,
+            workers=2,
+            chunk_size=10,
+        )
+
+        self.assertEqual(list(report), list(range(0, 50, 3)))
+
+    def test_single_chunk_runs_in_process(self):
+        report = self.schema.validate_many(
+            self.records[:3], parallel=True, chunk_size=10
+        )
+
+        self.assertEqual(report, self.schema.validate_many(self.records[:3]))
+
+    def test_exception_reports_global_row(self):
+        records = [{"age": 5}] * 25 + [{"age": 99}]
+
+        with self.assertRaises(ValueError) as e:
+            Validator().validate_many(
+                records,
+                is_in(["age"], [5], raises=True),
+                parallel=True,
+                workers=2,
+                chunk_size=10,
+            )
+
+        self.assertEqual(e.exception.row, 25)
+
+    def test_chunks(self):
+        engine = ParallelEngine(self.schema, chunk_size=20)
+
+        self.assertEqual(
+            [len(chunk) for chunk in engine.chunks(iter(self.records))], [20, 20, 10]
+        )
+
+    def test_chunk_size_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            ParallelEngine(self.schema, chunk_size=0)
@@ -0,0 +1,64 @@
+import io
+import os
+import tempfile
+import unittest
+
+from src.masonite.validation import Validator, numeric, read_csv, read_ndjson, required
+
+
+class TestReaders(unittest.TestCase):
+    def test_read_ndjson_from_file(self):
+        source = io.StringIO('{"name": "Joe"}\n\n{"name": "Bob", "age": 4}\n')
+
+        self.assertEqual(
+            list(read_ndjson(source)), [{"name": "Joe"}, {"name": "Bob", "age": 4}]
+        )
+        self.assertFalse(source.closed)
+
+    def test_read_ndjson_reports_invalid_line(self):
+        source = io.StringIO('{"name": "Joe"}\n{"name":\n')
+
+        with self.assertRaises(ValueError) as e:
+            list(read_ndjson(source))
+
+        self.assertTrue(str(e.exception).startswith("Line 2 is not valid JSON"))
+
+    def test_read_csv_from_path(self):
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", newline="") as f:
+            f.write('name,age\nJoe,25\n"Smith, Bob",old\n')
+
+        try:
+            self.assertEqual(
+                list(read_csv(path)),
+                [{"name": "Joe", "age": "25"}, {"name": "Smith, Bob", "age": "old"}],
+            )
+        finally:
+            os.remove(path)
+
+    def test_read_csv_options(self):
+        source = io.StringIO("Joe;25\nBob;40\n")
+
+        records = read_csv(source, delimiter=";", fieldnames=["name", "age"])
+
+        self.assertEqual(next(records), {"name": "Joe", "age": "25"})
+
+    def test_streaming_validation(self):
+        source = io.StringIO('{"name": "Joe", "age": 25}\n{"age": "old"}\n')
+
+        failures = list(
+            Validator().iter_validate(
+                read_ndjson(source), required(["name"]), numeric(["age"])
+            )
+        )
+
+        self.assertEqual(len(failures), 1)
+        row, errors = failures[0]
+        self.assertEqual(row, 1)
+        self.assertEqual(
+            errors.all(),
+            {
+                "name": ["The name field is required."],
+                "age": ["The age must be a numeric."],
+            },
+        )
@@ -0,0 +1,97 @@
+import hashlib
+import io
+import os
+import tempfile
+import unittest
+
+from src.masonite.validation import Validator, file
+from src.masonite.validation.scanning import scan_file
+
+CONTENT = b"%PDF-1.7\n" + b"x" * 200000 + b"<script>alert(1)</script>" + b"y" * 1000
+
+
+class TestScanning(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".pdf")
+        with os.fdopen(handle, "wb") as f:
+            f.write(CONTENT)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_path_and_stream_scans_agree(self):
+        forbidden = [b"<script", b"not there"]
+        from_path = scan_file(self.path, "md5", forbidden)
+
+        stream = io.BytesIO(CONTENT)
+        stream.seek(10)
+        from_stream = scan_file(stream, "md5", forbidden)
+
+        self.assertEqual(from_path, from_stream)
+        self.assertEqual(
+            from_path, (len(CONTENT), hashlib.md5(CONTENT).hexdigest(), b"<script")
+        )
+        self.assertEqual(stream.tell(), 10)
+
+    def test_signatures_split_across_chunks_are_found(self):
+        start = CONTENT.index(b"<script>")
+        for chunk_size in (start + 1, start + 3, 4096):
+            scan = scan_file(
+                io.BytesIO(CONTENT), forbidden=[b"<script>"], chunk_size=chunk_size
+            )
+            self.assertEqual(scan.forbidden, b"<script>")
+            self.assertIsNone(scan.digest)
+
+    def test_empty_file(self):
+        with open(self.path, "wb"):
+            pass
+
+        self.assertEqual(
+            scan_file(self.path, "sha256", [b"a"]),
+            (0, hashlib.sha256().hexdigest(), None),
+        )
+
+    def test_digest_rule(self):
+        digest = hashlib.sha256(CONTENT).hexdigest()
+
+        validate = Validator().validate(
+            {"document": self.path}, file(["document"], digest=digest.upper())
+        )
+        self.assertEqual(len(validate), 0)
+
+        validate = Validator().validate(
+            {"document": self.path},
+            file(
+                ["document"], digest=hashlib.md5(b"other").hexdigest(), algorithm="md5"
+            ),
+        )
+        self.assertEqual(
+            validate.get("document"), ["The document md5 checksum does not match."]
+        )
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            file(["document"], digest="abc", algorithm="nope")
+
+    def test_forbidden_content_rule(self):
+        validate = Validator().validate(
+            {"document": self.path}, file(["document"], forbidden=["<script"])
+        )
+
+        self.assertEqual(
+            validate.get("document"), ["The document contains forbidden content."]
+        )
+
+    def test_size_comes_from_the_same_pass(self):
+        class single_pass_file(file):
+            def _get_size(self, file):
+                raise AssertionError("the file was read twice")
+
+        validate = Validator().validate(
+            {"document": self.path},
+            single_pass_file(["document"], size="100K", forbidden=[b"%EOF"]),
+        )
+
+        self.assertEqual(
+            validate.get("document"), ["The document file size exceeds 100 KB."]
+        )
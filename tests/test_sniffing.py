@@ -0,0 +1,110 @@
+import io
+import os
+import tempfile
+import unittest
+
+from src.masonite.validation import Validator, file, image, video
+from src.masonite.validation.sniffing import read_header, sniff_mimetype
+
+PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + b"\x00" * 64
+MP4 = b"\x00\x00\x00\x20ftypisom\x00\x00\x02\x00" + b"\x00" * 64
+
+
+class TestSniffing(unittest.TestCase):
+    def setUp(self):
+        self.paths = []
+
+    def tearDown(self):
+        for path in self.paths:
+            os.remove(path)
+
+    def write(self, suffix, content):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(handle, "wb") as f:
+            f.write(content)
+        self.paths.append(path)
+        return path
+
+    def test_sniff_mimetype(self):
+        self.assertEqual(sniff_mimetype(PNG), "image/png")
+        self.assertEqual(sniff_mimetype(b"\xff\xd8\xff\xe0\x00\x10JFIF"), "image/jpeg")
+        self.assertEqual(sniff_mimetype(b"RIFF\x00\x00\x00\x00WEBPVP8 "), "image/webp")
+        self.assertEqual(sniff_mimetype(MP4), "video/mp4")
+        self.assertEqual(
+            sniff_mimetype(b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81\x01\x42\x82\x84webm"),
+            "video/webm",
+        )
+        self.assertEqual(sniff_mimetype(b"%PDF-1.7"), "application/pdf")
+        self.assertIsNone(sniff_mimetype(b"just some text"))
+        self.assertIsNone(sniff_mimetype(b""))
+
+    def test_read_header_restores_stream_position(self):
+        stream = io.BytesIO(PNG + b"\x00" * 10000)
+        stream.seek(40)
+
+        header = read_header(stream, size=8)
+
+        self.assertEqual(header, PNG[:8])
+        self.assertEqual(stream.tell(), 40)
+
+    def test_read_header_reads_only_the_start_of_a_path(self):
+        path = self.write(".bin", PNG + b"\x00" * 100000)
+
+        self.assertEqual(len(read_header(path)), 512)
+
+    def test_sniffing_ignores_the_file_name(self):
+        disguised = self.write(".png", b"#!/bin/sh\necho hello\n")
+        renamed = self.write(".txt", PNG)
+
+        validate = Validator().validate(
+            {"disguised": disguised, "renamed": renamed},
+            file(["disguised", "renamed"], mimes=["png"], sniff=True),
+        )
+
+        self.assertEqual(
+            validate.all(),
+            {
+                "disguised": [
+                    "The disguised mime type is not valid. Allowed formats are png."
+                ]
+            },
+        )
+
+    def test_unknown_content_is_not_allowed(self):
+        script = self.write(".pdf", b"<?php system($_GET['cmd']); ?>\n")
+
+        rule = file(["upload"], mimes=["pdf", "docx2"], sniff=True)
+        validate = Validator().validate({"upload": script}, rule)
+
+        self.assertNotIn(None, rule.allowed_mimetypes)
+        self.assertEqual(
+            validate.all(),
+            {
+                "upload": [
+                    "The upload mime type is not valid. Allowed formats are pdf,docx2."
+                ]
+            },
+        )
+
+    def test_image_and_video_sniffing(self):
+        picture = self.write(".mp4", PNG)
+        movie = self.write(".png", MP4)
+
+        validate = Validator().validate(
+            {"picture": picture, "movie": movie},
+            image(["picture"], sniff=True),
+            video(["movie"], sniff=True),
+        )
+        self.assertEqual(len(validate), 0)
+
+        validate = Validator().validate(
+            {"picture": movie}, image(["picture"], sniff=True)
+        )
+        self.assertEqual(len(validate), 1)
+
+    def test_sniffing_is_opt_in(self):
+        path = self.write(".png", b"not really a png")
+
+        validate = Validator().validate({"avatar": path}, image(["avatar"]))
+
+        self.assertEqual(len(validate), 0)
@@ -0,0 +1,53 @@
+import pickle
+import unittest
+
+from src.masonite.validation import TTLCache
+from tests.helpers import Clock
+
+
+class TestTTLCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.cache = TTLCache(maxsize=2, timer=self.clock)
+
+    def test_entries_expire(self):
+        self.cache.set("a", 1, ttl=10)
+        self.clock.now = 9
+        self.assertEqual(self.cache.get("a"), 1)
+
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.set("a", 1, ttl=10)
+        self.cache.set("b", 2, ttl=10)
+        self.cache.get("a")
+        self.cache.set("c", 3, ttl=10)
+
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.get("b", "missing"), "missing")
+        self.assertEqual(self.cache.get("c"), 3)
+
+    def test_cache_info(self):
+        self.cache.set("a", 1, ttl=10)
+        self.cache.get("a")
+        self.cache.get("b")
+
+        info = self.cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.maxsize, info.currsize), (1, 1, 2, 1))
+
+        self.cache.clear()
+        self.assertEqual(self.cache.cache_info(), (0, 0, 2, 0))
+
+    def test_zero_ttl_is_not_stored(self):
+        self.cache.set("a", 1, ttl=0)
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_can_be_pickled(self):
+        self.cache.set("a", 1, ttl=10)
+
+        cache = pickle.loads(pickle.dumps(self.cache))
+
+        self.assertEqual(cache.get("a"), 1)
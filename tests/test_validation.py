@@ -1,7 +1,10 @@
+import asyncio
 import json
 import unittest
 import pytest
 import platform
+import re
+import time
 import pendulum
 from uuid import uuid1, uuid3, uuid4, uuid5
 from masonite.app import App
@@ -9,9 +12,10 @@ from masonite.drivers import SessionCookieDriver
 from masonite.managers import SessionManager
 from masonite.testing import TestCase, generate_wsgi
 
-from src.masonite.validation import RuleEnclosure
+from src.masonite.validation import CompiledSchema, MessageBag, RuleEnclosure, RuleResult
 from src.masonite.validation.providers import ValidationProvider
 from src.masonite.validation import (
+    BaseValidation,
     ValidationFactory,
     Validator,
     accepted,
@@ -24,6 +28,7 @@ from src.masonite.validation import (
     different,
     distinct,
     does_not,
+    each,
     email,
     equals,
     exists,
@@ -38,6 +43,7 @@ from src.masonite.validation import (
     is_past,
     isnt,
     postal_code,
+    refresh_mimetypes,
     strong,
     regex,
     uuid,
@@ -60,6 +66,7 @@ from src.masonite.validation.Validator import (
     truthy,
     when,
 )
+from tests.helpers import counting
 
 
 class TestValidation(unittest.TestCase):
@@ -204,6 +211,36 @@ class TestValidation(unittest.TestCase):
             validate.all(), {"timezone": ["The timezone must be a valid timezone."]}
         )
 
+    def test_timezone_index(self):
+        from src.masonite.validation.Validator import timezone_index
+
+        self.assertIsInstance(timezone_index(), frozenset)
+        self.assertIs(timezone_index("pytz", True), timezone_index("pytz", True))
+        self.assertIn("US/Eastern", timezone_index())
+
+        with self.assertRaises(ValueError):
+            timezone_index("tzdata")
+
+    def test_timezone_case_insensitive(self):
+        rule = timezone(["timezone"], case_sensitive=False)
+
+        self.assertTrue(rule.passes("america/new_york", "timezone", {}))
+        self.assertFalse(timezone(["timezone"]).passes("america/new_york", "timezone", {}))
+        self.assertFalse(rule.passes(["UTC"], "timezone", {}))
+
+    def test_timezone_zoneinfo_source(self):
+        try:
+            import zoneinfo  # noqa: F401
+        except ImportError:
+            pytest.importorskip("backports.zoneinfo")
+
+        validate = Validator().validate(
+            {"timezone": "Europe/Paris", "other": "Mars/Olympus"},
+            timezone(["timezone", "other"], source="zoneinfo"),
+        )
+
+        self.assertEqual(validate.all(), {"other": ["The other must be a valid timezone."]})
+
     def test_exists(self):
         validate = Validator().validate(
             {
@@ -748,6 +785,41 @@ class TestValidation(unittest.TestCase):
             ["The username does not match pattern ^[a-z0-9_-]{3,16}$ ."],
         )
 
+    def test_regex_is_compiled_once(self):
+        first = regex(["username"], "^[a-z]+$")
+        second = regex(["nickname"], "^[a-z]+$")
+
+        self.assertIs(first.regex, second.regex)
+        self.assertIsNot(first.regex, regex(["username"], "^[a-z]+$", re.I).regex)
+
+    def test_regex_accepts_compiled_pattern(self):
+        validate = Validator().validate(
+            {"username": "Masonite"},
+            regex(["username"], re.compile("^[a-z]+$", re.IGNORECASE)),
+        )
+        self.assertEqual(len(validate), 0)
+
+        validate = Validator().validate(
+            {"username": "Masonite 2"}, regex(["username"], re.compile("^[a-z]+$"))
+        )
+        self.assertEqual(
+            validate.get("username"), ["The username does not match pattern ^[a-z]+$ ."]
+        )
+
+    def test_regex_engine(self):
+        class Engine:
+            compiled = []
+
+            @classmethod
+            def compile(cls, pattern, flags=0):
+                cls.compiled.append(pattern)
+                return re.compile(pattern, flags)
+
+        rule = regex(["username"], "^[a-z]{3}$", engine=Engine)
+
+        self.assertEqual(Engine.compiled, ["^[a-z]{3}$"])
+        self.assertTrue(rule.passes("joe", "username", {}))
+
     def test_list_validation(self):
         validate = Validator().validate(
             {"name": "Joe", "discounts_ref": [1, 2, 3]},
@@ -824,6 +896,45 @@ class TestValidation(unittest.TestCase):
             ],
         )
 
+    def test_postal_code_reports_matching_country(self):
+        rule = postal_code(["postal_code"], ["GB", "FR", "US"])
+
+        self.assertEqual(rule.country("EC1Y 8SY"), "GB")
+        self.assertEqual(rule.country("44000"), "FR")
+        self.assertIsNone(rule.country("4430"))
+
+    def test_postal_code_patterns_are_compiled_once(self):
+        from src.masonite.validation.Validator import postal_code_pattern
+
+        self.assertIs(
+            postal_code(["a"], "FR,DE").pattern, postal_code(["b"], "FR,DE").pattern
+        )
+        self.assertIs(postal_code_pattern(("FR", "DE")), postal_code_pattern(("FR", "DE")))
+
+    def test_postal_code_matches_each_locale_pattern(self):
+        from src.masonite.validation.resources.postal_codes import PATTERNS
+
+        locales = [locale for locale in PATTERNS if PATTERNS[locale]["pattern"]]
+        rule = postal_code(["postal_code"], locales)
+        for locale in locales:
+            example = PATTERNS[locale]["example"]
+            expected = [
+                other
+                for other in locales
+                if re.match(PATTERNS[other]["pattern"], example)
+            ][0]
+            self.assertEqual(rule.country(example), expected)
+
+    def test_negated_postal_code(self):
+        validate = Validator().validate(
+            {"postal_code": "44000"}, isnt(postal_code(["postal_code"], "FR,US"))
+        )
+
+        self.assertEqual(
+            validate.get("postal_code"),
+            ["The postal_code is a valid FR,US postal code."],
+        )
+
     def test_not_implemented_country_postal_code(self):
         try:
             validate = Validator().validate(
@@ -1015,6 +1126,28 @@ class TestValidation(unittest.TestCase):
                 validate.get("avatar"), ["The avatar file size exceeds 20 bytes."]
             )
 
+    def test_mimetype_tables_are_shared(self):
+        first, second = image(["avatar"]), image(["photo"])
+
+        self.assertIs(first.allowed_mimetypes, second.allowed_mimetypes)
+        self.assertIsInstance(first.allowed_mimetypes, frozenset)
+        self.assertIn("image/png", first.allowed_mimetypes)
+        self.assertNotIn("image/png", video(["clip"]).allowed_mimetypes)
+
+    def test_mimetype_tables_follow_new_types(self):
+        import mimetypes
+
+        mimetypes.add_type("image/x-masonite", ".masonite-image")
+        try:
+            rule = image(["avatar"])
+            self.assertIn(".masonite-image", rule.allowed_extensions)
+            self.assertIn("image/x-masonite", rule.allowed_mimetypes)
+        finally:
+            del mimetypes.types_map[".masonite-image"]
+            refresh_mimetypes()
+
+        self.assertNotIn(".masonite-image", image(["avatar"]).allowed_extensions)
+
     @pytest.mark.skipif(
         int(platform.python_version_tuple()[1]) < 6,
         reason="python 3.5 mimetype modules breaks test but validation rule is ok",
@@ -1540,6 +1673,83 @@ class TestDotNotationValidation(unittest.TestCase):
 
         self.assertEqual(validate.all(), {"user.age": ["You are missing a user age"]})
 
+    def test_each_reports_element_keys(self):
+        validate = Validator().validate(
+            {"discounts_ref": [1, "a", 3, "b"]}, each(numeric(["discounts_ref.*"]))
+        )
+
+        self.assertEqual(
+            validate.all(),
+            {
+                "discounts_ref.1": ["The discounts_ref.1 must be a numeric."],
+                "discounts_ref.3": ["The discounts_ref.3 must be a numeric."],
+            },
+        )
+
+    def test_each_with_nested_wildcards(self):
+        validate = Validator().validate(
+            {
+                "users": [
+                    {"emails": ["joe@masonite.com"]},
+                    {"emails": ["bob@masonite.com", 5]},
+                    {"name": "Nick"},
+                ]
+            },
+            each(required(["users.*.emails.*"]), string(["users.*.emails.*"])),
+        )
+
+        self.assertEqual(
+            validate.all(),
+            {
+                "users.1.emails.1": ["The users.1.emails.1 must be a string."],
+                "users.2.emails.*": [
+                    "The users.2.emails.* field is required.",
+                    "The users.2.emails.* must be a string.",
+                ],
+            },
+        )
+
+    def test_each_with_empty_and_missing_lists(self):
+        self.assertEqual(
+            len(Validator().validate({"ids": []}, each(required(["ids.*"])))), 0
+        )
+
+        validate = Validator().validate({}, each(required(["ids.*"])))
+        self.assertEqual(validate.all(), {"ids.*": ["The ids.* field is required."]})
+
+    def test_each_stops_after_max_errors(self):
+        validate = Validator().validate(
+            {"ids": list(range(5000)) + ["x"] * 5000},
+            each(numeric(["ids.*"]), max_errors=3),
+        )
+
+        self.assertEqual(list(validate.all()), ["ids.5000", "ids.5001", "ids.5002"])
+
+    def test_each_messages_and_negation(self):
+        validate = Validator().validate(
+            {"tags": ["python", 1, "masonite"]},
+            each(
+                string(["tags.*"], messages={"tags.*": "Every tag must be text"}),
+                isnt(is_in(["tags.*"], ["masonite"])),
+            ),
+        )
+
+        self.assertEqual(
+            validate.all(),
+            {
+                "tags.1": ["Every tag must be text"],
+                "tags.2": ["The tags.2 must not contain an element in ['masonite']."],
+            },
+        )
+
+    def test_each_raises_for_the_element(self):
+        with self.assertRaises(ValueError) as e:
+            Validator().validate(
+                {"ids": [1, "x"]}, each(numeric(["ids.*"], raises=True))
+            )
+
+        self.assertEqual(str(e.exception), "The ids.1 must be a numeric.")
+
 
 class TestValidationFactory(unittest.TestCase):
     def test_can_register(self):
@@ -1808,3 +2018,644 @@ class TestDictValidation(unittest.TestCase):
             "The email is required because one in first_name,nick_name is present.",
             validate.get("email"),
         )
+
+    def test_dictionary_definitions_are_parsed_once(self):
+        validator = Validator()
+        definitions = {"name": "required|length:1..5", "age": "numeric"}
+        validator.validate({"name": "Joe", "age": 1}, definitions)
+        before = validator.parse_cache_info()
+
+        validate = validator.validate({"name": "Joseph", "age": "x"}, definitions)
+
+        after = validator.parse_cache_info()
+        self.assertEqual(after.hits - before.hits, 2)
+        self.assertEqual(after.misses, before.misses)
+        self.assertEqual(
+            validate.all(),
+            {
+                "name": ["The name length must be between 1 and 5."],
+                "age": ["The age must be a numeric."],
+            },
+        )
+
+    def test_registering_a_rule_replaces_parsed_definitions(self):
+        class required(BaseValidation):
+            def message(self, attribute):
+                return "custom"
+
+            def passes(self, attribute, key, dictionary):
+                return False
+
+        from src.masonite.validation.Validator import required as builtin_required
+
+        validator = Validator()
+        validator.validate({}, {"name": "required"})
+        try:
+            validator.register(required)
+            validate = validator.validate({"name": "Joe"}, {"name": "required"})
+            self.assertEqual(validate.all(), {"name": ["custom"]})
+        finally:
+            validator.register(builtin_required)
+
+
+class TestCompiledSchema(unittest.TestCase):
+    def test_compiled_schema_can_be_reused(self):
+        schema = Validator().compile(
+            required(["user", "email"]),
+            "numeric:age",
+            {"terms": "accepted"},
+            MockRuleEnclosure,
+        )
+
+        self.assertEqual(len(schema), 5)
+
+        validate = schema.validate(
+            {
+                "user": "Joe",
+                "email": "user@example.com",
+                "age": 25,
+                "terms": "on",
+                "username": "joe",
+            }
+        )
+        self.assertEqual(len(validate), 0)
+
+        validate = schema.validate({"user": "Joe", "age": "old"})
+        self.assertEqual(
+            validate.all(),
+            {
+                "email": [
+                    "The email field is required.",
+                    "The email field is required.",
+                ],
+                "age": ["The age must be a numeric."],
+                "terms": ["The terms must be accepted.", "The terms must be accepted."],
+                "username": ["The username field is required."],
+            },
+        )
+
+        validate = schema.validate(
+            {"user": "Joe", "email": "user@example.com", "age": 1, "terms": "yes"}
+        )
+        self.assertEqual(validate.all(), {"username": ["The username field is required."]})
+
+    def test_compiled_conditional_rules_do_not_leak_errors(self):
+        schema = Validator().compile(
+            when(exists("email")).then(required("phone")),
+            isnt(equals(["test"], "test")),
+        )
+
+        validate = schema.validate({"email": "user@example.com", "test": "test"})
+        self.assertEqual(
+            validate.all(),
+            {
+                "phone": ["The phone field is required."],
+                "test": ["The test must not be equal to test."],
+            },
+        )
+
+        validate = schema.validate(
+            {"email": "user@example.com", "phone": "123-456-7890", "test": "other"}
+        )
+        self.assertEqual(len(validate), 0)
+
+    def test_dictionary_rules_run_every_rule(self):
+        validate = Validator().validate(
+            {"name": "Joe"}, {"name": "required|length:5..10", "age": "required"}
+        )
+
+        self.assertEqual(
+            validate.all(),
+            {
+                "name": ["The name length must be between 5 and 10."],
+                "age": ["The age field is required."],
+            },
+        )
+
+
+SHARED_RULES = (
+    required(["name", "password"]),
+    strong(["password"], length=8, uppercase=1, special=1, numbers=1),
+    isnt(equals(["name"], "admin")),
+)
+
+
+class TestReentrantRules(unittest.TestCase):
+    def test_handle_returns_a_result_without_storing_errors(self):
+        rule = required(["user"])
+
+        result = rule.handle({})
+
+        self.assertIsInstance(result, RuleResult)
+        self.assertFalse(result)
+        self.assertEqual(result.errors, {"user": ["The user field is required."]})
+        self.assertTrue(rule.handle({"user": "Joe"}))
+        self.assertEqual(rule.errors, {})
+
+    def test_multi_check_rules_keep_no_state_between_runs(self):
+        rule = strong(["password"], length=8, uppercase=2, special=0, numbers=0)
+
+        self.assertEqual(
+            rule.handle({"password": "short"}).errors,
+            {
+                "password": [
+                    "The password field must be 8 characters in length",
+                    "The password field must have 2 uppercase letters",
+                ]
+            },
+        )
+        self.assertEqual(rule.handle({"password": "longenoughPW"}).errors, {})
+        self.assertEqual(
+            rule.handle({"password": "longenough"}).errors,
+            {"password": ["The password field must have 2 uppercase letters"]},
+        )
+
+    def test_isnt_does_not_negate_shared_rules(self):
+        rule = equals(["name"], "admin")
+
+        validate = Validator().validate({"name": "admin"}, isnt(rule), rule)
+
+        self.assertEqual(
+            validate.all(), {"name": ["The name must not be equal to admin."]}
+        )
+
+    def test_shared_rules_can_run_concurrently(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        schema = Validator().compile(*SHARED_RULES)
+        payloads = [
+            {"name": "user{}".format(i), "password": "Secret!1"}
+            if i % 2
+            else {"name": "admin", "password": "secret"}
+            for i in range(200)
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(schema.errors, payloads))
+
+        for i, errors in enumerate(results):
+            if i % 2:
+                self.assertEqual(errors, {})
+            else:
+                self.assertEqual(
+                    errors,
+                    {
+                        "password": [
+                            "The password field must be 8 characters in length",
+                            "The password field must have 1 uppercase letters",
+                            "The password field must have 1 special characters",
+                            "The password field must have 1 numbers",
+                        ],
+                        "name": ["The name must not be equal to admin."],
+                    },
+                )
+
+
+class TestBulkValidation(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {"name": "Joe", "age": 25},
+            {"name": "", "age": "old"},
+            {"name": "Bob", "age": 40},
+            {"age": 12},
+        ]
+
+    def test_validate_many_reports_every_row(self):
+        report = Validator().validate_many(
+            self.records, required(["name"]), {"age": "numeric"}
+        )
+
+        self.assertEqual(
+            report,
+            {
+                0: {},
+                1: {
+                    "name": ["The name field is required."],
+                    "age": ["The age must be a numeric."],
+                },
+                2: {},
+                3: {"name": ["The name field is required."]},
+            },
+        )
+
+    def test_validate_many_can_report_failing_rows_only(self):
+        report = Validator().validate_many(
+            iter(self.records), required(["name"]), failures_only=True
+        )
+
+        self.assertEqual(list(report), [1, 3])
+
+    def test_validate_many_tells_which_row_raised(self):
+        with self.assertRaises(ValueError) as e:
+            Validator().validate_many(self.records, required(["name"], raises=True))
+
+        self.assertEqual(e.exception.row, 1)
+        self.assertEqual(str(e.exception), "The name field is required.")
+
+    def test_iter_validate_yields_failing_rows(self):
+        failures = Validator().iter_validate(
+            iter(self.records), required(["name"]), {"age": "numeric"}
+        )
+
+        row, errors = next(failures)
+        self.assertEqual(row, 1)
+        self.assertIsInstance(errors, MessageBag)
+        self.assertEqual(errors.get("age"), ["The age must be a numeric."])
+        self.assertEqual([row for row, errors in failures], [3])
+
+    def test_iter_validate_is_lazy(self):
+        def records():
+            row = 0
+            while True:
+                yield {"age": row if row % 3 else "old"}
+                row += 1
+
+        failures = Validator().iter_validate(records(), numeric(["age"]))
+
+        self.assertEqual([next(failures)[0] for _ in range(3)], [0, 3, 6])
+
+
+class slow_lookup(BaseValidation):
+
+    io_bound = True
+
+    def passes(self, attribute, key, dictionary):
+        time.sleep(0.2)
+        return attribute != "bad"
+
+    def message(self, attribute):
+        return "The {} lookup failed.".format(attribute)
+
+
+class TestAsyncValidation(unittest.TestCase):
+    def run_async(self, coroutine):
+        return asyncio.get_event_loop().run_until_complete(coroutine)
+
+    def test_io_bound_rules(self):
+        self.assertTrue(active_domain(["email"]).io_bound)
+        self.assertFalse(strong(["password"]).io_bound)
+        self.assertTrue(strong(["password"], breach=True).io_bound)
+        self.assertTrue(isnt(active_domain(["email"])).io_bound)
+        self.assertTrue(when(exists("email")).then(active_domain("email")).io_bound)
+        self.assertFalse(required(["email"]).io_bound)
+
+    def test_io_bound_rules_run_concurrently(self):
+        start = time.time()
+        errors = self.run_async(
+            Validator().avalidate(
+                {"a": "bad", "b": "good", "c": "bad", "age": "old"},
+                slow_lookup(["a"]),
+                numeric(["age"]),
+                slow_lookup(["b"]),
+                slow_lookup(["c"]),
+                required(["a"]),
+            )
+        )
+
+        self.assertLess(time.time() - start, 0.5)
+        self.assertEqual(
+            errors.all(),
+            {
+                "a": ["The a lookup failed."],
+                "age": ["The age must be a numeric."],
+                "c": ["The c lookup failed."],
+            },
+        )
+        self.assertEqual(list(errors.all()), ["a", "age", "c"])
+
+    def test_keys_of_a_rule_run_concurrently(self):
+        dictionary = {"c": "bad", "a": "bad", "b": "good"}
+        start = time.time()
+        # the timeout is for each key, all three in a row would take 0.6s
+        errors = self.run_async(
+            Validator().avalidate(dictionary, slow_lookup(["c", "b", "a"]), timeout=0.4)
+        )
+
+        self.assertLess(time.time() - start, 0.4)
+        self.assertEqual(list(errors.all()), ["c", "a"])
+        self.assertEqual(
+            self.run_async(
+                Validator().avalidate(
+                    dictionary, slow_lookup(["b", "c", "a"]), stop_on_first_failure=True
+                )
+            ).all(),
+            {"c": ["The c lookup failed."]},
+        )
+
+    def test_matches_synchronous_validation(self):
+        rules = (required(["user", "email"]), {"age": "numeric|length:1..1"})
+        dictionary = {"user": "Joe", "age": 90}
+
+        self.assertEqual(
+            self.run_async(Validator().avalidate(dictionary, *rules)).all(),
+            Validator().validate(dictionary, *rules).all(),
+        )
+
+    def test_timeout(self):
+        with self.assertRaises(asyncio.TimeoutError) as e:
+            self.run_async(
+                Validator().avalidate(
+                    {"age": "old", "a": "good"},
+                    numeric(["age"]),
+                    slow_lookup(["a"]),
+                    timeout=0.05,
+                )
+            )
+
+        self.assertEqual(e.exception.errors, {"age": ["The age must be a numeric."]})
+
+    def test_raises_like_synchronous_validation(self):
+        with self.assertRaises(ValueError) as e:
+            self.run_async(
+                Validator().avalidate(
+                    {"a": "bad"},
+                    slow_lookup(["a"]),
+                    required(["name"], raises=True),
+                )
+            )
+
+        self.assertEqual(str(e.exception), "The name field is required.")
+        self.assertEqual(e.exception.errors, {"a": ["The a lookup failed."]})
+
+
+class TestFailFast(unittest.TestCase):
+    def test_bail_skips_fields_which_failed(self):
+        validate = Validator().validate(
+            {"name": "Joe"},
+            required(["name", "email"]),
+            email(["email"]),
+            length(["name"], min=5),
+            bail=True,
+        )
+
+        self.assertEqual(
+            validate.all(),
+            {
+                "email": ["The email field is required."],
+                "name": ["The name must be at least 5 characters."],
+            },
+        )
+
+    def test_bail_for_some_fields(self):
+        calls = []
+        validate = Validator().validate(
+            {"a": "bad", "b": "bad"},
+            counting(["a", "b"], calls),
+            counting(["a", "b"], calls),
+            bail=["a"],
+        )
+
+        self.assertEqual(calls, ["a", "b", "b"])
+        self.assertEqual(
+            validate.all(),
+            {"a": ["The a is bad."], "b": ["The b is bad.", "The b is bad."]},
+        )
+
+    def test_bail_for_a_single_field(self):
+        calls = []
+        rules = [counting(["age", "b"], calls), counting(["age", "b"], calls)]
+        for schema in (
+            Validator().compile(*rules, bail="age"),
+            CompiledSchema(rules, bail="age"),
+        ):
+            with self.subTest(schema=schema):
+                del calls[:]
+                self.assertEqual(schema.bail, frozenset(["age"]))
+                self.assertEqual(
+                    schema.errors({"age": "bad", "b": "good"}),
+                    {"age": ["The age is bad."]},
+                )
+                self.assertEqual(calls, ["age", "b", "b"])
+
+    def test_bail_in_dictionary_definitions(self):
+        validate = Validator().validate(
+            {"age": "old"},
+            {"email": "bail|required|email", "age": "numeric|length:1..2"},
+        )
+
+        self.assertEqual(
+            validate.all(),
+            {
+                "email": ["The email field is required."],
+                "age": [
+                    "The age must be a numeric.",
+                    "The age length must be between 1 and 2.",
+                ],
+            },
+        )
+
+    def test_bail_still_checks_conditions(self):
+        validate = Validator().validate(
+            {"country": "XX"},
+            is_in(["country"], ["FR", "US"]),
+            when(isnt(is_in(["country"], ["FR", "US"]))).then(required(["reason"])),
+            bail=True,
+        )
+
+        self.assertEqual(
+            validate.all(),
+            {
+                "country": ["The country must contain an element in ['FR', 'US']."],
+                "reason": ["The reason field is required."],
+            },
+        )
+
+    def test_stop_on_first_failure(self):
+        calls = []
+        validate = Validator().validate(
+            {"age": "old"},
+            required(["name", "email"]),
+            counting(["age"], calls),
+            stop_on_first_failure=True,
+        )
+
+        self.assertEqual(validate.all(), {"name": ["The name field is required."]})
+        self.assertEqual(calls, [])
+
+    def test_stop_on_first_failure_for_each(self):
+        validate = Validator().validate(
+            {"ids": [1, "a", "b"]},
+            each(numeric(["ids.*"])),
+            stop_on_first_failure=True,
+        )
+
+        self.assertEqual(validate.all(), {"ids.1": ["The ids.1 must be a numeric."]})
+
+    def test_validate_many_matches_row_by_row(self):
+        self.assert_matches_row_by_row()
+
+    def test_columnar_validate_many_matches_row_by_row(self):
+        pytest.importorskip("numpy")
+        self.assert_matches_row_by_row(columnar=True)
+
+    def assert_matches_row_by_row(self, **engine):
+        records = [{"age": "old"}, {"age": 25}, {}]
+        rules = (required(["age"]), numeric(["age"]), length(["age"], min=2))
+
+        for options in ({"bail": True}, {"stop_on_first_failure": True}):
+            with self.subTest(options=options):
+                expected = {
+                    row: Validator().validate(record, *rules, **options).all()
+                    for row, record in enumerate(records)
+                }
+                self.assertEqual(
+                    Validator().validate_many(records, *rules, **engine, **options),
+                    expected,
+                )
+
+    def test_async_bail_skips_lookups_of_failed_fields(self):
+        calls = []
+        validate = asyncio.get_event_loop().run_until_complete(
+            Validator().avalidate(
+                {"a": "bad", "b": "good"},
+                counting(["a", "b"], calls, io_bound=True),
+                counting(["a"], [], io_bound=False),
+                bail=True,
+            )
+        )
+
+        self.assertEqual(calls, ["b"])
+        self.assertEqual(validate.all(), {"a": ["The a is bad."]})
+
+    def test_async_stop_on_first_failure(self):
+        calls = []
+        validate = asyncio.get_event_loop().run_until_complete(
+            Validator().avalidate(
+                {"a": "good"},
+                counting(["a"], calls, io_bound=True),
+                required(["name"]),
+                stop_on_first_failure=True,
+            )
+        )
+
+        self.assertEqual(calls, [])
+        self.assertEqual(validate.all(), {"name": ["The name field is required."]})
+
+
+class TestCostOrdering(unittest.TestCase):
+    def test_rules_declare_a_cost(self):
+        self.assertEqual(required(["a"]).cost, 1)
+        self.assertEqual(email(["a"]).cost, 10)
+        self.assertEqual(date(["a"]).cost, 50)
+        self.assertEqual(active_domain(["a"]).cost, 1000)
+        self.assertEqual(strong(["a"]).cost, 10)
+        self.assertEqual(strong(["a"], breach=True).cost, 1000)
+        self.assertEqual(
+            when(exists(["a"])).then(email(["a"]), date(["b"])).cost, 61
+        )
+
+    def test_fail_fast_runs_cheap_rules_first(self):
+        calls = []
+        schema = Validator().compile(
+            counting(["email"], calls, cost=1000),
+            required(["email"]),
+            bail=True,
+            reorder=True,
+        )
+
+        self.assertEqual(schema.errors({}), {"email": ["The email field is required."]})
+        self.assertEqual(calls, [])
+        self.assertEqual(schema.errors({"email": "good"}), {})
+        self.assertEqual(calls, ["email"])
+
+    def test_reorder_is_opt_in(self):
+        rules = ({"code": "bail|required|email|length:3..5"},)
+
+        self.assertEqual(
+            Validator().validate({"code": "a"}, *rules).all(),
+            {"code": ["The code must be a valid email address."]},
+        )
+        self.assertEqual(
+            Validator().compile(*rules, reorder=True).errors({"code": "a"}),
+            {"code": ["The code length must be between 3 and 5."]},
+        )
+
+    def test_messages_keep_the_order_of_the_rules(self):
+        schema = Validator().compile(
+            email(["a"]), length(["a"], min=5), bail=["b"], reorder=True
+        )
+
+        self.assertEqual([type(rule) for rule in schema.order], [length, email])
+        self.assertEqual(
+            schema.errors({"a": "bad"}),
+            {
+                "a": [
+                    "The a must be a valid email address.",
+                    "The a must be at least 5 characters.",
+                ]
+            },
+        )
+
+    def test_only_rules_of_the_same_field_trade_places(self):
+        rules = (
+            email(["a"]),
+            email(["b"]),
+            required(["a"]),
+            required(["b"]),
+            required(["a", "b"]),
+            required(["a"]),
+            date(["a"]),
+        )
+        order = Validator().compile(*rules, bail=True, reorder=True).order
+
+        self.assertEqual([rules.index(rule) for rule in order], [2, 3, 0, 1, 4, 5, 6])
+
+    def test_stop_on_first_failure_keeps_the_order_of_the_fields(self):
+        calls = []
+        rules = (
+            counting(["a"], calls, cost=100),
+            required(["b"]),
+            required(["a"]),
+        )
+        schema = Validator().compile(*rules, stop_on_first_failure=True, reorder=True)
+
+        self.assertEqual(schema.order, rules)
+        self.assertEqual(schema.errors({"a": "bad"}), {"a": ["The a is bad."]})
+
+        schema = Validator().compile(
+            rules[0], rules[2], rules[1], stop_on_first_failure=True, reorder=True
+        )
+
+        self.assertEqual(schema.order, (rules[2], rules[0], rules[1]))
+        self.assertEqual(schema.errors({}), {"a": ["The a field is required."]})
+        self.assertEqual(calls, ["a"])
+
+    def test_order_is_kept_by_default(self):
+        rules = (email(["a"]), required(["a"]))
+
+        self.assertEqual(Validator().compile(*rules, bail=True).order, rules)
+        self.assertEqual(Validator().compile(*rules, reorder=True).order, rules)
+
+    def test_partial_errors_keep_the_order_of_the_rules(self):
+        schema = Validator().compile(
+            email(["a"]),
+            length(["a"], min=5),
+            numeric(["a"], raises=True),
+            bail=["b"],
+            reorder=True,
+        )
+
+        with self.assertRaises(ValueError) as e:
+            schema.errors({"a": "bad"})
+
+        self.assertEqual(
+            e.exception.errors, {"a": ["The a must be at least 5 characters."]}
+        )
+
+    def test_async_runs_cheap_rules_first(self):
+        calls = []
+        schema = Validator().compile(
+            counting(["a"], calls, cost=100),
+            required(["a"]),
+            is_in(["a"], ["good"]),
+            bail=True,
+            reorder=True,
+        )
+        validate = asyncio.get_event_loop().run_until_complete(
+            schema.avalidate({"a": "bad"})
+        )
+
+        self.assertEqual(calls, [])
+        self.assertEqual(
+            validate.all(), {"a": ["The a must contain an element in ['good']."]}
+        )